@@ -0,0 +1,10 @@
+"""
+Lab 2.
+"""
+
+import os
+
+if os.environ.get("LAB2_INSTRUMENT"):
+    from lab_2_spellcheck.instrumentation import start_from_environment
+
+    start_from_environment()
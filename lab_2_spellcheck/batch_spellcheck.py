@@ -0,0 +1,186 @@
+"""
+Spellchecking of document batches in a pool of worker processes.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+from typing import Literal
+
+from lab_1_keywords_tfidf.main import (
+    check_list,
+    check_positive_int,
+    clean_and_tokenize,
+    remove_stop_words,
+)
+from lab_2_spellcheck.main import find_out_of_vocab_words
+from lab_2_spellcheck.vocabulary_indexes import VocabularyIndexes
+
+Method = Literal[
+    "jaccard", "frequency-based", "levenshtein", "jaro-winkler", "weighted-levenshtein"
+]
+
+_WORKER_STATE: dict[str, tuple[VocabularyIndexes, Method, list[str] | None]] = {}
+
+
+def spellcheck_documents(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+    documents: list[str],
+    indexes: VocabularyIndexes,
+    method: Method,
+    alphabet: list[str] | None = None,
+    stop_words: list[str] | None = None,
+    processes: int | None = None,
+) -> tuple[list[dict[str, str]], dict[str, float]] | None:
+    """
+    Find corrections of out-of-vocabulary words in every document of a batch.
+
+    Documents are tokenized with clean_and_tokenize, out-of-vocabulary words are
+    found with find_out_of_vocab_words and deduplicated across the batch, so each
+    unique word is corrected once. Corrections are spread over worker processes
+    in chunks. Indexes are built in the parent process before the pool starts:
+    forked workers inherit them without copying, other start methods receive
+    them once per worker through the pool initializer.
+
+    Args:
+        documents (list[str]): Texts to check
+        indexes (VocabularyIndexes): Vocabulary with its lookup structures
+        method (Method): Method to use for comparison
+        alphabet (list[str] | None): The alphabet with letters
+        stop_words (list[str] | None): Words removed before the check
+        processes (int | None): Number of worker processes, None for the CPU count
+
+    Returns:
+        tuple[list[dict[str, str]], dict[str, float]] | None: Corrections of
+            out-of-vocabulary words for every document and throughput statistics.
+
+    In case of corrupt input arguments or empty vocabulary, None is returned.
+    """
+    if (
+        not isinstance(indexes, VocabularyIndexes)
+        or not (alphabet is None or check_list(alphabet, str, True))
+        or not (processes is None or check_positive_int(processes))
+    ):
+        return None
+    start = perf_counter()
+    found = _find_documents_out_of_vocab_words(documents, indexes.vocabulary, stop_words)
+    if found is None:
+        return None
+    documents_oov, tokens_count = found
+    unique_words = sorted({word for out_of_vocab in documents_oov for word in out_of_vocab})
+    corrections = _correct_words(unique_words, (indexes, method, alphabet), processes)
+    seconds = perf_counter() - start
+    statistics = {
+        "documents": float(len(documents)),
+        "tokens": float(tokens_count),
+        "out_of_vocab_words": float(sum(len(out_of_vocab) for out_of_vocab in documents_oov)),
+        "unique_out_of_vocab_words": float(len(unique_words)),
+        "seconds": seconds,
+        "documents_per_second": len(documents) / seconds if seconds else 0.0,
+        "words_per_second": len(unique_words) / seconds if seconds else 0.0,
+    }
+    return [
+        {word: correction for word in out_of_vocab if (correction := corrections[word]) is not None}
+        for out_of_vocab in documents_oov
+    ], statistics
+
+
+def _find_documents_out_of_vocab_words(
+    documents: list[str], vocabulary: dict[str, float], stop_words: list[str] | None
+) -> tuple[list[list[str]], int] | None:
+    """
+    Tokenize documents and find their out-of-vocabulary words.
+
+    Args:
+        documents (list[str]): Texts to check
+        vocabulary (dict[str, float]): Dictionary with words and their relative frequencies
+        stop_words (list[str] | None): Words removed before the check
+
+    Returns:
+        tuple[list[list[str]], int] | None: Out-of-vocabulary words of every document
+            and the total number of tokens.
+
+    In case of corrupt input arguments or empty vocabulary, None is returned.
+    """
+    if (
+        not check_list(documents, str, True)
+        or not vocabulary
+        or not (stop_words is None or check_list(stop_words, str, True))
+    ):
+        return None
+    documents_oov = []
+    tokens_count = 0
+    for document in documents:
+        tokens = clean_and_tokenize(document)
+        if tokens is not None and stop_words:
+            tokens = remove_stop_words(tokens, stop_words)
+        if tokens is None:
+            return None
+        tokens_count += len(tokens)
+        out_of_vocab = find_out_of_vocab_words(tokens, vocabulary) if tokens else []
+        if out_of_vocab is None:
+            return None
+        documents_oov.append(out_of_vocab)
+    return documents_oov, tokens_count
+
+
+def _correct_words(
+    words: list[str],
+    state: tuple[VocabularyIndexes, Method, list[str] | None],
+    processes: int | None,
+) -> dict[str, str | None]:
+    """
+    Correct unique words inline or in a process pool.
+
+    Args:
+        words (list[str]): Unique out-of-vocabulary words
+        state (tuple[VocabularyIndexes, Method, list[str] | None]): Indexes,
+            method and alphabet shared by all workers
+        processes (int | None): Number of worker processes, None for the CPU count
+
+    Returns:
+        dict[str, str | None]: Words and their corrections
+    """
+    workers = min(processes or multiprocessing.cpu_count(), len(words))
+    if workers <= 1:
+        _initialize_worker(state)
+        try:
+            return dict(zip(words, _correct_chunk(words)))
+        finally:
+            _WORKER_STATE.clear()
+    state[0].build(state[1])
+    start_method = "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+    context = multiprocessing.get_context(start_method)
+    chunk_size = -(-len(words) // (workers * 4))
+    chunks = [words[index : index + chunk_size] for index in range(0, len(words), chunk_size)]
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=context, initializer=_initialize_worker, initargs=(state,)
+    ) as executor:
+        corrected = [
+            correction for chunk in executor.map(_correct_chunk, chunks) for correction in chunk
+        ]
+    return dict(zip(words, corrected))
+
+
+def _initialize_worker(state: tuple[VocabularyIndexes, Method, list[str] | None]) -> None:
+    """
+    Attach a worker process to the shared indexes.
+
+    Args:
+        state (tuple[VocabularyIndexes, Method, list[str] | None]): Indexes,
+            method and alphabet shared by all workers
+    """
+    _WORKER_STATE["state"] = state
+
+
+def _correct_chunk(words: list[str]) -> list[str | None]:
+    """
+    Correct a chunk of words against the indexes of the worker.
+
+    Args:
+        words (list[str]): Words to correct
+
+    Returns:
+        list[str | None]: Corrections in the order of the words
+    """
+    indexes, method, alphabet = _WORKER_STATE["state"]
+    return [indexes.find_correct_word(word, method, alphabet) for word in words]
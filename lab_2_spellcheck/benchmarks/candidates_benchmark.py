@@ -0,0 +1,138 @@
+"""
+Latency and peak memory of candidate generation on long Cyrillic words.
+"""
+
+# pylint:disable=duplicate-code
+import random
+import tracemalloc
+from time import perf_counter
+from typing import Callable
+
+from lab_2_spellcheck.benchmarks.common import ALPHABET_RU, load_vocabulary, SEED
+from lab_2_spellcheck.main import (
+    add_letter,
+    calculate_frequency_distance,
+    delete_letter,
+    propose_candidates,
+    replace_letter,
+    swap_adjacent,
+)
+
+LENGTHS = (8, 12, 16, 20)
+QUERIES = 3
+
+
+def generate_sorted_candidates(word: str, alphabet: list[str]) -> list[str]:
+    """
+    Generate single edits by concatenating the sorted lists of the edit functions.
+
+    Args:
+        word (str): The input word
+        alphabet (list[str]): Alphabet for candidates creation
+
+    Returns:
+        list[str]: Sorted unique candidates
+    """
+    return sorted(
+        set(
+            delete_letter(word)
+            + add_letter(word, alphabet)
+            + replace_letter(word, alphabet)
+            + swap_adjacent(word)
+        )
+    )
+
+
+def propose_sorted_candidates(word: str, alphabet: list[str]) -> tuple[str, ...]:
+    """
+    Propose candidates sorting every intermediate list, as before the set fast path.
+
+    Args:
+        word (str): The input word
+        alphabet (list[str]): Alphabet for candidates creation
+
+    Returns:
+        tuple[str, ...]: Sorted unique candidates of up to two edits
+    """
+    first_level = generate_sorted_candidates(word, alphabet)
+    candidates = set(first_level)
+    for candidate in first_level:
+        candidates.update(generate_sorted_candidates(candidate, alphabet))
+    return tuple(sorted(candidates))
+
+
+def frequency_distance_sorted(
+    word: str, frequencies: dict[str, float], alphabet: list[str]
+) -> dict[str, float]:
+    """
+    Calculate frequency distance over all sorted candidates.
+
+    Args:
+        word (str): The input word
+        frequencies (dict[str, float]): Words and their relative frequencies
+        alphabet (list[str]): Alphabet for candidates creation
+
+    Returns:
+        dict[str, float]: Vocabulary words and their frequency distances
+    """
+    distances = {token: 1.0 for token in frequencies}
+    for candidate in propose_sorted_candidates(word, alphabet):
+        if candidate in frequencies:
+            distances[candidate] = frequencies[candidate]
+    return distances
+
+
+def measure(function: Callable[[str], object], words: list[str]) -> tuple[float, float]:
+    """
+    Measure the mean latency and the peak traced memory of calls.
+
+    Args:
+        function (Callable[[str], object]): Function of a word
+        words (list[str]): Words to pass
+
+    Returns:
+        tuple[float, float]: Seconds per call and peak megabytes
+    """
+    start = perf_counter()
+    for word in words:
+        function(word)
+    latency = (perf_counter() - start) / len(words)
+    tracemalloc.start()
+    function(words[0])
+    peak = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    return latency, peak
+
+
+def main() -> None:
+    """
+    Launches the benchmark.
+    """
+    vocabulary = load_vocabulary()
+    generator = random.Random(SEED)
+    print("length          function   candidates  sorted ms  set ms speedup  sorted MB  set MB")
+    for length in LENGTHS:
+        words = ["".join(generator.choices(ALPHABET_RU, k=length)) for _ in range(QUERIES)]
+        count = len(propose_candidates(words[0], ALPHABET_RU) or ())
+        runs = {
+            "propose": (
+                lambda word: propose_sorted_candidates(word, ALPHABET_RU),
+                lambda word: propose_candidates(word, ALPHABET_RU),
+            ),
+            "frequency": (
+                lambda word: frequency_distance_sorted(word, vocabulary, ALPHABET_RU),
+                lambda word: calculate_frequency_distance(word, vocabulary, ALPHABET_RU),
+            ),
+        }
+        for name, (baseline, fast) in runs.items():
+            sorted_latency, sorted_peak = measure(baseline, words)
+            set_latency, set_peak = measure(fast, words)
+            print(
+                f"{length:6} {name:>17} {count:12} {sorted_latency * 1000:10.1f} "
+                f"{set_latency * 1000:7.1f} {sorted_latency / set_latency:6.1f}x "
+                f"{sorted_peak:10.1f} {set_peak:7.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
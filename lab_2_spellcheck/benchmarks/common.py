@@ -0,0 +1,130 @@
+"""
+Shared data loading for spellcheck benchmarks.
+"""
+
+import random
+from pathlib import Path
+
+from lab_1_keywords_tfidf.main import clean_and_tokenize, remove_stop_words
+from lab_2_spellcheck.main import build_vocabulary, find_out_of_vocab_words
+
+ASSETS_PATH = Path(__file__).parent.parent / "assets"
+ALPHABET_RU = list("абвгдеёжзийклмнопрстуфхцчшщъыьэюя")
+SEED = 42
+
+
+def load_tokens(file_name: str) -> list[str]:
+    """
+    Read an asset and split it into tokens without stop words.
+
+    Args:
+        file_name (str): Name of the file in the assets folder
+
+    Returns:
+        list[str]: Clean tokens of the text
+    """
+    with open(ASSETS_PATH / "stop_words.txt", "r", encoding="utf-8") as file:
+        stop_words = file.read().split("\n")
+    with open(ASSETS_PATH / file_name, "r", encoding="utf-8") as file:
+        tokens = clean_and_tokenize(file.read()) or []
+    return remove_stop_words(tokens, stop_words) or []
+
+
+def load_vocabulary() -> dict[str, float]:
+    """
+    Build the vocabulary of the first chapter of «The Master and Margarita».
+
+    Returns:
+        dict[str, float]: Words and their relative frequencies
+    """
+    return build_vocabulary(load_tokens("Master_and_Margarita_chapter1.txt")) or {}
+
+
+def load_misspelled_words(vocabulary: dict[str, float]) -> list[str]:
+    """
+    Collect unique out-of-vocabulary words of the incorrect sentences.
+
+    Args:
+        vocabulary (dict[str, float]): Words and their relative frequencies
+
+    Returns:
+        list[str]: Out-of-vocabulary words in order of appearance
+    """
+    misspelled: dict[str, None] = {}
+    for index in range(1, 6):
+        tokens = load_tokens(f"incorrect_sentence_{index}.txt")
+        misspelled.update(dict.fromkeys(find_out_of_vocab_words(tokens, vocabulary) or []))
+    return list(misspelled)
+
+
+def build_sized_vocabulary(size: int, seed: int = SEED) -> dict[str, float]:
+    """
+    Build a vocabulary of the given size from the assets and synthetic words.
+
+    Smaller vocabularies keep the most frequent words of the chapter. Larger ones
+    are padded with words sampled from a letter bigram model of the chapter, each
+    synthetic word occurring once, so the assets keep the highest frequencies.
+
+    Args:
+        size (int): Number of words in the vocabulary
+        seed (int): Seed of the word sampler
+
+    Returns:
+        dict[str, float]: Words and their relative frequencies
+    """
+    tokens = load_tokens("Master_and_Margarita_chapter1.txt")
+    vocabulary = build_vocabulary(tokens) or {}
+    if size <= len(vocabulary):
+        kept = set(sorted(vocabulary, key=lambda word: (-vocabulary[word], word))[:size])
+        return build_vocabulary([token for token in tokens if token in kept]) or {}
+    transitions: dict[str, list[str]] = {}
+    for token in vocabulary:
+        for letter, following in zip("^" + token, token + "$"):
+            transitions.setdefault(letter, []).append(following)
+    generator = random.Random(seed)
+    synthetic: set[str] = set()
+    while len(vocabulary) + len(synthetic) < size:
+        word = ""
+        letter = generator.choice(transitions["^"])
+        while letter != "$" and len(word) < 20:
+            word += letter
+            letter = generator.choice(transitions[letter])
+        if len(word) > 1 and word not in vocabulary:
+            synthetic.add(word)
+    return build_vocabulary(tokens + sorted(synthetic)) or {}
+
+
+def make_misspellings(
+    vocabulary: dict[str, float], lengths: tuple[int, int], count: int, seed: int = SEED
+) -> list[tuple[str, str]]:
+    """
+    Misspell random vocabulary words of the given length with one random edit.
+
+    Args:
+        vocabulary (dict[str, float]): Words and their relative frequencies
+        lengths (tuple[int, int]): Smallest and largest length of misspelled words
+        count (int): Number of misspellings
+        seed (int): Seed of the edit sampler
+
+    Returns:
+        list[tuple[str, str]]: Out-of-vocabulary words with the words they were made of,
+            empty if there are no words of the length
+    """
+    words = sorted(word for word in vocabulary if lengths[0] <= len(word) <= lengths[1])
+    generator = random.Random(seed)
+    misspelled: list[tuple[str, str]] = []
+    while words and len(misspelled) < count:
+        word = generator.choice(words)
+        index = generator.randrange(len(word))
+        letter = generator.choice(ALPHABET_RU)
+        edit = generator.choice(
+            (
+                word[:index] + word[index + 1 :],
+                word[:index] + letter + word[index:],
+                word[:index] + letter + word[index + 1 :],
+                word[:index] + word[index + 1 : index + 2] + word[index] + word[index + 2 :],
+            )
+        )
+        if edit not in vocabulary:
+            misspelled.append((edit, word))
+    return misspelled
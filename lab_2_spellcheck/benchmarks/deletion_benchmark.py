@@ -0,0 +1,70 @@
+"""
+Latency of two-edit frequency-based correction: full expansion, trie and deletion index.
+"""
+
+# pylint:disable=duplicate-code
+from time import perf_counter
+
+from lab_2_spellcheck.benchmarks.common import (
+    ALPHABET_RU,
+    build_sized_vocabulary,
+    load_vocabulary,
+    make_misspellings,
+)
+from lab_2_spellcheck.deletion_index import DeletionIndex
+from lab_2_spellcheck.main import calculate_frequency_distance
+from lab_2_spellcheck.vocabulary_trie import VocabularyTrie
+
+SIZES = (10_000, 50_000)
+LENGTHS = ((4, 7), (8, 12))
+QUERIES = 10
+
+
+def run(vocabulary: dict[str, float], lengths: tuple[int, int]) -> None:
+    """
+    Compare the latency of the three ways and check that their results match.
+
+    Args:
+        vocabulary (dict[str, float]): Words and their relative frequencies
+        lengths (tuple[int, int]): Smallest and largest length of misspelled words
+    """
+    queries = [wrong for wrong, _ in make_misspellings(vocabulary, lengths, QUERIES)]
+    start = perf_counter()
+    expected = [calculate_frequency_distance(wrong, vocabulary, ALPHABET_RU) for wrong in queries]
+    full_latency = (perf_counter() - start) / len(queries)
+
+    start = perf_counter()
+    trie = VocabularyTrie(vocabulary)
+    trie_build = perf_counter() - start
+    start = perf_counter()
+    trie_result = [trie.calculate_frequency_distance(wrong, ALPHABET_RU) for wrong in queries]
+    trie_latency = (perf_counter() - start) / len(queries)
+
+    start = perf_counter()
+    index = DeletionIndex(vocabulary)
+    index_build = perf_counter() - start
+    start = perf_counter()
+    index_result = [index.calculate_frequency_distance(wrong, ALPHABET_RU) for wrong in queries]
+    index_latency = (perf_counter() - start) / len(queries)
+
+    print(
+        f"{len(vocabulary):7} {lengths[0]:>3}-{lengths[1]:<3} {full_latency * 1000:9.1f} "
+        f"{trie_latency * 1000:8.2f} {index_latency * 1000:8.2f} "
+        f"{full_latency / index_latency:8.1f}x {trie_build:7.2f} {index_build:7.2f} "
+        f"{len(index):9} {trie_result == expected and index_result == expected!s:>6}"
+    )
+
+
+def main() -> None:
+    """
+    Launches the benchmark.
+    """
+    print("  words lengths   full ms  trie ms index ms  speedup  trie s index s      keys  equal")
+    vocabularies = [load_vocabulary()] + [build_sized_vocabulary(size) for size in SIZES]
+    for vocabulary in vocabularies:
+        for lengths in LENGTHS:
+            run(vocabulary, lengths)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Share of vocabulary pruned by Jaro-Winkler bounds and the resulting speedup.
+"""
+
+# pylint:disable=duplicate-code
+from time import perf_counter
+
+from lab_2_spellcheck.benchmarks.common import (
+    build_sized_vocabulary,
+    load_misspelled_words,
+    load_vocabulary,
+    make_misspellings,
+)
+from lab_2_spellcheck.jaro_winkler_index import JaroWinklerIndex
+from lab_2_spellcheck.jaro_winkler_query import JaroWinklerQuery
+from lab_2_spellcheck.main import choose_closest_word
+
+SIZES = (1_000, 10_000, 100_000)
+QUERIES = 30
+
+
+def run(name: str, vocabulary: dict[str, float], misspelled: list[str]) -> None:
+    """
+    Compare the pruned search with the exhaustive scan on the queries.
+
+    Args:
+        name (str): Description of the vocabulary
+        vocabulary (dict[str, float]): Words and their relative frequencies
+        misspelled (list[str]): Words to correct
+    """
+    start = perf_counter()
+    expected = [
+        choose_closest_word(word, JaroWinklerQuery(word).calculate_distances(vocabulary) or {})
+        for word in misspelled
+    ]
+    exhaustive_latency = (perf_counter() - start) / len(misspelled)
+
+    index = JaroWinklerIndex(vocabulary)
+    start = perf_counter()
+    actual = [index.find_nearest_word(word) for word in misspelled]
+    pruned_latency = (perf_counter() - start) / len(misspelled)
+
+    assert actual == expected, "Pruned search differs from the exhaustive scan"
+    statistics = index.statistics
+    print(
+        f"{name:>10} {len(vocabulary):8} {len(misspelled):7}  "
+        f"{statistics['pruned'] / (statistics['pruned'] + statistics['evaluated']):7.2%} "
+        f"{statistics['evaluated'] / statistics['searches']:10.1f}  "
+        f"{exhaustive_latency * 1000:9.3f} {pruned_latency * 1000:9.3f}  "
+        f"{exhaustive_latency / pruned_latency:6.1f}x"
+    )
+
+
+def main() -> None:
+    """
+    Launches the benchmark.
+    """
+    print("vocabulary     words queries   pruned  evaluated  exhaustive   pruned  speedup")
+    print("                                          per query   ms/query  ms/query")
+    vocabulary = load_vocabulary()
+    run("chapter", vocabulary, load_misspelled_words(vocabulary))
+    for size in SIZES:
+        vocabulary = build_sized_vocabulary(size)
+        misspelled = [word for word, _ in make_misspellings(vocabulary, (3, 12), QUERIES)]
+        run("synthetic", vocabulary, misspelled)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Latency of the vectorized Levenshtein engine against the per-pair calculate_distance.
+"""
+
+# pylint:disable=duplicate-code
+from time import perf_counter
+
+from lab_2_spellcheck.benchmarks.common import load_misspelled_words, load_vocabulary
+from lab_2_spellcheck.main import calculate_distance
+from lab_2_spellcheck.vectorized_levenshtein import VectorizedLevenshtein
+
+
+def main() -> None:
+    """
+    Launches the benchmark.
+    """
+    vocabulary = load_vocabulary()
+    misspelled = load_misspelled_words(vocabulary)
+
+    start = perf_counter()
+    expected = [calculate_distance(word, vocabulary, "levenshtein") for word in misspelled]
+    baseline_latency = (perf_counter() - start) / len(misspelled)
+
+    start = perf_counter()
+    engine = VectorizedLevenshtein(vocabulary)
+    build_time = perf_counter() - start
+
+    start = perf_counter()
+    actual = [engine.calculate_distances(word) for word in misspelled]
+    vectorized_latency = (perf_counter() - start) / len(misspelled)
+
+    assert actual == expected, "Vectorized distances differ from calculate_distance"
+    print(f"vocabulary: {len(vocabulary)} words, queries: {len(misspelled)}")
+    print(f"calculate_distance:    {baseline_latency * 1000:8.3f} ms/query")
+    print(f"VectorizedLevenshtein: {vectorized_latency * 1000:8.3f} ms/query")
+    print(f"index build:           {build_time * 1000:8.3f} ms")
+    print(f"speedup:               {baseline_latency / vectorized_latency:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Recall and latency of MinHash LSH retrieval against the exhaustive Jaccard scan.
+"""
+
+# pylint:disable=duplicate-code
+from time import perf_counter
+
+from lab_2_spellcheck.benchmarks.common import load_misspelled_words, load_vocabulary
+from lab_2_spellcheck.main import calculate_distance, choose_closest_word
+from lab_2_spellcheck.minhash_index import MinHashIndex
+
+CONFIGURATIONS = ((4, 4, 1), (8, 3, 1), (8, 2, 1), (16, 2, 1), (16, 1, 2), (32, 1, 2))
+
+
+def main() -> None:
+    """
+    Launches the benchmark.
+    """
+    vocabulary = load_vocabulary()
+    misspelled = load_misspelled_words(vocabulary)
+
+    start = perf_counter()
+    expected = {
+        word: choose_closest_word(word, calculate_distance(word, vocabulary, "jaccard") or {})
+        for word in misspelled
+    }
+    exhaustive_latency = (perf_counter() - start) / len(misspelled)
+    print(
+        f"vocabulary: {len(vocabulary)} words, queries: {len(misspelled)}, "
+        f"exhaustive: {exhaustive_latency * 1000:.3f} ms/query"
+    )
+
+    print("bands rows ngram  recall  candidates  ms/query  speedup")
+    for bands, rows, ngram_size in CONFIGURATIONS:
+        index = MinHashIndex(vocabulary, bands=bands, rows=rows, ngram_size=ngram_size)
+        found = 0
+        candidates_count = 0
+        start = perf_counter()
+        for word in misspelled:
+            distances = index.calculate_distances(word) or {}
+            candidates_count += len(distances)
+            found += choose_closest_word(word, distances) == expected[word]
+        latency = (perf_counter() - start) / len(misspelled)
+        print(
+            f"{bands:5} {rows:4} {ngram_size:5}  {found / len(misspelled):6.2%}  "
+            f"{candidates_count / len(misspelled) / len(vocabulary):10.2%}  "
+            f"{latency * 1000:8.3f}  {exhaustive_latency / latency:7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Accuracy and latency of phonetic blocking against the full vocabulary scan.
+"""
+
+# pylint:disable=duplicate-code
+import json
+import random
+from pathlib import Path
+from time import perf_counter
+from typing import Literal
+
+from lab_2_spellcheck.benchmarks.common import (
+    build_sized_vocabulary,
+    load_vocabulary,
+    make_misspellings,
+    SEED,
+)
+from lab_2_spellcheck.main import find_correct_word
+from lab_2_spellcheck.phonetic_index import PhoneticIndex
+
+Method = Literal["jaccard", "frequency-based", "levenshtein", "jaro-winkler"]
+
+GOLD_PATH = Path(__file__).parent / "gold_corrections.json"
+METHODS: tuple[Method, ...] = ("levenshtein", "jaro-winkler")
+QUERIES = 30
+SOUND_ALIKE = (
+    ("о", "а"),
+    ("е", "и"),
+    ("я", "е"),
+    ("д", "т"),
+    ("з", "с"),
+    ("б", "п"),
+    ("г", "к"),
+    ("в", "ф"),
+    ("ж", "ш"),
+)
+
+
+def make_phonetic_misspellings(
+    vocabulary: dict[str, float], count: int, seed: int = SEED
+) -> list[tuple[str, str]]:
+    """
+    Misspell vocabulary words by confusing letters that sound alike or doubling consonants.
+
+    Args:
+        vocabulary (dict[str, float]): Words and their relative frequencies
+        count (int): Number of misspellings
+        seed (int): Seed of the edit sampler
+
+    Returns:
+        list[tuple[str, str]]: Out-of-vocabulary words with the words they were made of
+    """
+    words = sorted(word for word in vocabulary if len(word) > 3)
+    generator = random.Random(seed)
+    misspelled: list[tuple[str, str]] = []
+    for _ in range(count * 100):
+        if len(misspelled) == count:
+            break
+        word = generator.choice(words)
+        index = generator.randrange(len(word))
+        pairs = [pair for pair in SOUND_ALIKE if word[index] in pair]
+        if pairs:
+            first, second = generator.choice(pairs)
+            edit = word[:index] + (second if word[index] == first else first) + word[index + 1 :]
+        else:
+            edit = word[: index + 1] + word[index:]
+        if edit not in vocabulary:
+            misspelled.append((edit, word))
+    return misspelled
+
+
+def calculate_accuracy(found: list[str | None], corrections: list[str]) -> float:
+    """
+    Calculate the share of correctly fixed words.
+
+    Args:
+        found (list[str | None]): Words chosen by the spellchecker
+        corrections (list[str]): Expected corrections
+
+    Returns:
+        float: Share of matches
+    """
+    return sum(word == correction for word, correction in zip(found, corrections)) / len(
+        corrections
+    )
+
+
+def run(
+    name: str, vocabulary: dict[str, float], queries: list[tuple[str, str]], method: Method
+) -> None:
+    """
+    Compare corrections of the phonetic index with the full scan.
+
+    Args:
+        name (str): Description of the queries
+        vocabulary (dict[str, float]): Words and their relative frequencies
+        queries (list[tuple[str, str]]): Misspelled words with their corrections
+        method (str): Method of find_correct_word
+    """
+    start = perf_counter()
+    full = [find_correct_word(wrong, vocabulary, method) for wrong, _ in queries]
+    full_latency = (perf_counter() - start) / len(queries)
+
+    index = PhoneticIndex(vocabulary)
+    start = perf_counter()
+    blocked = [index.find_correct_word(wrong, method) for wrong, _ in queries]
+    blocked_latency = (perf_counter() - start) / len(queries)
+
+    statistics = index.statistics
+    corrections = [right for _, right in queries]
+    print(
+        f"{name:>10} {len(vocabulary):7} {method:>12} {len(queries):7}  "
+        f"{calculate_accuracy(full, corrections):7.1%} "
+        f"{calculate_accuracy(blocked, corrections):8.1%}  "
+        f"{statistics['scored'] / statistics['searches'] / len(vocabulary):7.2%} "
+        f"{statistics['fallbacks']:9}  "
+        f"{full_latency * 1000:8.3f} {blocked_latency * 1000:8.3f} "
+        f"{full_latency / blocked_latency:7.1f}x"
+    )
+
+
+def main() -> None:
+    """
+    Launches the benchmark.
+    """
+    print(
+        "   queries   words       method queries     full  blocked   scored fallbacks"
+        "      full  blocked speedup"
+    )
+    print(
+        "                                         accuracy accuracy    share          "
+        "  ms/query ms/query"
+    )
+    vocabulary = load_vocabulary()
+    with open(GOLD_PATH, "r", encoding="utf-8") as file:
+        gold = list(json.load(file).items())
+    for size in (len(vocabulary), 10_000):
+        if size != len(vocabulary):
+            vocabulary = build_sized_vocabulary(size)
+        query_sets = {
+            "gold": gold,
+            "phonetic": make_phonetic_misspellings(vocabulary, QUERIES),
+            "random": make_misspellings(vocabulary, (4, 12), QUERIES),
+        }
+        for method in METHODS:
+            for name, queries in query_sets.items():
+                run(name, vocabulary, queries, method)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+Latency, memory and accuracy of find_correct_word across methods and vocabulary sizes.
+
+Results are written to a JSON file; pass the file of a previous run with
+``--compare`` to print the relative change of median latencies.
+"""
+
+# pylint:disable=duplicate-code
+import json
+import math
+import platform
+import tracemalloc
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Literal
+
+from lab_2_spellcheck.benchmarks.common import (
+    ALPHABET_RU,
+    build_sized_vocabulary,
+    load_misspelled_words,
+    make_misspellings,
+    SEED,
+)
+from lab_2_spellcheck.main import find_correct_word
+
+Method = Literal["jaccard", "frequency-based", "levenshtein", "jaro-winkler"]
+
+METHODS: tuple[Method, ...] = ("jaccard", "frequency-based", "levenshtein", "jaro-winkler")
+WORD_LENGTHS = ((3, 5), (6, 8), (9, 12))
+GOLD_PATH = Path(__file__).parent / "gold_corrections.json"
+
+
+def percentile(values: list[float], rank: float) -> float:
+    """
+    Get the nearest-rank percentile of the values.
+
+    Args:
+        values (list[float]): Measured values
+        rank (float): Percentile in range (0, 100]
+
+    Returns:
+        float: Smallest value not exceeded by rank percent of the values
+    """
+    ordered = sorted(values)
+    return ordered[max(math.ceil(rank / 100 * len(ordered)) - 1, 0)]
+
+
+def measure(
+    method: Method, vocabulary: dict[str, float], queries: list[tuple[str, str]]
+) -> dict[str, Any]:
+    """
+    Time find_correct_word on the queries and measure its peak memory.
+
+    Args:
+        method (Method): Method to use for comparison
+        vocabulary (dict[str, float]): Words and their relative frequencies
+        queries (list[tuple[str, str]]): Misspelled words with expected corrections
+
+    Returns:
+        dict[str, Any]: Latency percentiles in milliseconds, peak memory and accuracy
+    """
+    latencies = []
+    correct = 0
+    for wrong_word, expected in queries:
+        start = perf_counter()
+        correction = find_correct_word(wrong_word, vocabulary, method, ALPHABET_RU)
+        latencies.append((perf_counter() - start) * 1000)
+        correct += correction == expected
+    tracemalloc.start()
+    find_correct_word(queries[0][0], vocabulary, method, ALPHABET_RU)
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        "queries": len(queries),
+        "p50_ms": percentile(latencies, 50),
+        "p90_ms": percentile(latencies, 90),
+        "p99_ms": percentile(latencies, 99),
+        "mean_ms": sum(latencies) / len(latencies),
+        "peak_memory_kib": peak_memory / 1024,
+        "accuracy": correct / len(queries),
+    }
+
+
+def evaluate_gold(method: Method, vocabulary: dict[str, float]) -> dict[str, Any]:
+    """
+    Measure accuracy on the misspellings of the incorrect sentences.
+
+    Args:
+        method (Method): Method to use for comparison
+        vocabulary (dict[str, float]): Words and their relative frequencies
+
+    Returns:
+        dict[str, Any]: Accuracy on all gold corrections and on those present in the vocabulary
+    """
+    with open(GOLD_PATH, "r", encoding="utf-8") as file:
+        gold = json.load(file)
+    misspelled = [word for word in load_misspelled_words(vocabulary) if word in gold]
+    corrections = {
+        word: find_correct_word(word, vocabulary, method, ALPHABET_RU) for word in misspelled
+    }
+    reachable = [word for word in misspelled if gold[word] in vocabulary]
+    return {
+        "words": len(misspelled),
+        "accuracy": sum(corrections[word] == gold[word] for word in misspelled)
+        / max(len(misspelled), 1),
+        "reachable_words": len(reachable),
+        "reachable_accuracy": sum(corrections[word] == gold[word] for word in reachable)
+        / max(len(reachable), 1),
+    }
+
+
+def compare(previous: dict[str, Any], current: dict[str, Any]) -> None:
+    """
+    Print the change of median latencies between two runs.
+
+    Args:
+        previous (dict[str, Any]): Results of the earlier run
+        current (dict[str, Any]): Results of this run
+    """
+    baseline = {
+        (row["method"], row["vocabulary_size"], row["word_length"]): row["p50_ms"]
+        for row in previous["latency"]
+    }
+    print("method           size     length   p50 before  p50 after  change")
+    for row in current["latency"]:
+        key = (row["method"], row["vocabulary_size"], row["word_length"])
+        if key in baseline:
+            print(
+                f"{key[0]:15} {key[1]:8} {key[2]:>7} {baseline[key]:11.3f} {row['p50_ms']:10.3f} "
+                f"{row['p50_ms'] / baseline[key] - 1:+7.1%}"
+            )
+
+
+def main() -> None:
+    """
+    Launches the benchmark.
+    """
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--methods", nargs="+", choices=METHODS, default=list(METHODS))
+    parser.add_argument("--queries", type=int, default=10)
+    parser.add_argument("--output", type=Path, default=Path("spellcheck_benchmark.json"))
+    parser.add_argument("--compare", type=Path)
+    arguments = parser.parse_args()
+
+    results: dict[str, Any] = {
+        "environment": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "seed": SEED,
+        },
+        "latency": [],
+        "gold": [],
+    }
+    for size in arguments.sizes:
+        vocabulary = build_sized_vocabulary(size)
+        for lengths in WORD_LENGTHS:
+            queries = make_misspellings(vocabulary, lengths, arguments.queries)
+            for method in arguments.methods if queries else ():
+                row = {
+                    "method": method,
+                    "vocabulary_size": len(vocabulary),
+                    "word_length": f"{lengths[0]}-{lengths[1]}",
+                    **measure(method, vocabulary, queries),
+                }
+                print(
+                    f"{method:15} {row['vocabulary_size']:8} {row['word_length']:>6}  "
+                    f"p50 {row['p50_ms']:9.3f} ms  p99 {row['p99_ms']:9.3f} ms  "
+                    f"peak {row['peak_memory_kib']:9.1f} KiB  accuracy {row['accuracy']:6.1%}"
+                )
+                results["latency"].append(row)
+        for method in arguments.methods:
+            results["gold"].append(
+                {
+                    "method": method,
+                    "vocabulary_size": len(vocabulary),
+                    **evaluate_gold(method, vocabulary),
+                }
+            )
+
+    with open(arguments.output, "w", encoding="utf-8") as file:
+        json.dump(results, file, ensure_ascii=False, indent=4)
+    print(f"results saved to {arguments.output}")
+    if arguments.compare is not None:
+        with open(arguments.compare, "r", encoding="utf-8") as file:
+            compare(json.load(file), results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Accuracy and latency of the weighted distance against the unit-cost Levenshtein distance.
+"""
+
+# pylint:disable=duplicate-code
+import json
+import random
+from pathlib import Path
+from time import perf_counter
+from typing import Literal
+
+from lab_2_spellcheck.benchmarks.common import (
+    ALPHABET_RU,
+    build_sized_vocabulary,
+    load_vocabulary,
+    make_misspellings,
+    SEED,
+)
+from lab_2_spellcheck.main import find_correct_word
+from lab_2_spellcheck.weighted_distance import ADJACENT_KEY_COST, KEYBOARD_COSTS
+
+Method = Literal["levenshtein", "weighted-levenshtein"]
+
+GOLD_PATH = Path(__file__).parent / "gold_corrections.json"
+METHODS: tuple[Method, ...] = ("levenshtein", "weighted-levenshtein")
+QUERIES = 30
+
+
+def make_keyboard_misspellings(
+    vocabulary: dict[str, float], count: int, seed: int = SEED
+) -> list[tuple[str, str]]:
+    """
+    Misspell vocabulary words by hitting a neighbouring key or typing ``е`` for ``ё``.
+
+    Args:
+        vocabulary (dict[str, float]): Words and their relative frequencies
+        count (int): Number of misspellings
+        seed (int): Seed of the edit sampler
+
+    Returns:
+        list[tuple[str, str]]: Out-of-vocabulary words with the words they were made of
+    """
+    neighbours = {
+        letter: [
+            other
+            for other in ALPHABET_RU
+            if KEYBOARD_COSTS.get_substitution_cost(letter, other) == ADJACENT_KEY_COST
+        ]
+        for letter in ALPHABET_RU
+    }
+    neighbours["ё"] = ["е"]
+    words = sorted(word for word in vocabulary if len(word) > 3)
+    generator = random.Random(seed)
+    misspelled: list[tuple[str, str]] = []
+    for _ in range(count * 100):
+        if len(misspelled) == count:
+            break
+        word = generator.choice(words)
+        index = generator.randrange(len(word))
+        if not neighbours.get(word[index]):
+            continue
+        edit = word[:index] + generator.choice(neighbours[word[index]]) + word[index + 1 :]
+        if edit not in vocabulary:
+            misspelled.append((edit, word))
+    return misspelled
+
+
+def run(
+    name: str, vocabulary: dict[str, float], queries: list[tuple[str, str]], method: Method
+) -> None:
+    """
+    Measure accuracy and latency of find_correct_word with the method.
+
+    Args:
+        name (str): Description of the queries
+        vocabulary (dict[str, float]): Words and their relative frequencies
+        queries (list[tuple[str, str]]): Misspelled words with their corrections
+        method (Method): Method of find_correct_word
+    """
+    start = perf_counter()
+    found = [find_correct_word(wrong, vocabulary, method) for wrong, _ in queries]
+    latency = (perf_counter() - start) / len(queries)
+    accuracy = sum(word == right for word, (_, right) in zip(found, queries)) / len(queries)
+    print(
+        f"{name:>9} {len(vocabulary):7} {method:>21} {len(queries):7} "
+        f"{accuracy:8.1%} {latency * 1000:9.2f}"
+    )
+
+
+def main() -> None:
+    """
+    Launches the benchmark.
+    """
+    print("  queries   words                method queries accuracy  ms/query")
+    vocabulary = load_vocabulary()
+    with open(GOLD_PATH, "r", encoding="utf-8") as file:
+        gold = list(json.load(file).items())
+    for size in (len(vocabulary), 10_000):
+        if size != len(vocabulary):
+            vocabulary = build_sized_vocabulary(size)
+        query_sets = {
+            "gold": gold,
+            "keyboard": make_keyboard_misspellings(vocabulary, QUERIES),
+            "random": make_misspellings(vocabulary, (4, 12), QUERIES),
+        }
+        for name, queries in query_sets.items():
+            for method in METHODS:
+                run(name, vocabulary, queries, method)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""
+Bloom filter prefilter for out of vocabulary word detection.
+"""
+
+import math
+from collections.abc import Mapping
+from hashlib import blake2b
+from pathlib import Path
+
+import numpy as np
+
+from lab_1_keywords_tfidf.main import check_float, check_list
+
+_MAGIC = b"L2BLOOM1"
+_HEADER_SIZE = len(_MAGIC) + 3 * 8
+
+
+class BloomFilter:
+    """
+    Bit array answering whether a word may belong to the vocabulary.
+
+    The number of bits ``m`` and of hash functions ``k`` are derived from the
+    number of words ``n`` and the target false positive rate ``p`` as
+    ``m = -n ln p / ln^2 2`` and ``k = m / n ln 2``. Bit positions come from two
+    halves of one blake2b digest combined by double hashing in ``uint64``
+    arithmetic, which is stable across processes, so the filter can be saved and
+    loaded. Positions of a whole batch of tokens are checked with NumPy. A token
+    missing from the filter is out of vocabulary for certain; only the rest is
+    checked against the vocabulary itself.
+    """
+
+    def __init__(
+        self, vocabulary: Mapping[str, float], false_positive_rate: float = 0.01, key: str = ""
+    ) -> None:
+        """
+        Initialize an instance of the BloomFilter.
+
+        Args:
+            vocabulary (Mapping[str, float]): Words and their relative frequencies
+            false_positive_rate (float): Target probability of a false positive
+            key (str): Version of the vocabulary stored with the filter
+        """
+        if not isinstance(vocabulary, Mapping) or not (
+            check_float(false_positive_rate) and 0 < false_positive_rate < 1
+        ):
+            vocabulary = {}
+            false_positive_rate = 0.01
+        count = max(1, len(vocabulary))
+        self._size = max(8, math.ceil(-count * math.log(false_positive_rate) / math.log(2) ** 2))
+        self._hash_count = max(1, round(self._size / count * math.log(2)))
+        self._bits = np.zeros(-(-self._size // 8), dtype=np.uint8)
+        self._key = key if isinstance(key, str) else ""
+        self._statistics = {"definite": 0, "verified": 0}
+        positions = self._get_positions(list(vocabulary)).ravel()
+        np.bitwise_or.at(
+            self._bits, positions >> 3, np.left_shift(1, positions & 7).astype(np.uint8)
+        )
+
+    def __contains__(self, word: object) -> bool:
+        """
+        Check if the word may be in the vocabulary.
+
+        Args:
+            word (object): Word to look up
+
+        Returns:
+            bool: False if the word is certainly not in the vocabulary
+        """
+        if not isinstance(word, str):
+            return False
+        return bool(self._check([word])[0])
+
+    @property
+    def key(self) -> str:
+        """
+        Get the version of the vocabulary the filter was built from.
+
+        Returns:
+            str: Key passed on construction
+        """
+        return self._key
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Get the size of the bit array.
+
+        Returns:
+            int: Number of bytes
+        """
+        return len(self._bits)
+
+    @property
+    def statistics(self) -> dict[str, int]:
+        """
+        Get lookup counters.
+
+        Returns:
+            dict[str, int]: Numbers of tokens rejected by the filter and of tokens
+                verified against the vocabulary
+        """
+        return dict(self._statistics)
+
+    def find_out_of_vocab_words(
+        self, tokens: list[str], vocabulary: Mapping[str, float]
+    ) -> list[str] | None:
+        """
+        Find words out of the vocabulary with the result of find_out_of_vocab_words.
+
+        Args:
+            tokens (list[str]): List of tokens
+            vocabulary (Mapping[str, float]): Vocabulary the filter was built from
+
+        Returns:
+            list[str] | None: List of incorrect words.
+
+        In case of corrupt input arguments or empty vocabulary, None is returned.
+        """
+        if not check_list(tokens, str, False) or not isinstance(vocabulary, Mapping):
+            return None
+        if not vocabulary:
+            return None
+        possible = self._check(tokens).tolist()
+        self._statistics["verified"] += sum(possible)
+        self._statistics["definite"] += len(tokens) - sum(possible)
+        return [
+            token
+            for token, is_possible in zip(tokens, possible)
+            if not is_possible or token not in vocabulary
+        ]
+
+    def save(self, path: str | Path) -> None:
+        """
+        Save the filter to a file.
+
+        Args:
+            path (str | Path): Path to the file
+        """
+        key = self._key.encode("utf-8")
+        with open(path, "wb") as file:
+            file.write(_MAGIC)
+            for value in (self._size, self._hash_count, len(key)):
+                file.write(value.to_bytes(8, "little"))
+            file.write(key)
+            file.write(self._bits.tobytes())
+
+    @classmethod
+    def load(cls, path: str | Path, key: str | None = None) -> "BloomFilter | None":
+        """
+        Load a filter saved with save.
+
+        Args:
+            path (str | Path): Path to the file
+            key (str | None): Expected version of the vocabulary, None to accept any
+
+        Returns:
+            BloomFilter | None: Loaded filter.
+
+        In case of a missing or corrupt file or a different key, None is returned.
+        """
+        try:
+            data = Path(path).read_bytes()
+        except OSError:
+            return None
+        if len(data) < _HEADER_SIZE or not data.startswith(_MAGIC):
+            return None
+        size, hash_count, key_size = (
+            int.from_bytes(data[start : start + 8], "little")
+            for start in range(len(_MAGIC), _HEADER_SIZE, 8)
+        )
+        bits = data[_HEADER_SIZE + key_size :]
+        if size == 0 or hash_count == 0 or len(bits) != -(-size // 8):
+            return None
+        try:
+            stored_key = data[_HEADER_SIZE : _HEADER_SIZE + key_size].decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+        if key is not None and stored_key != key:
+            return None
+        bloom_filter = cls({}, key=stored_key)
+        bloom_filter._size = size
+        bloom_filter._hash_count = hash_count
+        bloom_filter._bits = np.frombuffer(bits, dtype=np.uint8).copy()
+        return bloom_filter
+
+    def _get_positions(self, words: list[str]) -> np.ndarray:
+        """
+        Calculate bit positions of words.
+
+        Args:
+            words (list[str]): Words to hash
+
+        Returns:
+            np.ndarray: Matrix of positions with a row per word
+        """
+        digests = b"".join(blake2b(word.encode("utf-8"), digest_size=16).digest() for word in words)
+        hashes = np.frombuffer(digests, dtype="<u8").reshape(len(words), 2)
+        steps = np.arange(self._hash_count, dtype=np.uint64) * (hashes[:, 1:] | np.uint64(1))
+        return ((hashes[:, :1] + steps) % np.uint64(self._size)).astype(np.int64)
+
+    def _check(self, words: list[str]) -> np.ndarray:
+        """
+        Check bits of words.
+
+        Args:
+            words (list[str]): Words to look up
+
+        Returns:
+            np.ndarray: Mask of words that may be in the vocabulary
+        """
+        positions = self._get_positions(words)
+        mask: np.ndarray = np.all(self._bits[positions >> 3] >> (positions & 7) & 1, axis=1)
+        return mask
@@ -0,0 +1,173 @@
+"""
+Frozen vocabulary stored in flat arrays instead of a dictionary.
+"""
+
+from array import array
+from typing import Iterator, Literal, Mapping
+
+from lab_1_keywords_tfidf.main import check_dict, check_list
+from lab_2_spellcheck.main import _calculate_distances
+
+
+class CompactVocabulary(Mapping[str, float]):
+    """
+    Read-only mapping from words to relative frequencies.
+
+    Words are sorted by their UTF-8 encoding, which keeps the order of code
+    points, and concatenated into one bytes buffer with an array of offsets.
+    Frequencies are kept in an array of ``float32``. A lookup is a binary search
+    over the buffer, so membership and frequency checks take O(log V)
+    comparisons, and the whole vocabulary costs twelve bytes per word on top of
+    the text itself.
+    """
+
+    def __init__(self, vocabulary: dict[str, float]) -> None:
+        """
+        Initialize an instance of the CompactVocabulary.
+
+        Args:
+            vocabulary (dict[str, float]): Dictionary with words and their relative frequencies
+        """
+        if not check_dict(vocabulary, str, float, True):
+            vocabulary = {}
+        encoded = sorted(
+            (word.encode("utf-8"), frequency) for word, frequency in vocabulary.items()
+        )
+        self._data = b"".join(word for word, _ in encoded)
+        self._offsets = array("q", [0])
+        for word, _ in encoded:
+            self._offsets.append(self._offsets[-1] + len(word))
+        self._frequencies = array("f", (frequency for _, frequency in encoded))
+
+    def __getitem__(self, word: str) -> float:
+        """
+        Get the relative frequency of a word.
+
+        Args:
+            word (str): Vocabulary word
+
+        Returns:
+            float: Relative frequency of the word
+        """
+        position = self._find(word)
+        if position is None:
+            raise KeyError(word)
+        return float(self._frequencies[position])
+
+    def __contains__(self, word: object) -> bool:
+        """
+        Check if the word is in the vocabulary.
+
+        Args:
+            word (object): Word to look up
+
+        Returns:
+            bool: True if the word is in the vocabulary
+        """
+        return self._find(word) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterate over the words in sorted order.
+
+        Returns:
+            Iterator[str]: Vocabulary words
+        """
+        offsets = self._offsets
+        for start, end in zip(offsets, offsets[1:]):
+            yield self._data[start:end].decode("utf-8")
+
+    def __len__(self) -> int:
+        """
+        Get the number of words.
+
+        Returns:
+            int: Size of the vocabulary
+        """
+        return len(self._frequencies)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Get the size of the buffers.
+
+        Returns:
+            int: Number of bytes taken by the words, offsets and frequencies
+        """
+        return (
+            len(self._data)
+            + self._offsets.itemsize * len(self._offsets)
+            + self._frequencies.itemsize * len(self._frequencies)
+        )
+
+    def find_out_of_vocab_words(self, tokens: list[str]) -> list[str] | None:
+        """
+        Find words out of the vocabulary with the result of find_out_of_vocab_words.
+
+        Args:
+            tokens (list[str]): List of tokens
+
+        Returns:
+            list[str] | None: List of incorrect words.
+
+        In case of corrupt input arguments or empty vocabulary, None is returned.
+        """
+        if not check_list(tokens, str, False) or not self:
+            return None
+        return [token for token in tokens if token not in self]
+
+    def calculate_distance(
+        self,
+        first_token: str,
+        method: Literal[
+            "jaccard", "frequency-based", "levenshtein", "jaro-winkler", "weighted-levenshtein"
+        ],
+        alphabet: list[str] | None = None,
+    ) -> dict[str, float] | None:
+        """
+        Calculate distances to the vocabulary words with the result of calculate_distance.
+
+        The metrics are the ones of calculate_distance, the frequency-based
+        method looking candidates up with binary search.
+
+        Args:
+            first_token (str): First string to compare
+            method (str): Method to use for comparison
+            alphabet (list[str] | None): The alphabet with letters
+
+        Returns:
+            dict[str, float] | None: Vocabulary words and distances to them.
+
+        In case of corrupt input arguments, unsupported method or empty vocabulary,
+        None is returned.
+        """
+        if not isinstance(first_token, str) or not self:
+            return None
+        return _calculate_distances(first_token, self, method, alphabet)
+
+    def _find(self, word: object) -> int | None:
+        """
+        Find the position of a word with binary search.
+
+        Args:
+            word (object): Word to look up
+
+        Returns:
+            int | None: Position of the word, None if it is absent
+        """
+        if not isinstance(word, str):
+            return None
+        key = word.encode("utf-8")
+        data = self._data
+        offsets = self._offsets
+        low, high = 0, len(self._frequencies)
+        while low < high:
+            middle = (low + high) // 2
+            candidate = data[offsets[middle] : offsets[middle + 1]]
+            if candidate < key:
+                low = middle + 1
+            elif candidate > key:
+                high = middle
+            else:
+                return middle
+        return None
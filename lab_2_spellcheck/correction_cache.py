@@ -0,0 +1,404 @@
+"""
+Cache of find_correct_word results with vocabulary-versioned invalidation.
+"""
+
+import json
+import sqlite3
+from collections import OrderedDict
+from hashlib import blake2b
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Literal
+
+from lab_1_keywords_tfidf.main import check_dict, check_positive_int
+from lab_2_spellcheck.main import find_correct_word
+
+CacheKey = tuple[str, str, str, str]
+LOCK_TIMEOUT = 0.1
+
+
+def fingerprint_vocabulary(vocabulary: dict[str, float]) -> str | None:
+    """
+    Calculate a content hash of the vocabulary independent of the word order.
+
+    Args:
+        vocabulary (dict[str, float]): Dictionary with words and their relative frequencies
+
+    Returns:
+        str | None: Hexadecimal digest of the vocabulary.
+
+    In case of corrupt input arguments, None is returned.
+    """
+    if not check_dict(vocabulary, str, float, False):
+        return None
+    digest = blake2b(digest_size=16)
+    for word, frequency in sorted(vocabulary.items()):
+        digest.update(f"{word}\t{frequency!r}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class VersionedVocabulary(dict[str, float]):
+    """
+    Vocabulary dictionary counting its changes.
+
+    Every change in place increments the version, so CorrectionCache checks
+    that the vocabulary is unchanged in O(1) instead of comparing its contents.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Initialize an instance of the VersionedVocabulary.
+
+        Args:
+            *args (Any): Arguments of dict
+            **kwargs (Any): Keyword arguments of dict
+        """
+        super().__init__(*args, **kwargs)
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """
+        Get the number of changes in place.
+
+        Returns:
+            int: Version of the contents
+        """
+        return self._version
+
+    def __setitem__(self, word: str, frequency: float) -> None:
+        """
+        Set the frequency of a word.
+
+        Args:
+            word (str): Vocabulary word
+            frequency (float): Relative frequency of the word
+        """
+        super().__setitem__(word, frequency)
+        self._version += 1
+
+    def __delitem__(self, word: str) -> None:
+        """
+        Remove a word.
+
+        Args:
+            word (str): Vocabulary word
+        """
+        super().__delitem__(word)
+        self._version += 1
+
+    def __ior__(self, other: Any) -> "VersionedVocabulary":  # type: ignore[override, misc]
+        """
+        Update the vocabulary in place.
+
+        Args:
+            other (Any): Mapping or pairs of words and frequencies
+
+        Returns:
+            VersionedVocabulary: The vocabulary itself
+        """
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        """
+        Remove all words.
+        """
+        super().clear()
+        self._version += 1
+
+    def pop(self, *args: Any) -> Any:
+        """
+        Remove a word and get its frequency.
+
+        Args:
+            *args (Any): Arguments of dict.pop
+
+        Returns:
+            Any: Frequency of the word or the default
+        """
+        self._version += 1
+        return super().pop(*args)
+
+    def popitem(self) -> tuple[str, float]:
+        """
+        Remove the last inserted word.
+
+        Returns:
+            tuple[str, float]: Word and its frequency
+        """
+        self._version += 1
+        return super().popitem()
+
+    def setdefault(self, *args: Any) -> Any:
+        """
+        Insert a word if it is absent.
+
+        Args:
+            *args (Any): Arguments of dict.setdefault
+
+        Returns:
+            Any: Frequency of the word
+        """
+        self._version += 1
+        return super().setdefault(*args)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Update the vocabulary from mappings or pairs.
+
+        Args:
+            *args (Any): Arguments of dict.update
+            **kwargs (Any): Keyword arguments of dict.update
+        """
+        super().update(*args, **kwargs)
+        self._version += 1
+
+
+class CorrectionCache:
+    """
+    Bounded LRU cache for corrections with an optional sqlite backing store.
+
+    Entries are keyed on the fingerprint of the vocabulary, the wrong word,
+    the method and the alphabet. The cache holds the last seen vocabulary by
+    reference and fingerprints it again when another object comes or when
+    the object has changed in place. For a VersionedVocabulary the change is
+    seen from its version in O(1), a plain dictionary is compared with a copy
+    kept by the cache. Entries of other vocabularies stay in memory until
+    they are evicted and on the disk until prune is called, so switching
+    between vocabularies keeps their corrections. Every stored correction is
+    committed at once, and a disk store locked by another process is skipped
+    rather than waited for.
+    """
+
+    def __init__(self, max_size: int = 4096, path: str | Path | None = None) -> None:
+        """
+        Initialize an instance of the CorrectionCache.
+
+        Args:
+            max_size (int): Maximum number of entries kept in memory
+            path (str | Path | None): Path to the sqlite database, None for memory only
+        """
+        self._max_size = max_size if check_positive_int(max_size) else 4096
+        self._entries: OrderedDict[CacheKey, str] = OrderedDict()
+        self._vocabulary: dict[str, float] | None = None
+        self._contents: dict[str, float] | int = {}
+        self._fingerprint = ""
+        self._statistics = {
+            "hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "invalidations": 0,
+            "disk_errors": 0,
+        }
+        self._connection: sqlite3.Connection | None = None
+        if path is not None:
+            self._connection = sqlite3.connect(path, timeout=LOCK_TIMEOUT)
+            self._execute(
+                "CREATE TABLE IF NOT EXISTS corrections ("
+                "fingerprint TEXT, wrong_word TEXT, method TEXT, alphabet TEXT, "
+                "correction TEXT, PRIMARY KEY (fingerprint, wrong_word, method, alphabet))"
+            )
+
+    def __enter__(self) -> "CorrectionCache":
+        """
+        Enter the context of the cache.
+
+        Returns:
+            CorrectionCache: The cache itself
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """
+        Close the disk store.
+
+        Args:
+            exc_type (type[BaseException] | None): Type of the raised exception
+            exc_value (BaseException | None): Raised exception
+            traceback (TracebackType | None): Traceback of the raised exception
+        """
+        self.close()
+
+    @property
+    def statistics(self) -> dict[str, int]:
+        """
+        Get cache counters.
+
+        Returns:
+            dict[str, int]: Numbers of memory hits, disk hits, misses, evictions,
+                switches to another vocabulary version and failed disk operations
+        """
+        return dict(self._statistics)
+
+    def __len__(self) -> int:
+        """
+        Get the number of entries kept in memory.
+
+        Returns:
+            int: Number of entries
+        """
+        return len(self._entries)
+
+    def find_correct_word(
+        self,
+        wrong_word: str,
+        vocabulary: dict[str, float],
+        method: Literal[
+            "jaccard", "frequency-based", "levenshtein", "jaro-winkler", "weighted-levenshtein"
+        ],
+        alphabet: list[str] | None = None,
+    ) -> str | None:
+        """
+        Find the most similar word, reusing a cached correction when possible.
+
+        Args:
+            wrong_word (str): Word that might be misspelled
+            vocabulary (dict[str, float]): Dict of candidate words
+            method (str): Method to use for comparison
+            alphabet (list[str]): The alphabet with letters
+
+        Returns:
+            str | None: The result of find_correct_word for the same arguments.
+
+        In case of corrupt input arguments, None is returned.
+        """
+        if not isinstance(wrong_word, str) or not isinstance(method, str):
+            return None
+        if not isinstance(alphabet, (list, type(None))):
+            return None
+        if not self._is_current(vocabulary) and self.set_vocabulary(vocabulary) is None:
+            return None
+        key = (self._fingerprint, wrong_word, method, json.dumps(alphabet, ensure_ascii=False))
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self._statistics["hits"] += 1
+            return self._entries[key]
+        correction = self._load(key)
+        if correction is not None:
+            self._statistics["disk_hits"] += 1
+        else:
+            self._statistics["misses"] += 1
+            correction = find_correct_word(wrong_word, vocabulary, method, alphabet)
+            if correction is None:
+                return None
+            self._store(key, correction)
+        self._entries[key] = correction
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._statistics["evictions"] += 1
+        return correction
+
+    def set_vocabulary(self, vocabulary: dict[str, float]) -> str | None:
+        """
+        Switch the cache to the vocabulary.
+
+        Args:
+            vocabulary (dict[str, float]): Dictionary with words and their relative frequencies
+
+        Returns:
+            str | None: Fingerprint the corrections are stored under.
+
+        In case of corrupt input arguments, None is returned and the previous
+        vocabulary is kept.
+        """
+        fingerprint = fingerprint_vocabulary(vocabulary)
+        if fingerprint is None:
+            return None
+        if self._fingerprint and fingerprint != self._fingerprint:
+            self._statistics["invalidations"] += 1
+        self._vocabulary = vocabulary
+        self._contents = (
+            vocabulary.version if isinstance(vocabulary, VersionedVocabulary) else dict(vocabulary)
+        )
+        self._fingerprint = fingerprint
+        return fingerprint
+
+    def prune(self) -> None:
+        """
+        Delete corrections of other vocabularies from memory and from the disk.
+        """
+        for key in [key for key in self._entries if key[0] != self._fingerprint]:
+            del self._entries[key]
+        self._execute("DELETE FROM corrections WHERE fingerprint != ?", (self._fingerprint,))
+
+    def close(self) -> None:
+        """
+        Close the disk store.
+        """
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _is_current(self, vocabulary: dict[str, float]) -> bool:
+        """
+        Check if the vocabulary is the last seen one and has not changed since.
+
+        Args:
+            vocabulary (dict[str, float]): Vocabulary of the current call
+
+        Returns:
+            bool: True if the fingerprint of the vocabulary is still valid
+        """
+        if vocabulary is not self._vocabulary:
+            return False
+        if isinstance(vocabulary, VersionedVocabulary):
+            return vocabulary.version == self._contents
+        return vocabulary == self._contents
+
+    def _execute(self, query: str, parameters: tuple = ()) -> list[tuple]:
+        """
+        Run a query on the disk store and commit it.
+
+        Args:
+            query (str): SQL query
+            parameters (tuple): Parameters of the query
+
+        Returns:
+            list[tuple]: Fetched rows, empty if there is no store or it is locked
+        """
+        if self._connection is None:
+            return []
+        try:
+            rows = self._connection.execute(query, parameters).fetchall()
+            self._connection.commit()
+        except sqlite3.OperationalError:
+            self._connection.rollback()
+            self._statistics["disk_errors"] += 1
+            return []
+        return rows
+
+    def _load(self, key: CacheKey) -> str | None:
+        """
+        Look up a correction in the disk store.
+
+        Args:
+            key (CacheKey): Vocabulary version, wrong word, method and serialized alphabet
+
+        Returns:
+            str | None: Stored correction, None if it is absent
+        """
+        rows = self._execute(
+            "SELECT correction FROM corrections "
+            "WHERE fingerprint = ? AND wrong_word = ? AND method = ? AND alphabet = ?",
+            key,
+        )
+        return str(rows[0][0]) if rows else None
+
+    def _store(self, key: CacheKey, correction: str) -> None:
+        """
+        Save a correction to the disk store.
+
+        Args:
+            key (CacheKey): Vocabulary version, wrong word, method and serialized alphabet
+            correction (str): Found correction
+        """
+        self._execute(
+            "INSERT OR REPLACE INTO corrections VALUES (?, ?, ?, ?, ?)", (*key, correction)
+        )
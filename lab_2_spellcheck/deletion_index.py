@@ -0,0 +1,180 @@
+"""
+Deletion index of the vocabulary for two-edit frequency-based correction.
+"""
+
+from typing import Iterator
+
+from lab_1_keywords_tfidf.main import check_dict, check_list
+from lab_2_spellcheck.main import iterate_edits
+
+_MAX_EDITS = 2
+
+
+class DeletionIndex:
+    """
+    Vocabulary words keyed by the strings left after deleting up to two letters.
+
+    Two strings that are at most two propose_candidates edits apart share a
+    key of at most two deletions each: a deletion, insertion or replacement
+    costs one deletion on one or both sides and a swap costs one on each.
+    Candidates of a token are therefore collected by looking up its own
+    deletion variants instead of expanding (|alphabet| * length) ** 2 strings,
+    and each candidate is then verified exactly against the first-level edits
+    of the token, so the result is the one of propose_candidates restricted
+    to the vocabulary.
+    """
+
+    def __init__(self, vocabulary: dict[str, float]) -> None:
+        """
+        Initialize an instance of the DeletionIndex.
+
+        Args:
+            vocabulary (dict[str, float]): Dictionary with words and their relative frequencies
+        """
+        self._vocabulary: dict[str, float] = {}
+        self._deletions: dict[str, list[str]] = {}
+        if not check_dict(vocabulary, str, float, False):
+            return
+        self._vocabulary = dict(vocabulary)
+        for word in vocabulary:
+            for deletion in _delete_letters(word):
+                self._deletions.setdefault(deletion, []).append(word)
+
+    def __len__(self) -> int:
+        """
+        Get the number of deletion keys.
+
+        Returns:
+            int: Number of distinct strings stored in the index
+        """
+        return len(self._deletions)
+
+    def iterate_candidates(self, word: str, alphabet: list[str]) -> Iterator[str]:
+        """
+        Lazily generate vocabulary words reachable with propose_candidates edits.
+
+        Args:
+            word (str): The input incorrect word
+            alphabet (list[str]): Alphabet with single letters for candidates creation
+
+        Yields:
+            str: Unique vocabulary words in no particular order
+        """
+        if not isinstance(word, str) or not check_list(alphabet, str, True):
+            return
+        letters = set(alphabet)
+        first_level = set(iterate_edits(word, alphabet))
+        gaps: set[tuple[str, str]] | None = None
+        seen: set[str] = set()
+        for deletion in _delete_letters(word):
+            for candidate in self._deletions.get(deletion, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                if candidate in first_level:
+                    yield candidate
+                    continue
+                if gaps is None:
+                    gaps = {
+                        (edit[:index], edit[index + 1 :])
+                        for edit in first_level
+                        for index in range(len(edit))
+                    }
+                if _is_second_level(candidate, letters, first_level, gaps):
+                    yield candidate
+
+    def propose_candidates(self, word: str, alphabet: list[str]) -> tuple[str, ...] | None:
+        """
+        Generate vocabulary words among the candidates of propose_candidates.
+
+        Args:
+            word (str): The input incorrect word
+            alphabet (list[str]): Alphabet with single letters for candidates creation
+
+        Returns:
+            tuple[str, ...] | None: Sorted vocabulary words.
+
+        In case of corrupt input arguments or empty vocabulary, None is returned.
+        """
+        if not isinstance(word, str) or not check_list(alphabet, str, True) or not self._vocabulary:
+            return None
+        return tuple(sorted(self.iterate_candidates(word, alphabet)))
+
+    def calculate_frequency_distance(
+        self, word: str, alphabet: list[str]
+    ) -> dict[str, float] | None:
+        """
+        Calculate frequency distance with the result of calculate_frequency_distance.
+
+        Args:
+            word (str): The input incorrect word
+            alphabet (list[str]): Alphabet with single letters for candidates creation
+
+        Returns:
+            dict[str, float] | None: Vocabulary words and their frequency distances.
+
+        In case of corrupt input arguments or empty vocabulary, None is returned.
+        """
+        if not isinstance(word, str) or not check_list(alphabet, str, True) or not self._vocabulary:
+            return None
+        distances = dict.fromkeys(self._vocabulary, 1.0)
+        for candidate in self.iterate_candidates(word, alphabet):
+            distances[candidate] = self._vocabulary[candidate]
+        return distances
+
+
+def _delete_letters(word: str) -> set[str]:
+    """
+    Generate strings left after deleting up to two letters.
+
+    Args:
+        word (str): Word to shorten
+
+    Returns:
+        set[str]: The word and its deletion variants
+    """
+    variants = {word}
+    level = {word}
+    for _ in range(_MAX_EDITS):
+        level = {
+            variant[:index] + variant[index + 1 :]
+            for variant in level
+            for index in range(len(variant))
+        }
+        variants |= level
+    return variants
+
+
+def _is_second_level(
+    word: str, letters: set[str], first_level: set[str], gaps: set[tuple[str, str]]
+) -> bool:
+    """
+    Check if the word is a single edit of a first-level edit.
+
+    Sources of deletions and replacements differ from the word by one unknown
+    letter, so they are matched against the first-level edits with one letter
+    taken out instead of trying every letter.
+
+    Args:
+        word (str): Vocabulary word
+        letters (set[str]): Letters allowed for insertion and replacement
+        first_level (set[str]): Single edits of the token
+        gaps (set[tuple[str, str]]): Single edits of the token split around every letter
+
+    Returns:
+        bool: True if the word is obtained by a deletion, insertion, replacement
+            or swap of a first-level edit
+    """
+    for index in range(len(word) + 1):
+        if (word[:index], word[index:]) in gaps:
+            return True
+        if index == len(word) or word[index] not in letters:
+            continue
+        if word[:index] + word[index + 1 :] in first_level:
+            return True
+        if (word[:index], word[index + 1 :]) in gaps:
+            return True
+    return any(
+        word[:index] + word[index + 1] + word[index] + word[index + 2 :] in first_level
+        for index in range(len(word) - 1)
+    )
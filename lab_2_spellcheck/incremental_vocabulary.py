@@ -0,0 +1,224 @@
+"""
+Updatable vocabulary of raw counts with lookup structures kept in sync.
+"""
+
+from lab_1_keywords_tfidf.main import check_list
+from lab_2_spellcheck.jaccard_signatures import JaccardSignatures
+from lab_2_spellcheck.main import check_non_negative_int
+from lab_2_spellcheck.vocabulary_trie import VocabularyTrie
+
+
+class IncrementalVocabulary:
+    """
+    Vocabulary stored as token counts and their total.
+
+    Relative frequencies are ``count / total`` computed on access, so adding or
+    removing tokens touches only the counts of those tokens. Words that appear
+    or disappear are passed as deltas to the length buckets, the letter
+    signatures and the trie; nothing is rebuilt from scratch.
+    """
+
+    def __init__(self, tokens: list[str] | None = None) -> None:
+        """
+        Initialize an instance of the IncrementalVocabulary.
+
+        Args:
+            tokens (list[str] | None): Tokens of the initial text
+        """
+        self._counts: dict[str, int] = {}
+        self._total = 0
+        self._buckets: dict[int, set[str]] = {}
+        self._signatures = JaccardSignatures({})
+        self._trie = VocabularyTrie({})
+        self._vocabulary: dict[str, float] | None = None
+        if tokens is not None:
+            self.add_tokens(tokens)
+
+    def __contains__(self, word: object) -> bool:
+        """
+        Check if the word is in the vocabulary.
+
+        Args:
+            word (object): Word to look up
+
+        Returns:
+            bool: True if the word occurs at least once
+        """
+        return word in self._counts
+
+    def __len__(self) -> int:
+        """
+        Get the number of distinct words.
+
+        Returns:
+            int: Size of the vocabulary
+        """
+        return len(self._counts)
+
+    @property
+    def total(self) -> int:
+        """
+        Get the number of tokens.
+
+        Returns:
+            int: Sum of all counts
+        """
+        return self._total
+
+    @property
+    def vocabulary(self) -> dict[str, float]:
+        """
+        Get words and their relative frequencies.
+
+        The dictionary is built on the first access after a change and reused
+        until the next one.
+
+        Returns:
+            dict[str, float]: Vocabulary as built by build_vocabulary
+        """
+        if self._vocabulary is None:
+            self._vocabulary = {word: count / self._total for word, count in self._counts.items()}
+        return self._vocabulary
+
+    def add_tokens(self, tokens: list[str]) -> bool:
+        """
+        Count new tokens.
+
+        Args:
+            tokens (list[str]): Tokens to add
+
+        Returns:
+            bool: True if the tokens were added, False for corrupt input
+        """
+        if not check_list(tokens, str, False):
+            return False
+        for token in tokens:
+            if token not in self._counts:
+                self._counts[token] = 0
+                self._buckets.setdefault(len(token), set()).add(token)
+                self._signatures.add_word(token)
+                # frequencies are read from the counts, the trie only keeps words
+                self._trie.add_word(token, 0.0)
+            self._counts[token] += 1
+        self._total += len(tokens)
+        self._vocabulary = None
+        return True
+
+    def remove_tokens(self, tokens: list[str]) -> bool:
+        """
+        Uncount tokens, dropping words whose count reaches zero.
+
+        Args:
+            tokens (list[str]): Tokens to remove
+
+        Returns:
+            bool: True if the tokens were removed, False for corrupt input or tokens
+                occurring more often than they were counted, in which case
+                nothing changes
+        """
+        if not check_list(tokens, str, False):
+            return False
+        removed: dict[str, int] = {}
+        for token in tokens:
+            removed[token] = removed.get(token, 0) + 1
+        if any(count > self._counts.get(token, 0) for token, count in removed.items()):
+            return False
+        for token, count in removed.items():
+            self._counts[token] -= count
+            if self._counts[token]:
+                continue
+            del self._counts[token]
+            self._buckets[len(token)].discard(token)
+            self._signatures.remove_word(token)
+            self._trie.remove_word(token)
+        self._total -= len(tokens)
+        self._vocabulary = None
+        return True
+
+    def get_frequency(self, word: str) -> float | None:
+        """
+        Get the relative frequency of a word.
+
+        Args:
+            word (str): Word to look up
+
+        Returns:
+            float | None: Relative frequency, 0.0 for absent words.
+
+        In case of corrupt input arguments, None is returned.
+        """
+        if not isinstance(word, str):
+            return None
+        if not self._total:
+            return 0.0
+        return self._counts.get(word, 0) / self._total
+
+    def get_words_of_length(self, length: int) -> list[str]:
+        """
+        Get the length bucket of the vocabulary.
+
+        Args:
+            length (int): Length of words
+
+        Returns:
+            list[str]: Sorted words of the length
+        """
+        if not check_non_negative_int(length):
+            return []
+        return sorted(self._buckets.get(length, ()))
+
+    def calculate_jaccard_distances(self, token: str) -> dict[str, float] | None:
+        """
+        Calculate Jaccard distances with the result of calculate_distance.
+
+        Args:
+            token (str): Word to compare with the vocabulary
+
+        Returns:
+            dict[str, float] | None: Vocabulary words and Jaccard distances to them.
+
+        In case of corrupt input arguments or empty vocabulary, None is returned.
+        """
+        return self._signatures.calculate_distances(token)
+
+    def calculate_frequency_distance(
+        self, word: str, alphabet: list[str]
+    ) -> dict[str, float] | None:
+        """
+        Calculate frequency distance with the result of calculate_frequency_distance.
+
+        Args:
+            word (str): The input incorrect word
+            alphabet (list[str]): Alphabet with single letters for candidates creation
+
+        Returns:
+            dict[str, float] | None: Vocabulary words and their frequency distances.
+
+        In case of corrupt input arguments or empty vocabulary, None is returned.
+        """
+        candidates = self._trie.propose_candidates(word, alphabet)
+        if candidates is None:
+            return None
+        distances = dict.fromkeys(self._counts, 1.0)
+        for candidate in candidates:
+            distances[candidate] = self._counts[candidate] / self._total
+        return distances
+
+    def find_nearest_words(
+        self, token: str, k: int, max_distance: int | None = None
+    ) -> list[str] | None:
+        """
+        Find k words with the lowest Levenshtein distance to the token.
+
+        Args:
+            token (str): Word that might be misspelled
+            k (int): Number of words to find
+            max_distance (int | None): Largest allowed distance
+
+        Returns:
+            list[str] | None: Words ordered by distance, then by closeness in length,
+                then lexicographically.
+
+        In case of corrupt input arguments or empty vocabulary, None is returned.
+        """
+        return self._trie.find_nearest_words(token, k, max_distance)
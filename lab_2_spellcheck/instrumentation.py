@@ -0,0 +1,350 @@
+"""
+Opt-in call counters and timings of the spellcheck functions.
+"""
+
+import atexit
+import inspect
+import json
+import os
+import sys
+from functools import wraps
+from pathlib import Path
+from time import perf_counter
+from types import ModuleType, TracebackType
+from typing import Any, Callable
+
+from lab_2_spellcheck import main
+from lab_2_spellcheck.jaro_winkler_index import JaroWinklerIndex
+from lab_2_spellcheck.qgram_index import QGramIndex
+from lab_2_spellcheck.vectorized_levenshtein import VectorizedLevenshtein
+from lab_2_spellcheck.vocabulary_trie import VocabularyTrie
+
+ENVIRONMENT_VARIABLE = "LAB2_INSTRUMENT"
+
+Counter = Callable[[dict[str, Any], Any], dict[str, int]]
+
+
+def _count_cells(arguments: dict[str, Any], result: Any) -> dict[str, int]:
+    """
+    Count filled cells of a Levenshtein matrix.
+
+    Args:
+        arguments (dict[str, Any]): Arguments of fill_levenshtein_matrix
+        result (Any): Filled matrix
+
+    Returns:
+        dict[str, int]: Number of cells
+    """
+    if result is None:
+        return {}
+    return {"cells": len(arguments["token"]) * len(arguments["candidate"])}
+
+
+def _count_window_cells(arguments: dict[str, Any], result: Any) -> dict[str, int]:
+    """
+    Count letter pairs compared inside the Jaro matching windows.
+
+    Args:
+        arguments (dict[str, Any]): Arguments of get_matches
+        result (Any): Matches of both strings
+
+    Returns:
+        dict[str, int]: Number of compared pairs
+    """
+    if result is None:
+        return {}
+    window = 2 * arguments["match_distance"] + 1
+    return {"cells": len(arguments["token"]) * min(window, len(arguments["candidate"]))}
+
+
+def _count_candidates(_: dict[str, Any], result: Any) -> dict[str, int]:
+    """
+    Count generated candidates.
+
+    Args:
+        _ (dict[str, Any]): Arguments of the generator function
+        result (Any): Candidates
+
+    Returns:
+        dict[str, int]: Number of candidates
+    """
+    if result is None:
+        return {}
+    return {"candidates": len(result)}
+
+
+def _count_scanned(_: dict[str, Any], result: Any) -> dict[str, int]:
+    """
+    Count vocabulary words compared with the token.
+
+    Args:
+        _ (dict[str, Any]): Arguments of calculate_distance
+        result (Any): Distances to vocabulary words
+
+    Returns:
+        dict[str, int]: Number of scanned words
+    """
+    if result is None:
+        return {}
+    return {"scanned": len(result)}
+
+
+def _count_discarded(arguments: dict[str, Any], result: Any) -> dict[str, int]:
+    """
+    Count scored words left out of the top-k choice of the closest words.
+
+    Args:
+        arguments (dict[str, Any]): Arguments of choose_closest_words
+        result (Any): Chosen words
+
+    Returns:
+        dict[str, int]: Numbers of chosen and discarded words
+    """
+    if result is None:
+        return {}
+    return {"candidates": len(result), "discarded": len(arguments["distances"]) - len(result)}
+
+
+def _count_statistics(before: dict[str, int], after: dict[str, int]) -> dict[str, int]:
+    """
+    Count work of an index search from its statistics.
+
+    Args:
+        before (dict[str, int]): Statistics of the index before the search
+        after (dict[str, int]): Statistics of the index after the search
+
+    Returns:
+        dict[str, int]: Increments of the counters except the number of searches
+    """
+    return {key: value - before[key] for key, value in after.items() if key != "searches"}
+
+
+_COUNTERS: dict[str, Counter] = {
+    "fill_levenshtein_matrix": _count_cells,
+    "get_matches": _count_window_cells,
+    "generate_candidates": _count_candidates,
+    "propose_candidates": _count_candidates,
+    "_find_vocabulary_candidates": _count_candidates,
+    "calculate_distance": _count_scanned,
+    "choose_closest_words": _count_discarded,
+}
+
+_METHODS: tuple[tuple[type, str], ...] = (
+    (JaroWinklerIndex, "find_nearest_words"),
+    (QGramIndex, "find_nearest_words"),
+    (VocabularyTrie, "find_nearest_words"),
+    (VectorizedLevenshtein, "calculate_distance_array"),
+)
+
+
+class Instrumentation:
+    """
+    Counters of the functions of lab_2_spellcheck.main and of the index searches.
+
+    While started, every function of main is replaced by a wrapper in main and
+    in all loaded lab_2_spellcheck modules that imported it by name, and the
+    search methods of the Jaro-Winkler, q-gram and trie indexes and of the
+    vectorized Levenshtein engine are replaced in their classes. Wrappers
+    count calls, wall time including and excluding nested instrumented calls,
+    and work specific to the function: filled Levenshtein cells, compared
+    Jaro letter pairs, generated candidates, scanned vocabulary words and
+    words discarded by the top-k choice. Searches add the increments of the
+    statistics of their index: words evaluated and pruned by Jaro-Winkler
+    bounds, words checked and filtered by q-gram counts, visited trie nodes
+    and filled cells of the vectorized engine. Nothing is replaced while
+    stopped, so disabled instrumentation costs nothing. Generator functions
+    and check_* validators are not wrapped, the former since their work
+    happens after the call returns, the latter since their timing only adds
+    overhead. Counters are not thread-safe and do not include worker processes.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an instance of the Instrumentation.
+        """
+        self._replaced: list[tuple[ModuleType | type, str, Callable[..., Any]]] = []
+        self._functions: dict[str, dict[str, float]] = {}
+        self._stacks: dict[str, float] = {}
+        self._stack: list[str] = []
+        self._children: list[float] = []
+
+    def __enter__(self) -> "Instrumentation":
+        """
+        Start collecting counters.
+
+        Returns:
+            Instrumentation: The instrumentation itself
+        """
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """
+        Stop collecting counters.
+
+        Args:
+            exc_type (type[BaseException] | None): Type of the raised exception
+            exc_value (BaseException | None): Raised exception
+            traceback (TracebackType | None): Traceback of the raised exception
+        """
+        self.stop()
+
+    @property
+    def summary(self) -> dict[str, dict[str, float]]:
+        """
+        Get counters of every called function.
+
+        Returns:
+            dict[str, dict[str, float]]: Numbers of calls, seconds with and without
+                nested instrumented calls and work counters by function name
+        """
+        return {name: dict(counters) for name, counters in sorted(self._functions.items())}
+
+    def start(self) -> None:
+        """
+        Replace the functions of main and the index searches with wrappers unless
+        they are replaced.
+        """
+        if self._replaced:
+            return
+        for owner, name in _METHODS:
+            method = vars(owner)[name]
+            setattr(owner, name, self._wrap(f"{owner.__name__}.{name}", method, True))
+            self._replaced.append((owner, name, method))
+        wrappers = {}
+        for name, function in vars(main).items():
+            if (
+                inspect.isfunction(function)
+                and function.__module__ == main.__name__
+                and not inspect.isgeneratorfunction(function)
+                and not name.startswith("check_")
+            ):
+                wrappers[function] = self._wrap(name, function)
+        modules = [
+            module
+            for module_name, module in list(sys.modules.items())
+            if module_name.split(".")[0] == "lab_2_spellcheck"
+        ]
+        for module in modules:
+            for name, value in list(vars(module).items()):
+                if inspect.isfunction(value) and value in wrappers:
+                    setattr(module, name, wrappers[value])
+                    self._replaced.append((module, name, value))
+
+    def stop(self) -> None:
+        """
+        Restore the original functions.
+        """
+        for module, name, function in reversed(self._replaced):
+            setattr(module, name, function)
+        self._replaced = []
+
+    def reset(self) -> None:
+        """
+        Drop the collected counters.
+        """
+        self._functions = {}
+        self._stacks = {}
+
+    def export(self, path: str | Path) -> None:
+        """
+        Write collapsed stacks and the summary.
+
+        The stacks file has a line per call path with the microseconds spent in
+        its last function, as taken by flamegraph.pl and speedscope. The summary
+        is written next to it as JSON.
+
+        Args:
+            path (str | Path): Path of the collapsed stacks file
+        """
+        path = Path(path)
+        with open(path, "w", encoding="utf-8") as file:
+            for stack, seconds in sorted(self._stacks.items()):
+                file.write(f"{stack} {round(seconds * 1_000_000)}\n")
+        with open(path.with_name(f"{path.name}.json"), "w", encoding="utf-8") as file:
+            json.dump(self.summary, file, indent=2)
+
+    def _wrap(
+        self, name: str, function: Callable[..., Any], search: bool = False
+    ) -> Callable[..., Any]:
+        """
+        Build a counting wrapper of the function.
+
+        Args:
+            name (str): Name of the function
+            function (Callable[..., Any]): Function to wrap
+            search (bool): Whether the function is a method of an index with statistics
+
+        Returns:
+            Callable[..., Any]: Wrapper with the signature of the function
+        """
+        counter = _COUNTERS.get(name)
+        signature = inspect.signature(function)
+
+        @wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            before = args[0].statistics if search else None
+            self._stack.append(name)
+            self._children.append(0.0)
+            start = perf_counter()
+            try:
+                result = function(*args, **kwargs)
+            finally:
+                elapsed = perf_counter() - start
+                self._record(name, elapsed)
+            counters = self._functions[name]
+            work = {}
+            if before is not None:
+                work = _count_statistics(before, args[0].statistics)
+            elif counter is not None:
+                work = counter(signature.bind(*args, **kwargs).arguments, result)
+            for key, value in work.items():
+                counters[key] = counters.get(key, 0) + value
+            return result
+
+        return wrapper
+
+    def _record(self, name: str, elapsed: float) -> None:
+        """
+        Add a finished call to the counters and to its stack.
+
+        Args:
+            name (str): Name of the function
+            elapsed (float): Seconds spent in the call
+        """
+        own = elapsed - self._children.pop()
+        stack = ";".join(self._stack)
+        self._stack.pop()
+        if self._children:
+            self._children[-1] += elapsed
+        self._stacks[stack] = self._stacks.get(stack, 0.0) + own
+        counters = self._functions.setdefault(
+            name, {"calls": 0, "seconds": 0.0, "own_seconds": 0.0}
+        )
+        counters["calls"] += 1
+        counters["seconds"] += elapsed
+        counters["own_seconds"] += own
+
+
+def start_from_environment() -> Instrumentation | None:
+    """
+    Start instrumentation if the environment variable names an output file.
+
+    The collapsed stacks and the summary are exported to that file when the
+    interpreter exits.
+
+    Returns:
+        Instrumentation | None: Started instrumentation, None if the variable is unset
+    """
+    path = os.environ.get(ENVIRONMENT_VARIABLE)
+    if not path:
+        return None
+    instrumentation = Instrumentation()
+    instrumentation.start()
+    atexit.register(instrumentation.export, path)
+    return instrumentation
@@ -0,0 +1,117 @@
+"""
+Bitmask character signatures for batch Jaccard distance calculation.
+"""
+
+from lab_1_keywords_tfidf.main import check_dict
+
+
+class JaccardSignatures:
+    """
+    Vocabulary words encoded as integer bitmasks of their letters.
+
+    Every letter seen in the vocabulary is assigned its own bit, so the
+    character set of a word becomes a single integer. Jaccard distance
+    between two words is then computed with bitwise operations:
+    ``1 - popcount(a & b) / popcount(a | b)``.
+    """
+
+    def __init__(self, vocabulary: dict[str, float]) -> None:
+        """
+        Initialize an instance of the JaccardSignatures.
+
+        Args:
+            vocabulary (dict[str, float]): Dictionary with words and their relative frequencies
+        """
+        self._letter_bits: dict[str, int] = {}
+        self._signatures: dict[str, int] = {}
+        if not check_dict(vocabulary, str, float, False):
+            return
+        letters = sorted({letter for word in vocabulary for letter in word})
+        self._letter_bits = {letter: 1 << index for index, letter in enumerate(letters)}
+        self._signatures = {word: self.encode(word) for word in vocabulary}
+
+    @property
+    def signatures(self) -> dict[str, int]:
+        """
+        Get bitmask signatures of vocabulary words.
+
+        Returns:
+            dict[str, int]: Words and bitmasks of their letters
+        """
+        return self._signatures
+
+    def add_word(self, word: str) -> None:
+        """
+        Add the signature of a word, assigning new bits to unseen letters.
+
+        Signatures of other words do not change, because new bits are placed
+        above the existing ones.
+
+        Args:
+            word (str): Word to add
+        """
+        if not isinstance(word, str):
+            return
+        for letter in word:
+            if letter not in self._letter_bits:
+                self._letter_bits[letter] = 1 << len(self._letter_bits)
+        self._signatures[word] = self.encode(word)
+
+    def remove_word(self, word: str) -> None:
+        """
+        Remove the signature of a word.
+
+        Args:
+            word (str): Word to remove
+        """
+        self._signatures.pop(word, None)
+
+    def encode(self, word: str) -> int:
+        """
+        Encode the set of letters of a word as a bitmask.
+
+        Letters that are absent in the vocabulary get bits above the known ones,
+        so they never intersect with vocabulary signatures but still extend the union.
+
+        Args:
+            word (str): Word to encode
+
+        Returns:
+            int: Bitmask of word letters
+        """
+        mask = 0
+        unknown_bit = 1 << len(self._letter_bits)
+        unknown_letters: dict[str, int] = {}
+        for letter in word:
+            bit = self._letter_bits.get(letter)
+            if bit is None:
+                if letter not in unknown_letters:
+                    unknown_letters[letter] = unknown_bit
+                    unknown_bit <<= 1
+                bit = unknown_letters[letter]
+            mask |= bit
+        return mask
+
+    def calculate_distances(self, token: str) -> dict[str, float] | None:
+        """
+        Calculate Jaccard distance between the token and every vocabulary word.
+
+        Args:
+            token (str): Word to compare with the vocabulary
+
+        Returns:
+            dict[str, float] | None: Vocabulary words and Jaccard distances to them.
+
+        In case of corrupt input arguments or empty vocabulary, None is returned.
+        """
+        if not isinstance(token, str) or not self._signatures:
+            return None
+        token_mask = self.encode(token)
+        distances = {}
+        for word, word_mask in self._signatures.items():
+            union = (token_mask | word_mask).bit_count()
+            if not union:
+                distances[word] = 1.0
+                continue
+            distances[word] = 1 - (token_mask & word_mask).bit_count() / union
+        return distances
@@ -0,0 +1,177 @@
+"""
+Jaro-Winkler nearest word search pruned by bounds from letter histograms.
+"""
+
+from bisect import insort
+
+import numpy as np
+
+from lab_1_keywords_tfidf.main import check_dict, check_float, check_positive_int
+from lab_2_spellcheck.jaro_winkler_query import JaroWinklerQuery
+
+_PREFIX_SIZE = 4
+_TOLERANCE = 1e-9
+
+
+class JaroWinklerIndex:
+    """
+    Vocabulary with letter histograms for bounded Jaro-Winkler search.
+
+    The number of Jaro matches never exceeds the overlap of the letter multisets
+    of two words, and transpositions only lower the similarity, so
+    ``(overlap / len(token) + overlap / len(word) + 1) / 3`` bounds the Jaro
+    similarity from above. Together with the exact Winkler prefix this gives a
+    lower bound of the Jaro-Winkler distance. Histograms and prefixes of all
+    words are stored as NumPy arrays, so the bounds of the whole vocabulary are
+    calculated with a few array operations. Words are visited in order of their
+    bounds and the search stops as soon as a bound cannot beat the current
+    k-th best distance, so the full distance is calculated only for the survivors.
+    """
+
+    def __init__(self, vocabulary: dict[str, float], prefix_scaling: float = 0.1) -> None:
+        """
+        Initialize an instance of the JaroWinklerIndex.
+
+        Args:
+            vocabulary (dict[str, float]): Dictionary with words and their relative frequencies
+            prefix_scaling (float): Scaling factor for the prefix boost
+        """
+        self._prefix_scaling = prefix_scaling
+        self._words: list[str] = []
+        self._columns: dict[str, int] = {}
+        self._counts = np.zeros((0, 0), dtype=np.uint16)
+        self._lengths = np.zeros(0, dtype=np.int64)
+        self._prefixes = np.zeros((0, _PREFIX_SIZE), dtype=np.uint32)
+        self._statistics = {"searches": 0, "evaluated": 0, "pruned": 0}
+        if not check_dict(vocabulary, str, float, False) or not isinstance(prefix_scaling, float):
+            return
+        self._words = list(vocabulary)
+        self._columns = {
+            letter: column
+            for column, letter in enumerate(
+                sorted({letter for word in vocabulary for letter in word})
+            )
+        }
+        self._counts = np.zeros((len(self._columns), len(self._words)), dtype=np.uint16)
+        self._prefixes = np.zeros((len(self._words), _PREFIX_SIZE), dtype=np.uint32)
+        for position, word in enumerate(self._words):
+            for letter in word:
+                self._counts[self._columns[letter], position] += 1
+            self._prefixes[position, : len(word[:_PREFIX_SIZE])] = [
+                ord(letter) for letter in word[:_PREFIX_SIZE]
+            ]
+        self._lengths = np.array([len(word) for word in self._words], dtype=np.int64)
+
+    @property
+    def statistics(self) -> dict[str, int]:
+        """
+        Get search counters.
+
+        Returns:
+            dict[str, int]: Numbers of searches, words with calculated distances
+                and words skipped by their bounds
+        """
+        return dict(self._statistics)
+
+    def calculate_bounds(self, token: str) -> dict[str, float] | None:
+        """
+        Calculate lower bounds of Jaro-Winkler distances to every vocabulary word.
+
+        Args:
+            token (str): Word to compare with the vocabulary
+
+        Returns:
+            dict[str, float] | None: Vocabulary words and bounds of distances to them.
+
+        In case of corrupt input arguments or empty vocabulary, None is returned.
+        """
+        bounds = self._calculate_bound_array(token)
+        if bounds is None:
+            return None
+        return dict(zip(self._words, bounds.tolist()))
+
+    def find_nearest_words(self, token: str, k: int, max_distance: float = 1.0) -> list[str] | None:
+        """
+        Find k vocabulary words with the lowest Jaro-Winkler distance to the token.
+
+        Args:
+            token (str): Word that might be misspelled
+            k (int): Number of words to find
+            max_distance (float): Largest allowed distance, one minus the similarity threshold
+
+        Returns:
+            list[str] | None: Words ordered by distance, then by closeness in length,
+                then lexicographically.
+
+        In case of corrupt input arguments or empty vocabulary, None is returned.
+        """
+        if not check_positive_int(k) or not check_float(max_distance):
+            return None
+        bounds = self._calculate_bound_array(token)
+        if bounds is None:
+            return None
+        query = JaroWinklerQuery(token, self._prefix_scaling)
+        best: list[tuple[float, int, str]] = []
+        evaluated = 0
+        for position in np.argsort(bounds, kind="stable").tolist():
+            limit = best[-1][0] if len(best) == k else max_distance
+            if bounds[position] > limit + _TOLERANCE:
+                break
+            evaluated += 1
+            word = self._words[position]
+            distance = query.calculate_distance(word)
+            if distance is None or distance > max_distance:
+                continue
+            insort(best, (distance, abs(len(word) - len(token)), word))
+            if len(best) > k:
+                best.pop()
+        self._statistics["searches"] += 1
+        self._statistics["evaluated"] += evaluated
+        self._statistics["pruned"] += len(self._words) - evaluated
+        return [word for _, _, word in best]
+
+    def find_nearest_word(self, token: str, max_distance: float = 1.0) -> str | None:
+        """
+        Find the vocabulary word with the lowest Jaro-Winkler distance to the token.
+
+        Args:
+            token (str): Word that might be misspelled
+            max_distance (float): Largest allowed distance, one minus the similarity threshold
+
+        Returns:
+            str | None: Word with the tie-break rules of find_correct_word.
+
+        In case of corrupt input arguments, empty vocabulary or no word within
+        max_distance, None is returned.
+        """
+        nearest = self.find_nearest_words(token, 1, max_distance)
+        return nearest[0] if nearest else None
+
+    def _calculate_bound_array(self, token: str) -> np.ndarray | None:
+        """
+        Calculate lower bounds of distances aligned with the vocabulary words.
+
+        Args:
+            token (str): Word to compare with the vocabulary
+
+        Returns:
+            np.ndarray | None: Bounds of Jaro-Winkler distances.
+
+        In case of corrupt input arguments or empty vocabulary, None is returned.
+        """
+        if not isinstance(token, str) or not self._words:
+            return None
+        if not token:
+            return np.ones(len(self._words))
+        overlap = np.zeros(len(self._words), dtype=np.int64)
+        for letter in set(token):
+            if letter in self._columns:
+                overlap += np.minimum(self._counts[self._columns[letter]], token.count(letter))
+        prefix = token[:_PREFIX_SIZE]
+        equal = self._prefixes[:, : len(prefix)] == np.array([ord(letter) for letter in prefix])
+        prefix_lengths = np.cumprod(equal, axis=1).sum(axis=1)
+        lengths = np.maximum(self._lengths, 1)
+        jaro_bounds = 1.0 - (overlap / len(token) + overlap / lengths + 1) / 3
+        scales = 1.0 - prefix_lengths * self._prefix_scaling
+        bounds = np.where(scales >= 0, jaro_bounds * scales, scales)
+        return np.where(overlap > 0, bounds, 1.0)
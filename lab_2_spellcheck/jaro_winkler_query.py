@@ -0,0 +1,117 @@
+"""
+Jaro-Winkler distance from one query to many words with position-indexed matching.
+"""
+
+from lab_1_keywords_tfidf.main import check_dict
+from lab_2_spellcheck.main import winkler_adjustment
+
+
+class JaroWinklerQuery:
+    """
+    Query word prepared for Jaro-Winkler comparison with many candidates.
+
+    Positions of every letter of the query are stored once. Matching letters of
+    one letter are paired by a pointer over these positions that only moves
+    forward, because both the candidate letters and their search windows are
+    visited from left to right. This yields the same matches as get_matches
+    without scanning the windows, and transpositions and the Winkler prefix are
+    counted in the same call.
+    """
+
+    def __init__(self, token: str, prefix_scaling: float = 0.1) -> None:
+        """
+        Initialize an instance of the JaroWinklerQuery.
+
+        Args:
+            token (str): Word to compare with candidates
+            prefix_scaling (float): Scaling factor for the prefix boost
+        """
+        self._token = token if isinstance(token, str) else ""
+        self._prefix_scaling = prefix_scaling
+        self._is_valid = isinstance(token, str) and isinstance(prefix_scaling, float)
+        self._positions: dict[str, list[int]] = {}
+        for position, letter in enumerate(self._token):
+            self._positions.setdefault(letter, []).append(position)
+
+    def calculate_distance(self, candidate: str) -> float | None:
+        """
+        Calculate the Jaro-Winkler distance with the result of calculate_jaro_winkler_distance.
+
+        Args:
+            candidate (str): Word to compare with the query
+
+        Returns:
+            float | None: Jaro-Winkler distance score.
+
+        In case of corrupt input arguments, None is returned.
+        """
+        if not self._is_valid or not isinstance(candidate, str):
+            return None
+        token = self._token
+        if not token or not candidate:
+            return 1.0
+        token_matches, candidate_letters = self._match(candidate)
+        matches = len(candidate_letters)
+        if matches == 0:
+            return 1.0
+        token_letters = [letter for letter, matched in zip(token, token_matches) if matched]
+        mismatches = sum(
+            1 for first, second in zip(token_letters, candidate_letters) if first != second
+        )
+        similarity = (
+            matches / len(token) + matches / len(candidate) + (matches - mismatches // 2) / matches
+        ) / 3
+        jaro_distance = 1.0 - similarity
+        adjustment = winkler_adjustment(token, candidate, jaro_distance, self._prefix_scaling)
+        return jaro_distance - (adjustment or 0.0)
+
+    def calculate_distances(self, vocabulary: dict[str, float]) -> dict[str, float] | None:
+        """
+        Calculate Jaro-Winkler distances in the format of calculate_distance.
+
+        Args:
+            vocabulary (dict[str, float]): Dictionary with words and their relative frequencies
+
+        Returns:
+            dict[str, float] | None: Vocabulary words and Jaro-Winkler distances to them.
+
+        In case of corrupt input arguments, None is returned.
+        """
+        if not self._is_valid or not check_dict(vocabulary, str, float, False):
+            return None
+        distances = {}
+        for word in vocabulary:
+            distance = self.calculate_distance(word)
+            if distance is None:
+                return None
+            distances[word] = distance
+        return distances
+
+    def _match(self, candidate: str) -> tuple[list[bool], list[str]]:
+        """
+        Find matching letters of the query and the candidate.
+
+        Args:
+            candidate (str): Non-empty word to compare with the query
+
+        Returns:
+            tuple[list[bool], list[str]]: Boolean list indicating matches in the query
+                and matched letters of the candidate in their order
+        """
+        match_distance = max(0, max(len(self._token), len(candidate)) // 2 - 1)
+        pointers: dict[str, int] = {}
+        token_matches = [False] * len(self._token)
+        candidate_letters = []
+        for index, letter in enumerate(candidate):
+            positions = self._positions.get(letter)
+            if positions is None:
+                continue
+            pointer = pointers.get(letter, 0)
+            while pointer < len(positions) and positions[pointer] < index - match_distance:
+                pointer += 1
+            if pointer < len(positions) and positions[pointer] <= index + match_distance:
+                token_matches[positions[pointer]] = True
+                candidate_letters.append(letter)
+                pointer += 1
+            pointers[letter] = pointer
+        return token_matches, candidate_letters
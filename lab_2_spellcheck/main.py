@@ -2,8 +2,24 @@
 Lab 2.
 """
 
-# pylint:disable=unused-argument
-from typing import Literal
+from heapq import nsmallest
+from typing import Any, Callable, Iterator, Literal, Mapping
+
+from lab_1_keywords_tfidf.main import check_dict, check_list, check_positive_int
+from lab_2_spellcheck.weighted_distance import KEYBOARD_COSTS
+
+
+def check_non_negative_int(user_input: Any) -> bool:
+    """
+    Check if the object is a non-negative integer (not bool).
+
+    Args:
+        user_input (Any): Object to check
+
+    Returns:
+        bool: True if valid, False otherwise
+    """
+    return isinstance(user_input, int) and not isinstance(user_input, bool) and user_input >= 0
 
 
 def build_vocabulary(tokens: list[str]) -> dict[str, float] | None:
@@ -19,6 +35,13 @@ def build_vocabulary(tokens: list[str]) -> dict[str, float] | None:
 
     In case of corrupt input arguments, None is returned.
     """
+    if not check_list(tokens, str, False):
+        return None
+    counts = {}
+    for token in tokens:
+        counts[token] = counts.get(token, 0) + 1
+    total = len(tokens)
+    return {token: count / total for token, count in counts.items()}
 
 
 def find_out_of_vocab_words(tokens: list[str], vocabulary: dict[str, float]) -> list[str] | None:
@@ -34,6 +57,9 @@ def find_out_of_vocab_words(tokens: list[str], vocabulary: dict[str, float]) ->
 
     In case of corrupt input arguments, None is returned.
     """
+    if not check_list(tokens, str, False) or not check_dict(vocabulary, str, float, False):
+        return None
+    return [token for token in tokens if token not in vocabulary]
 
 
 def calculate_jaccard_distance(token: str, candidate: str) -> float | None:
@@ -48,14 +74,24 @@ def calculate_jaccard_distance(token: str, candidate: str) -> float | None:
         float | None: Jaccard distance score in range [0, 1].
 
     In case of corrupt input arguments, None is returned.
-    In case of both strings being empty, 0.0 is returned.
+    In case of both strings being empty, 1.0 is returned.
     """
+    if not isinstance(token, str) or not isinstance(candidate, str):
+        return None
+    token_letters = set(token)
+    candidate_letters = set(candidate)
+    union = token_letters | candidate_letters
+    if not union:
+        return 1.0
+    return 1 - len(token_letters & candidate_letters) / len(union)
 
 
 def calculate_distance(
     first_token: str,
     vocabulary: dict[str, float],
-    method: Literal["jaccard", "frequency-based", "levenshtein", "jaro-winkler"],
+    method: Literal[
+        "jaccard", "frequency-based", "levenshtein", "jaro-winkler", "weighted-levenshtein"
+    ],
     alphabet: list[str] | None = None,
 ) -> dict[str, float] | None:
     """
@@ -72,12 +108,71 @@ def calculate_distance(
 
     In case of corrupt input arguments or unsupported method, None is returned.
     """
+    if (
+        not isinstance(first_token, str)
+        or not check_dict(vocabulary, str, float, False)
+        or method
+        not in ("jaccard", "frequency-based", "levenshtein", "jaro-winkler", "weighted-levenshtein")
+    ):
+        return None
+    return _calculate_distances(first_token, vocabulary, method, alphabet)
+
+
+def _calculate_distances(
+    first_token: str,
+    vocabulary: Mapping[str, float],
+    method: str,
+    alphabet: list[str] | None = None,
+) -> dict[str, float] | None:
+    """
+    Calculate distances to the vocabulary words without checking the vocabulary.
+
+    Any mapping with string keys is accepted, so vocabularies that are not
+    dictionaries share the metrics of calculate_distance.
+
+    Args:
+        first_token (str): First string to compare.
+        vocabulary (Mapping[str, float]): Words mapped to their relative frequencies.
+        method (str): Method to use for comparison.
+        alphabet (list[str] | None): The alphabet with letters.
+
+    Returns:
+        dict[str, float] | None: Calculated distance score.
+
+    In case of corrupt alphabet or unsupported method, None is returned.
+    """
+    if method == "frequency-based":
+        if alphabet is None or not check_list(alphabet, str, True):
+            return None
+        frequencies = dict.fromkeys(vocabulary, 1.0)
+        for candidate in _find_vocabulary_candidates(first_token, alphabet, vocabulary):
+            frequencies[candidate] = vocabulary[candidate]
+        return frequencies
+    if method == "weighted-levenshtein":
+        return KEYBOARD_COSTS.calculate_distances(first_token, vocabulary)
+    metrics: dict[str, Callable[[str, str], float | int | None]] = {
+        "jaccard": calculate_jaccard_distance,
+        "levenshtein": calculate_levenshtein_distance,
+        "jaro-winkler": calculate_jaro_winkler_distance,
+    }
+    metric = metrics.get(method)
+    if metric is None:
+        return None
+    distances = {}
+    for word in vocabulary:
+        distance = metric(first_token, word)
+        if distance is None:
+            return None
+        distances[word] = float(distance)
+    return distances
 
 
 def find_correct_word(
     wrong_word: str,
     vocabulary: dict[str, float],
-    method: Literal["jaccard", "frequency-based", "levenshtein", "jaro-winkler"],
+    method: Literal[
+        "jaccard", "frequency-based", "levenshtein", "jaro-winkler", "weighted-levenshtein"
+    ],
     alphabet: list[str] | None = None,
 ) -> str | None:
     """
@@ -95,6 +190,93 @@ def find_correct_word(
 
     In case of empty vocabulary, None is returned.
     """
+    suggestions = suggest(wrong_word, vocabulary, method, 1, alphabet)
+    if not suggestions:
+        return None
+    return suggestions[0]
+
+
+def suggest(
+    wrong_word: str,
+    vocabulary: dict[str, float],
+    method: Literal[
+        "jaccard", "frequency-based", "levenshtein", "jaro-winkler", "weighted-levenshtein"
+    ],
+    k: int,
+    alphabet: list[str] | None = None,
+) -> list[str] | None:
+    """
+    Find k most similar words from vocabulary using the specified method.
+
+    Args:
+        wrong_word (str): Word that might be misspelled.
+        vocabulary (dict[str, float]): Dict of candidate words.
+        method (str): Method to use for comparison.
+        k (int): Number of words to find.
+        alphabet (list[str]): The alphabet with letters.
+
+    Returns:
+        list[str] | None: Words from vocabulary ordered by distance score,
+             then by closeness in length, then lexicographically.
+
+    In case of corrupt input arguments or empty vocabulary, None is returned.
+    """
+    if alphabet is not None and not check_list(alphabet, str, True):
+        return None
+    distances = calculate_distance(wrong_word, vocabulary, method, alphabet)
+    if not distances:
+        return None
+    return choose_closest_words(wrong_word, distances, k)
+
+
+def choose_closest_word(wrong_word: str, distances: dict[str, float]) -> str | None:
+    """
+    Choose the word with the lowest distance score.
+
+    Args:
+        wrong_word (str): Word that might be misspelled.
+        distances (dict[str, float]): Candidate words and distances to them.
+
+    Returns:
+        str | None: Word with the lowest distance score.
+             In case of ties, the closest in length and lexicographically first is chosen.
+
+    In case of corrupt input arguments or empty distances, None is returned.
+    """
+    closest = choose_closest_words(wrong_word, distances, 1)
+    if not closest:
+        return None
+    return closest[0]
+
+
+def choose_closest_words(wrong_word: str, distances: dict[str, float], k: int) -> list[str] | None:
+    """
+    Choose k words with the lowest distance scores.
+
+    Candidates are scanned once while a heap of the k best words is kept,
+    so the whole distance dictionary is never sorted.
+
+    Args:
+        wrong_word (str): Word that might be misspelled.
+        distances (dict[str, float]): Candidate words and distances to them.
+        k (int): Number of words to choose.
+
+    Returns:
+        list[str] | None: Words ordered by distance score, then by closeness
+             in length, then lexicographically.
+
+    In case of corrupt input arguments or empty distances, None is returned.
+    """
+    if (
+        not isinstance(wrong_word, str)
+        or not isinstance(distances, dict)
+        or not distances
+        or not check_positive_int(k)
+    ):
+        return None
+    return nsmallest(
+        k, distances, key=lambda word: (distances[word], abs(len(word) - len(wrong_word)), word)
+    )
 
 
 def initialize_levenshtein_matrix(
@@ -110,6 +292,13 @@ def initialize_levenshtein_matrix(
     Returns:
         list[list[int]] | None: Initialized matrix with base cases filled.
     """
+    if not check_non_negative_int(token_length) or not check_non_negative_int(candidate_length):
+        return None
+    matrix = [[0] * (candidate_length + 1) for _ in range(token_length + 1)]
+    matrix[0] = list(range(candidate_length + 1))
+    for row_index in range(1, token_length + 1):
+        matrix[row_index][0] = row_index
+    return matrix
 
 
 def fill_levenshtein_matrix(token: str, candidate: str) -> list[list[int]] | None:
@@ -123,6 +312,20 @@ def fill_levenshtein_matrix(token: str, candidate: str) -> list[list[int]] | Non
     Returns:
         list[list[int]] | None: Completed Levenshtein distance matrix.
     """
+    if not isinstance(token, str) or not isinstance(candidate, str):
+        return None
+    matrix = initialize_levenshtein_matrix(len(token), len(candidate))
+    if matrix is None:
+        return None
+    for i in range(1, len(token) + 1):
+        for j in range(1, len(candidate) + 1):
+            cost = 0 if token[i - 1] == candidate[j - 1] else 1
+            matrix[i][j] = min(
+                matrix[i - 1][j] + 1,
+                matrix[i][j - 1] + 1,
+                matrix[i - 1][j - 1] + cost,
+            )
+    return matrix
 
 
 def calculate_levenshtein_distance(token: str, candidate: str) -> int | None:
@@ -137,6 +340,10 @@ def calculate_levenshtein_distance(token: str, candidate: str) -> int | None:
         int | None: Minimum number of single-character edits (insertions, deletions,
              substitutions) required to transform token into candidate.
     """
+    matrix = fill_levenshtein_matrix(token, candidate)
+    if matrix is None:
+        return None
+    return matrix[-1][-1]
 
 
 def delete_letter(word: str) -> list[str]:
@@ -151,6 +358,9 @@ def delete_letter(word: str) -> list[str]:
 
     In case of corrupt input arguments, empty list is returned.
     """
+    if not isinstance(word, str):
+        return []
+    return sorted(_deletions(word))
 
 
 def add_letter(word: str, alphabet: list[str]) -> list[str]:
@@ -167,6 +377,9 @@ def add_letter(word: str, alphabet: list[str]) -> list[str]:
 
     In case of corrupt input arguments, empty list is returned.
     """
+    if not isinstance(word, str) or not check_list(alphabet, str, True):
+        return []
+    return sorted(_insertions(word, alphabet))
 
 
 def replace_letter(word: str, alphabet: list[str]) -> list[str]:
@@ -183,6 +396,9 @@ def replace_letter(word: str, alphabet: list[str]) -> list[str]:
 
     In case of corrupt input arguments, empty list is returned.
     """
+    if not isinstance(word, str) or not check_list(alphabet, str, True):
+        return []
+    return sorted(_replacements(word, alphabet))
 
 
 def swap_adjacent(word: str) -> list[str]:
@@ -198,6 +414,9 @@ def swap_adjacent(word: str) -> list[str]:
 
     In case of corrupt input arguments, empty list is returned.
     """
+    if not isinstance(word, str):
+        return []
+    return sorted(_swaps(word))
 
 
 def generate_candidates(word: str, alphabet: list[str]) -> list[str] | None:
@@ -214,6 +433,9 @@ def generate_candidates(word: str, alphabet: list[str]) -> list[str] | None:
 
     In case of corrupt input arguments, None is returned.
     """
+    if not isinstance(word, str) or not check_list(alphabet, str, True):
+        return None
+    return sorted(set(_iterate_edits(word, alphabet)))
 
 
 def propose_candidates(word: str, alphabet: list[str]) -> tuple[str, ...] | None:
@@ -230,6 +452,133 @@ def propose_candidates(word: str, alphabet: list[str]) -> tuple[str, ...] | None
 
     In case of corrupt input arguments, None is returned.
     """
+    if not isinstance(word, str) or not check_list(alphabet, str, True):
+        return None
+    first_level = set(_iterate_edits(word, alphabet))
+    candidates = set(first_level)
+    for candidate in first_level:
+        candidates.update(_iterate_edits(candidate, alphabet))
+    return tuple(sorted(candidates))
+
+
+def iterate_edits(word: str, alphabet: list[str]) -> Iterator[str]:
+    """
+    Lazily generate the candidates of generate_candidates without sorting.
+
+    Edits are produced one by one in no particular order and may repeat,
+    so callers can put them straight into their own set or lookup.
+
+    Args:
+        word (str): The input word.
+        alphabet (list[str]): Alphabet for candidates creation.
+
+    Yields:
+        str: Edited strings.
+
+    In case of corrupt input arguments, nothing is generated.
+    """
+    if not isinstance(word, str) or not check_list(alphabet, str, True):
+        return
+    yield from _iterate_edits(word, alphabet)
+
+
+def _find_vocabulary_candidates(
+    word: str, alphabet: list[str], vocabulary: Mapping[str, float]
+) -> set[str]:
+    """
+    Find vocabulary words among the candidates of propose_candidates.
+
+    Second-level edits are checked against the vocabulary as they are produced,
+    so only the first level is ever stored.
+
+    Args:
+        word (str): The input incorrect word.
+        alphabet (list[str]): Alphabet for candidates creation.
+        vocabulary (Mapping[str, float]): Words to keep.
+
+    Returns:
+        set[str]: Candidates that are vocabulary words.
+    """
+    first_level = set(_iterate_edits(word, alphabet))
+    found = {candidate for candidate in first_level if candidate in vocabulary}
+    for candidate in first_level:
+        found.update(edit for edit in _iterate_edits(candidate, alphabet) if edit in vocabulary)
+    return found
+
+
+def _iterate_edits(word: str, alphabet: list[str]) -> Iterator[str]:
+    """
+    Generate the strings of delete_letter, add_letter, replace_letter and swap_adjacent.
+
+    Edits are produced one by one without sorting or deduplication.
+
+    Args:
+        word (str): The input word.
+        alphabet (list[str]): Alphabet for candidates creation.
+
+    Yields:
+        str: Edited strings.
+    """
+    yield from _deletions(word)
+    yield from _insertions(word, alphabet)
+    yield from _replacements(word, alphabet)
+    yield from _swaps(word)
+
+
+def _deletions(word: str) -> list[str]:
+    """
+    Generate the strings of delete_letter without sorting.
+
+    Args:
+        word (str): The input word.
+
+    Returns:
+        list[str]: Words with one letter removed.
+    """
+    return [word[:i] + word[i + 1 :] for i in range(len(word))]
+
+
+def _insertions(word: str, alphabet: list[str]) -> list[str]:
+    """
+    Generate the strings of add_letter without sorting.
+
+    Args:
+        word (str): The input word.
+        alphabet (list[str]): The alphabet with letters.
+
+    Returns:
+        list[str]: Words with one letter inserted.
+    """
+    splits = [(word[:i], word[i:]) for i in range(len(word) + 1)]
+    return [prefix + letter + suffix for prefix, suffix in splits for letter in alphabet]
+
+
+def _replacements(word: str, alphabet: list[str]) -> list[str]:
+    """
+    Generate the strings of replace_letter without sorting.
+
+    Args:
+        word (str): The input word.
+        alphabet (list[str]): The alphabet with letters.
+
+    Returns:
+        list[str]: Words with one letter replaced.
+    """
+    splits = [(word[:i], word[i + 1 :]) for i in range(len(word))]
+    return [prefix + letter + suffix for prefix, suffix in splits for letter in alphabet]
+
+
+def _swaps(word: str) -> list[str]:
+    """
+    Generate the strings of swap_adjacent without sorting.
+
+    Args:
+        word (str): The input word.
+
+    Returns:
+        list[str]: Words with two neighbouring letters swapped.
+    """
+    return [word[:i] + word[i + 1] + word[i] + word[i + 2 :] for i in range(len(word) - 1)]
 
 
 def calculate_frequency_distance(
@@ -248,6 +597,13 @@ def calculate_frequency_distance(
 
     In case of corrupt input arguments, None is returned.
     """
+    if (
+        not isinstance(word, str)
+        or not check_dict(frequencies, str, float, False)
+        or not check_list(alphabet, str, True)
+    ):
+        return None
+    return _calculate_distances(word, frequencies, "frequency-based", alphabet)
 
 
 def get_matches(
@@ -269,6 +625,25 @@ def get_matches(
 
     In case of corrupt input arguments, None is returned.
     """
+    if (
+        not isinstance(token, str)
+        or not isinstance(candidate, str)
+        or not check_non_negative_int(match_distance)
+    ):
+        return None
+    token_matches = [False] * len(token)
+    candidate_matches = [False] * len(candidate)
+    matches = 0
+    for i, letter in enumerate(token):
+        start = max(0, i - match_distance)
+        end = min(len(candidate), i + match_distance + 1)
+        for j in range(start, end):
+            if not candidate_matches[j] and candidate[j] == letter:
+                token_matches[i] = True
+                candidate_matches[j] = True
+                matches += 1
+                break
+    return matches, token_matches, candidate_matches
 
 
 def count_transpositions(
@@ -288,6 +663,19 @@ def count_transpositions(
 
     In case of corrupt input arguments, None is returned.
     """
+    if (
+        not isinstance(token, str)
+        or not isinstance(candidate, str)
+        or not check_list(token_matches, bool, False)
+        or not check_list(candidate_matches, bool, False)
+    ):
+        return None
+    token_letters = [letter for letter, matched in zip(token, token_matches) if matched]
+    candidate_letters = [letter for letter, matched in zip(candidate, candidate_matches) if matched]
+    mismatches = sum(
+        1 for first, second in zip(token_letters, candidate_letters) if first != second
+    )
+    return mismatches // 2
 
 
 def calculate_jaro_distance(
@@ -307,6 +695,19 @@ def calculate_jaro_distance(
 
     In case of corrupt input arguments, None is returned.
     """
+    if (
+        not isinstance(token, str)
+        or not isinstance(candidate, str)
+        or not check_non_negative_int(matches)
+        or not check_non_negative_int(transpositions)
+    ):
+        return None
+    if matches == 0:
+        return 1.0
+    similarity = (
+        matches / len(token) + matches / len(candidate) + (matches - transpositions) / matches
+    ) / 3
+    return 1.0 - similarity
 
 
 def winkler_adjustment(
@@ -326,6 +727,19 @@ def winkler_adjustment(
 
     In case of corrupt input arguments, None is returned.
     """
+    if (
+        not isinstance(token, str)
+        or not isinstance(candidate, str)
+        or not isinstance(jaro_distance, float)
+        or not isinstance(prefix_scaling, float)
+    ):
+        return None
+    prefix_length = 0
+    for first, second in zip(token[:4], candidate[:4]):
+        if first != second:
+            break
+        prefix_length += 1
+    return prefix_length * prefix_scaling * jaro_distance
 
 
 def calculate_jaro_winkler_distance(
@@ -344,3 +758,28 @@ def calculate_jaro_winkler_distance(
 
     In case of corrupt input arguments or corrupt outputs of used functions, None is returned.
     """
+    if (
+        not isinstance(token, str)
+        or not isinstance(candidate, str)
+        or not isinstance(prefix_scaling, float)
+    ):
+        return None
+    if not token or not candidate:
+        return 1.0
+    match_distance = max(0, max(len(token), len(candidate)) // 2 - 1)
+    match_result = get_matches(token, candidate, match_distance)
+    if match_result is None:
+        return None
+    matches, token_matches, candidate_matches = match_result
+    if matches == 0:
+        return 1.0
+    transpositions = count_transpositions(token, candidate, token_matches, candidate_matches)
+    if transpositions is None:
+        return None
+    jaro_distance = calculate_jaro_distance(token, candidate, matches, transpositions)
+    if jaro_distance is None:
+        return None
+    adjustment = winkler_adjustment(token, candidate, jaro_distance, prefix_scaling)
+    if adjustment is None:
+        return None
+    return jaro_distance - adjustment
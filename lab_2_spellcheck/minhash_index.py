@@ -0,0 +1,158 @@
+"""
+MinHash signatures with banded LSH for Jaccard candidate retrieval.
+"""
+
+import random
+from zlib import crc32
+
+from lab_1_keywords_tfidf.main import check_dict
+from lab_2_spellcheck.main import calculate_jaccard_distance, check_non_negative_int
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_SEED = 42
+
+
+class MinHashIndex:
+    """
+    Locality-sensitive index over character sets or character n-grams of words.
+
+    Each word is summarized by ``bands * rows`` MinHash values. The signature is
+    split into ``bands`` bands of ``rows`` values and every band is used as a
+    bucket key, so two words become candidates if they collide in at least one
+    band. Words with Jaccard similarity ``s`` collide with probability
+    ``1 - (1 - s ** rows) ** bands``: more bands raise recall, more rows raise
+    precision.
+    """
+
+    def __init__(
+        self,
+        vocabulary: dict[str, float],
+        bands: int = 16,
+        rows: int = 2,
+        ngram_size: int = 1,
+    ) -> None:
+        """
+        Initialize an instance of the MinHashIndex.
+
+        Args:
+            vocabulary (dict[str, float]): Dictionary with words and their relative frequencies
+            bands (int): Number of LSH bands
+            rows (int): Number of MinHash values in one band
+            ngram_size (int): Size of character n-grams, 1 stands for character sets
+        """
+        self._bands = bands
+        self._rows = rows
+        self._ngram_size = ngram_size
+        self._buckets: list[dict[tuple[int, ...], list[str]]] = []
+        self._coefficients: list[tuple[int, int]] = []
+        if not (
+            check_dict(vocabulary, str, float, False)
+            and check_non_negative_int(bands)
+            and check_non_negative_int(rows)
+            and check_non_negative_int(ngram_size)
+            and bands * rows * ngram_size > 0
+        ):
+            return
+        generator = random.Random(_SEED)
+        self._coefficients = [
+            (generator.randint(1, _MERSENNE_PRIME - 1), generator.randint(0, _MERSENNE_PRIME - 1))
+            for _ in range(bands * rows)
+        ]
+        self._buckets = [{} for _ in range(bands)]
+        for word in vocabulary:
+            for band, key in enumerate(self._band_keys(word)):
+                self._buckets[band].setdefault(key, []).append(word)
+
+    def candidate_probability(self, similarity: float) -> float:
+        """
+        Get probability for a word with the given Jaccard similarity to become a candidate.
+
+        Args:
+            similarity (float): Jaccard similarity in range [0, 1]
+
+        Returns:
+            float: Probability of collision in at least one band
+        """
+        return 1 - (1 - similarity**self._rows) ** self._bands
+
+    def get_candidates(self, token: str) -> set[str] | None:
+        """
+        Retrieve vocabulary words colliding with the token in at least one band.
+
+        Args:
+            token (str): Word to look up
+
+        Returns:
+            set[str] | None: Candidate words.
+
+        In case of corrupt input arguments or empty index, None is returned.
+        """
+        if not isinstance(token, str) or not self._buckets:
+            return None
+        candidates: set[str] = set()
+        for band, key in enumerate(self._band_keys(token)):
+            candidates.update(self._buckets[band].get(key, ()))
+        return candidates
+
+    def calculate_distances(self, token: str) -> dict[str, float] | None:
+        """
+        Calculate exact Jaccard distance between the token and retrieved candidates.
+
+        Args:
+            token (str): Word to compare with the candidates
+
+        Returns:
+            dict[str, float] | None: Candidate words and Jaccard distances to them.
+
+        In case of corrupt input arguments or empty index, None is returned.
+        """
+        candidates = self.get_candidates(token)
+        if candidates is None:
+            return None
+        distances = {}
+        for candidate in candidates:
+            distance = calculate_jaccard_distance(token, candidate)
+            if distance is None:
+                return None
+            distances[candidate] = distance
+        return distances
+
+    def _get_features(self, word: str) -> set[str]:
+        """
+        Split a word into character n-grams.
+
+        Args:
+            word (str): Word to split
+
+        Returns:
+            set[str]: Unique n-grams of the word, or the word itself if it is shorter
+        """
+        if len(word) < self._ngram_size:
+            return {word} if word else set()
+        return {
+            word[index : index + self._ngram_size]
+            for index in range(len(word) - self._ngram_size + 1)
+        }
+
+    def _band_keys(self, word: str) -> list[tuple[int, ...]]:
+        """
+        Compute MinHash signature of a word and split it into band keys.
+
+        Args:
+            word (str): Word to hash
+
+        Returns:
+            list[tuple[int, ...]]: Bucket keys of the word, empty for words without features
+        """
+        hashes = [crc32(feature.encode("utf-8")) for feature in self._get_features(word)]
+        if not hashes:
+            return []
+        signature = [
+            min(((slope * value + shift) % _MERSENNE_PRIME) & _MAX_HASH for value in hashes)
+            for slope, shift in self._coefficients
+        ]
+        return [
+            tuple(signature[band * self._rows : (band + 1) * self._rows])
+            for band in range(self._bands)
+        ]
@@ -0,0 +1,164 @@
+"""
+All spellcheck metrics for a shortlist of vocabulary words in one pass.
+"""
+
+from lab_1_keywords_tfidf.main import check_dict, check_list, check_positive_int
+from lab_2_spellcheck.jaro_winkler_query import JaroWinklerQuery
+from lab_2_spellcheck.main import (
+    calculate_levenshtein_distance,
+    check_non_negative_int,
+    choose_closest_words,
+)
+from lab_2_spellcheck.vocabulary_indexes import VocabularyIndexes
+from lab_2_spellcheck.weighted_distance import KEYBOARD_COSTS
+
+METHODS = ("jaccard", "frequency-based", "levenshtein", "jaro-winkler", "weighted-levenshtein")
+
+
+class MultiMetricScorer:
+    """
+    Scores vocabulary words with every method of calculate_distance at once.
+
+    Words are bucketed by length, and the shortlist of a token consists of the
+    words whose length differs by at most ``max_length_difference``. Every
+    shortlisted word is visited once. Its Jaccard distance comes from the
+    letter bitmasks of the shared indexes, the Jaro-Winkler distance from the
+    prepared query, the Levenshtein distance from calculate_levenshtein_distance,
+    the weighted distance from the keyboard costs over the encodings of the
+    shared indexes, and the frequency-based distance from one deletion index
+    lookup of the candidates of the token.
+    """
+
+    def __init__(self, indexes: VocabularyIndexes, max_length_difference: int | None = 2) -> None:
+        """
+        Initialize an instance of the MultiMetricScorer.
+
+        Args:
+            indexes (VocabularyIndexes): Vocabulary with its lookup structures
+            max_length_difference (int | None): Largest difference in length of
+                shortlisted words, None for the whole vocabulary
+        """
+        self._indexes = indexes if isinstance(indexes, VocabularyIndexes) else VocabularyIndexes({})
+        self._max_length_difference = max_length_difference
+        self._buckets: dict[int, list[str]] = {}
+        for word in self._indexes.vocabulary:
+            self._buckets.setdefault(len(word), []).append(word)
+
+    def get_shortlist(self, token: str) -> list[str] | None:
+        """
+        Get vocabulary words close to the token in length.
+
+        Args:
+            token (str): Word that might be misspelled
+
+        Returns:
+            list[str] | None: Shortlisted words.
+
+        In case of corrupt input arguments or empty vocabulary, None is returned.
+        """
+        if not isinstance(token, str) or not self._buckets:
+            return None
+        if self._max_length_difference is None:
+            return list(self._indexes.vocabulary)
+        if not check_non_negative_int(self._max_length_difference):
+            return None
+        shortlist = []
+        for length in range(
+            len(token) - self._max_length_difference, len(token) + self._max_length_difference + 1
+        ):
+            shortlist.extend(self._buckets.get(length, ()))
+        return shortlist
+
+    def score(
+        self, token: str, alphabet: list[str] | None = None
+    ) -> dict[str, dict[str, float]] | None:
+        """
+        Calculate distances of every method to the shortlisted words.
+
+        Args:
+            token (str): Word that might be misspelled
+            alphabet (list[str] | None): The alphabet with letters, frequency-based
+                distances are skipped without it
+
+        Returns:
+            dict[str, dict[str, float]] | None: Shortlisted words and their distances
+                by method, equal to the results of calculate_distance.
+
+        In case of corrupt input arguments or empty vocabulary, None is returned.
+        """
+        shortlist = self.get_shortlist(token)
+        if shortlist is None or not (alphabet is None or check_list(alphabet, str, True)):
+            return None
+        signatures = self._indexes.signatures
+        token_mask = signatures.encode(token)
+        jaro_winkler = JaroWinklerQuery(token)
+        candidates = (
+            set(self._indexes.deletion_index.iterate_candidates(token, alphabet))
+            if alphabet is not None
+            else set()
+        )
+        weighted = (
+            KEYBOARD_COSTS.calculate_distances(
+                token, dict.fromkeys(shortlist, 1.0), self._indexes.encodings
+            )
+            or {}
+        )
+        table = {}
+        for word in shortlist:
+            jaro_winkler_distance = jaro_winkler.calculate_distance(word)
+            levenshtein_distance = calculate_levenshtein_distance(token, word)
+            if jaro_winkler_distance is None or levenshtein_distance is None:
+                return None
+            word_mask = signatures.signatures[word]
+            union = (token_mask | word_mask).bit_count()
+            scores = {
+                "jaccard": 1 - (token_mask & word_mask).bit_count() / union if union else 1.0,
+                "levenshtein": float(levenshtein_distance),
+                "jaro-winkler": jaro_winkler_distance,
+                "weighted-levenshtein": weighted[word],
+            }
+            if alphabet is not None:
+                scores["frequency-based"] = (
+                    self._indexes.vocabulary[word] if word in candidates else 1.0
+                )
+            table[word] = scores
+        return table
+
+    def rank(
+        self,
+        token: str,
+        weights: dict[str, float],
+        k: int,
+        alphabet: list[str] | None = None,
+    ) -> list[str] | None:
+        """
+        Find k shortlisted words with the lowest weighted sum of distances.
+
+        Args:
+            token (str): Word that might be misspelled
+            weights (dict[str, float]): Weights of methods
+            k (int): Number of words to find
+            alphabet (list[str] | None): The alphabet with letters
+
+        Returns:
+            list[str] | None: Words ordered by blended distance, then by closeness
+                in length, then lexicographically.
+
+        In case of corrupt input arguments, unknown methods or empty shortlist,
+        None is returned.
+        """
+        if (
+            not check_dict(weights, str, float, False)
+            or not set(weights) <= set(METHODS)
+            or not check_positive_int(k)
+            or ("frequency-based" in weights and alphabet is None)
+        ):
+            return None
+        table = self.score(token, alphabet)
+        if not table:
+            return None
+        blended = {
+            word: sum(weight * scores[method] for method, weight in weights.items())
+            for word, scores in table.items()
+        }
+        return choose_closest_words(token, blended, k)
@@ -0,0 +1,163 @@
+"""
+Blocking of Russian vocabulary words by phonetic keys.
+"""
+
+from typing import Literal
+
+from lab_1_keywords_tfidf.main import check_dict
+from lab_2_spellcheck.main import find_correct_word
+
+_PHONETIC_LETTERS = {
+    **dict.fromkeys("аеёиоуыэюяйъь", ""),
+    "б": "п",
+    "в": "ф",
+    "г": "к",
+    "д": "т",
+    "ж": "ш",
+    "з": "с",
+    "щ": "ш",
+    "ц": "с",
+}
+
+
+def encode_phonetic(word: str) -> str | None:
+    """
+    Calculate the phonetic key of a Russian word.
+
+    The key is the consonant skeleton of the word: vowels and signs are dropped,
+    voiced consonants are replaced by their voiceless pairs, ``щ`` and ``ц`` by
+    ``ш`` and ``с``, ``тс`` of reflexive verbs by ``с``, and repeated consonants
+    are collapsed. Other characters are kept as they are.
+
+    Args:
+        word (str): Word to encode
+
+    Returns:
+        str | None: Phonetic key.
+
+    In case of corrupt input arguments, None is returned.
+    """
+    if not isinstance(word, str):
+        return None
+    skeleton = "".join(_PHONETIC_LETTERS.get(letter, letter) for letter in word.lower())
+    skeleton = skeleton.replace("тс", "с")
+    key = []
+    for symbol in skeleton:
+        if not key or key[-1] != symbol:
+            key.append(symbol)
+    return "".join(key)
+
+
+class PhoneticIndex:
+    """
+    Vocabulary words grouped into buckets by their phonetic keys.
+
+    Candidates of a token are the words of its bucket and of the neighbouring
+    buckets, whose keys differ from the token key by one deletion, insertion or
+    replacement. Neighbours are found with deletion variants of the keys stored
+    at construction, so no key is compared with every other key. Only the
+    candidates are scored by find_correct_word; the whole vocabulary is
+    scored when a token has no candidates.
+    """
+
+    def __init__(self, vocabulary: dict[str, float], include_neighbours: bool = True) -> None:
+        """
+        Initialize an instance of the PhoneticIndex.
+
+        Args:
+            vocabulary (dict[str, float]): Dictionary with words and their relative frequencies
+            include_neighbours (bool): Whether to add buckets of keys one edit away
+        """
+        self._vocabulary: dict[str, float] = {}
+        self._include_neighbours = include_neighbours
+        self._buckets: dict[str, list[str]] = {}
+        self._deletions: dict[str, set[str]] = {}
+        self._statistics = {"searches": 0, "scored": 0, "fallbacks": 0}
+        if not check_dict(vocabulary, str, float, False):
+            return
+        self._vocabulary = vocabulary
+        for word in vocabulary:
+            key = encode_phonetic(word) or ""
+            if key not in self._buckets:
+                for deletion in _delete_symbol(key):
+                    self._deletions.setdefault(deletion, set()).add(key)
+            self._buckets.setdefault(key, []).append(word)
+
+    @property
+    def statistics(self) -> dict[str, int]:
+        """
+        Get search counters.
+
+        Returns:
+            dict[str, int]: Numbers of searches, scored words and searches that
+                fell back to the whole vocabulary
+        """
+        return dict(self._statistics)
+
+    def get_candidates(self, token: str) -> list[str] | None:
+        """
+        Collect words of the bucket of the token and of the neighbouring buckets.
+
+        Args:
+            token (str): Word that might be misspelled
+
+        Returns:
+            list[str] | None: Candidate words, empty if no bucket matches.
+
+        In case of corrupt input arguments or empty vocabulary, None is returned.
+        """
+        key = encode_phonetic(token)
+        if key is None or not self._vocabulary:
+            return None
+        keys = {key}
+        if self._include_neighbours:
+            keys.update(self._deletions.get(key, ()))
+            for deletion in _delete_symbol(key):
+                keys.add(deletion)
+                keys.update(self._deletions.get(deletion, ()))
+        return [word for bucket in sorted(keys) for word in self._buckets.get(bucket, ())]
+
+    def find_correct_word(
+        self,
+        wrong_word: str,
+        method: Literal[
+            "jaccard", "frequency-based", "levenshtein", "jaro-winkler", "weighted-levenshtein"
+        ],
+        alphabet: list[str] | None = None,
+    ) -> str | None:
+        """
+        Find the most similar word among the phonetic candidates.
+
+        Args:
+            wrong_word (str): Word that might be misspelled
+            method (str): Method to use for comparison
+            alphabet (list[str] | None): The alphabet with letters
+
+        Returns:
+            str | None: The most similar candidate.
+
+        In case of corrupt input arguments or unsupported method, None is returned.
+        """
+        candidates = self.get_candidates(wrong_word)
+        if candidates is None:
+            return None
+        self._statistics["searches"] += 1
+        if not candidates:
+            self._statistics["fallbacks"] += 1
+            candidates = list(self._vocabulary)
+        self._statistics["scored"] += len(candidates)
+        vocabulary = {word: self._vocabulary[word] for word in candidates}
+        return find_correct_word(wrong_word, vocabulary, method, alphabet)
+
+
+def _delete_symbol(key: str) -> set[str]:
+    """
+    Generate keys with one symbol deleted.
+
+    Args:
+        key (str): Phonetic key
+
+    Returns:
+        set[str]: Deletion variants of the key
+    """
+    return {key[:index] + key[index + 1 :] for index in range(len(key))}
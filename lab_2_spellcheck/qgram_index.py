@@ -0,0 +1,203 @@
+"""
+Character q-gram inverted index with count filtering for Levenshtein search.
+"""
+
+from bisect import insort
+
+import numpy as np
+
+from lab_1_keywords_tfidf.main import check_dict, check_positive_int
+from lab_2_spellcheck.main import calculate_levenshtein_distance, check_non_negative_int
+
+
+class QGramIndex:
+    """
+    Inverted index from character q-grams to vocabulary words.
+
+    A word of length ``n`` has ``n - q + 1`` q-grams and one edit destroys at most
+    ``q`` of them, so two words within edit distance ``k`` share at least
+    ``max(|a|, |b|) - q + 1 - k * q`` q-grams (count lemma). Words sharing fewer
+    q-grams with the token, or differing in length by more than ``k``, cannot be
+    within distance ``k`` and are filtered out; the rest is checked with
+    calculate_levenshtein_distance. Posting lists are NumPy arrays of word ids
+    with the number of occurrences of the q-gram in every word.
+    """
+
+    def __init__(self, vocabulary: dict[str, float], q: int = 2) -> None:
+        """
+        Initialize an instance of the QGramIndex.
+
+        Args:
+            vocabulary (dict[str, float]): Dictionary with words and their relative frequencies
+            q (int): Length of q-grams
+        """
+        self._q = q
+        self._words: list[str] = []
+        self._lengths = np.zeros(0, dtype=np.int64)
+        self._postings: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        self._statistics = {"searches": 0, "checked": 0, "filtered": 0}
+        if not check_dict(vocabulary, str, float, False) or not check_positive_int(q):
+            return
+        self._words = list(vocabulary)
+        self._lengths = np.array([len(word) for word in self._words], dtype=np.int64)
+        postings: dict[str, tuple[list[int], list[int]]] = {}
+        for position, word in enumerate(self._words):
+            for gram, count in self._count_grams(word).items():
+                ids, counts = postings.setdefault(gram, ([], []))
+                ids.append(position)
+                counts.append(count)
+        self._postings = {
+            gram: (np.array(ids, dtype=np.int32), np.array(counts, dtype=np.int32))
+            for gram, (ids, counts) in postings.items()
+        }
+
+    @property
+    def statistics(self) -> dict[str, int]:
+        """
+        Get search counters.
+
+        Returns:
+            dict[str, int]: Numbers of searches, words checked with exact
+                distances and words skipped by the length and count filters
+        """
+        return dict(self._statistics)
+
+    def get_candidates(self, token: str, max_distance: int) -> list[str] | None:
+        """
+        Find vocabulary words that may be within the distance from the token.
+
+        Args:
+            token (str): Word that might be misspelled
+            max_distance (int): Largest allowed Levenshtein distance
+
+        Returns:
+            list[str] | None: Candidates including every word within max_distance.
+
+        In case of corrupt input arguments or empty vocabulary, None is returned.
+        """
+        if not check_non_negative_int(max_distance):
+            return None
+        shared = self._count_shared_grams(token)
+        if shared is None:
+            return None
+        mask = self._filter(len(token), shared, max_distance)
+        return [self._words[position] for position in np.flatnonzero(mask).tolist()]
+
+    def find_nearest_words(
+        self, token: str, k: int, max_distance: int | None = None
+    ) -> list[str] | None:
+        """
+        Find k vocabulary words with the lowest Levenshtein distance to the token.
+
+        The search radius grows from zero: candidates of every radius are checked
+        exactly, and the search stops once k words are found within the radius,
+        because the candidates of a radius include all words within it.
+
+        Args:
+            token (str): Word that might be misspelled
+            k (int): Number of words to find
+            max_distance (int | None): Largest allowed distance
+
+        Returns:
+            list[str] | None: Words ordered by distance, then by closeness in length,
+                then lexicographically.
+
+        In case of corrupt input arguments or empty vocabulary, None is returned.
+        """
+        if not check_positive_int(k) or not (
+            max_distance is None or check_non_negative_int(max_distance)
+        ):
+            return None
+        shared = self._count_shared_grams(token)
+        if shared is None:
+            return None
+        largest = max(len(token), int(self._lengths.max()))
+        limit = largest if max_distance is None else min(max_distance, largest)
+        checked = np.zeros(len(self._words), dtype=bool)
+        best: list[tuple[int, int, str]] = []
+        for radius in range(limit + 1):
+            mask = self._filter(len(token), shared, radius) & ~checked
+            checked |= mask
+            for position in np.flatnonzero(mask).tolist():
+                word = self._words[position]
+                distance = calculate_levenshtein_distance(token, word)
+                if distance is not None and distance <= limit:
+                    insort(best, (distance, abs(len(word) - len(token)), word))
+            if len(best) >= k and best[k - 1][0] <= radius:
+                break
+        evaluated = int(checked.sum())
+        self._statistics["searches"] += 1
+        self._statistics["checked"] += evaluated
+        self._statistics["filtered"] += len(self._words) - evaluated
+        return [word for _, _, word in best[:k]]
+
+    def find_nearest_word(self, token: str, max_distance: int | None = None) -> str | None:
+        """
+        Find the vocabulary word with the lowest Levenshtein distance to the token.
+
+        Args:
+            token (str): Word that might be misspelled
+            max_distance (int | None): Largest allowed distance
+
+        Returns:
+            str | None: Word with the tie-break rules of find_correct_word.
+
+        In case of corrupt input arguments, empty vocabulary or no word within
+        max_distance, None is returned.
+        """
+        nearest = self.find_nearest_words(token, 1, max_distance)
+        if not nearest:
+            return None
+        return nearest[0]
+
+    def _count_grams(self, word: str) -> dict[str, int]:
+        """
+        Count q-grams of a word.
+
+        Args:
+            word (str): Word to split
+
+        Returns:
+            dict[str, int]: Q-grams and numbers of their occurrences
+        """
+        grams: dict[str, int] = {}
+        for index in range(len(word) - self._q + 1):
+            gram = word[index : index + self._q]
+            grams[gram] = grams.get(gram, 0) + 1
+        return grams
+
+    def _count_shared_grams(self, token: str) -> np.ndarray | None:
+        """
+        Count q-grams shared by the token and every vocabulary word.
+
+        Args:
+            token (str): Word to look up
+
+        Returns:
+            np.ndarray | None: Sizes of q-gram multiset intersections aligned with the words.
+
+        In case of corrupt input arguments or empty vocabulary, None is returned.
+        """
+        if not isinstance(token, str) or not self._words:
+            return None
+        shared = np.zeros(len(self._words), dtype=np.int64)
+        for gram, count in self._count_grams(token).items():
+            if gram in self._postings:
+                ids, counts = self._postings[gram]
+                shared[ids] += np.minimum(counts, count)
+        return shared
+
+    def _filter(self, length: int, shared: np.ndarray, distance: int) -> np.ndarray:
+        """
+        Apply the length and count filters.
+
+        Args:
+            length (int): Length of the token
+            shared (np.ndarray): Numbers of shared q-grams
+            distance (int): Largest allowed distance
+
+        Returns:
+            np.ndarray: Mask of words that pass both filters
+        """
+        threshold = np.maximum(self._lengths, length) - self._q + 1 - distance * self._q
+        return (np.abs(self._lengths - length) <= distance) & (shared >= threshold)
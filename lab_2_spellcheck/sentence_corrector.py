@@ -0,0 +1,212 @@
+"""
+Correction of whole sentences keeping their spacing and punctuation.
+"""
+
+import re
+from collections.abc import Iterable, Iterator
+from typing import Literal
+
+from lab_1_keywords_tfidf.main import check_list, check_positive_int
+from lab_2_spellcheck.vocabulary_indexes import VocabularyIndexes
+
+Method = Literal[
+    "jaccard", "frequency-based", "levenshtein", "jaro-winkler", "weighted-levenshtein"
+]
+Span = tuple[int, int, str]
+
+_CHUNK = re.compile(r"\S+")
+
+
+class SentenceCorrector:
+    """
+    Pipeline from raw sentences to corrected sentences.
+
+    Sentences are split into whitespace separated chunks as clean_and_tokenize
+    does, and the position of the letters of every token is kept. Out of
+    vocabulary tokens of a batch are corrected once each with the shared
+    indexes. A corrected sentence is assembled from slices of the original
+    between the replaced spans with a single join, so spacing, punctuation
+    and the capitalization of replaced words are preserved.
+    """
+
+    def __init__(
+        self,
+        indexes: VocabularyIndexes,
+        method: Method,
+        alphabet: list[str] | None = None,
+        stop_words: list[str] | None = None,
+    ) -> None:
+        """
+        Initialize an instance of the SentenceCorrector.
+
+        Args:
+            indexes (VocabularyIndexes): Vocabulary with its lookup structures
+            method (Method): Method to use for comparison
+            alphabet (list[str] | None): The alphabet with letters
+            stop_words (list[str] | None): Words that are never corrected
+        """
+        self._indexes = indexes if isinstance(indexes, VocabularyIndexes) else VocabularyIndexes({})
+        self._method = method
+        self._alphabet = alphabet
+        self._stop_words: set[str] = set()
+        if stop_words is not None and check_list(stop_words, str, True):
+            self._stop_words = set(stop_words)
+        self._statistics = {"sentences": 0, "tokens": 0, "out_of_vocab_words": 0, "corrections": 0}
+
+    @property
+    def statistics(self) -> dict[str, int]:
+        """
+        Get pipeline counters.
+
+        Returns:
+            dict[str, int]: Numbers of sentences, tokens, out of vocabulary tokens
+                and unique words passed to find_correct_word
+        """
+        return dict(self._statistics)
+
+    def correct(self, sentence: str) -> str | None:
+        """
+        Correct one sentence.
+
+        Args:
+            sentence (str): Text to correct
+
+        Returns:
+            str | None: Sentence with out of vocabulary words replaced.
+
+        In case of corrupt input arguments or empty vocabulary, None is returned.
+        """
+        corrected = self.correct_batch([sentence])
+        if corrected is None:
+            return None
+        return corrected[0]
+
+    def correct_batch(self, sentences: list[str]) -> list[str] | None:
+        """
+        Correct sentences, looking up every unique out of vocabulary word once.
+
+        Args:
+            sentences (list[str]): Texts to correct
+
+        Returns:
+            list[str] | None: Corrected sentences in the original order.
+
+        In case of corrupt input arguments or empty vocabulary, None is returned.
+        """
+        if not check_list(sentences, str, False) or not self._indexes.vocabulary:
+            return None
+        if not (self._alphabet is None or check_list(self._alphabet, str, True)):
+            return None
+        vocabulary = self._indexes.vocabulary
+        spans = [_find_spans(sentence) for sentence in sentences]
+        out_of_vocab = [
+            token
+            for sentence_spans in spans
+            for _, _, token in sentence_spans
+            if token not in vocabulary and token not in self._stop_words
+        ]
+        corrections = {
+            word: self._indexes.find_correct_word(word, self._method, self._alphabet)
+            for word in dict.fromkeys(out_of_vocab)
+        }
+        self._statistics["sentences"] += len(sentences)
+        self._statistics["tokens"] += sum(len(sentence_spans) for sentence_spans in spans)
+        self._statistics["out_of_vocab_words"] += len(out_of_vocab)
+        self._statistics["corrections"] += len(corrections)
+        return [
+            _replace(sentence, sentence_spans, corrections)
+            for sentence, sentence_spans in zip(sentences, spans)
+        ]
+
+    def iterate_corrections(self, sentences: Iterable[str], batch_size: int = 64) -> Iterator[str]:
+        """
+        Lazily correct a stream of sentences batch by batch.
+
+        Args:
+            sentences (Iterable[str]): Texts to correct
+            batch_size (int): Number of sentences sharing the lookups of unique words
+
+        Yields:
+            str: Corrected sentences in the original order; the stream stops at a
+                batch with corrupt sentences
+        """
+        if not check_positive_int(batch_size):
+            return
+        batch: list[str] = []
+        for sentence in sentences:
+            batch.append(sentence)
+            if len(batch) < batch_size:
+                continue
+            corrected = self.correct_batch(batch)
+            if corrected is None:
+                return
+            yield from corrected
+            batch = []
+        if batch:
+            yield from self.correct_batch(batch) or []
+
+
+def _find_spans(sentence: str) -> list[Span]:
+    """
+    Find tokens of clean_and_tokenize with the positions of their letters.
+
+    Args:
+        sentence (str): Text to split
+
+    Returns:
+        list[Span]: Start and end of the letters of every token and the token itself
+    """
+    spans = []
+    for chunk in _CHUNK.finditer(sentence):
+        positions = [
+            index for index in range(chunk.start(), chunk.end()) if sentence[index].isalnum()
+        ]
+        if positions:
+            token = "".join(sentence[index] for index in positions).lower()
+            spans.append((positions[0], positions[-1] + 1, token))
+    return spans
+
+
+def _replace(sentence: str, spans: list[Span], corrections: dict[str, str | None]) -> str:
+    """
+    Assemble the sentence with corrected tokens.
+
+    Args:
+        sentence (str): Original text
+        spans (list[Span]): Tokens of the text with their positions
+        corrections (dict[str, str | None]): Out of vocabulary words and their corrections
+
+    Returns:
+        str: Text with corrections in place of the misspelled tokens
+    """
+    pieces = []
+    position = 0
+    for start, end, token in spans:
+        correction = corrections.get(token)
+        if correction is None or correction == token:
+            continue
+        pieces.append(sentence[position:start])
+        pieces.append(_match_case(sentence[start:end], correction))
+        position = end
+    if not pieces:
+        return sentence
+    pieces.append(sentence[position:])
+    return "".join(pieces)
+
+
+def _match_case(original: str, correction: str) -> str:
+    """
+    Apply the capitalization of the original word to its correction.
+
+    Args:
+        original (str): Word as written in the text
+        correction (str): Lowercase correction
+
+    Returns:
+        str: Correction in upper case or capitalized if the original was
+    """
+    if len(original) > 1 and original.isupper():
+        return correction.upper()
+    if original[:1].isupper():
+        return correction[:1].upper() + correction[1:]
+    return correction
@@ -0,0 +1,273 @@
+"""
+Distance calculation over vocabulary shards held by persistent worker processes.
+"""
+
+import multiprocessing
+from heapq import nsmallest
+from multiprocessing.connection import Connection
+from types import TracebackType
+from typing import Literal
+
+from lab_1_keywords_tfidf.main import check_dict, check_list, check_positive_int
+from lab_2_spellcheck.main import _find_vocabulary_candidates, calculate_distance
+
+Method = Literal[
+    "jaccard", "frequency-based", "levenshtein", "jaro-winkler", "weighted-levenshtein"
+]
+Request = tuple[str, Method, list[str] | None, int | None, list[str] | None]
+
+_JOIN_TIMEOUT = 5.0
+
+
+class ShardedSpellchecker:
+    """
+    Vocabulary split into shards, one per worker process.
+
+    Words are dealt to shards in turn, so shards get similar numbers of words
+    of every length. Workers are started on the first query and serve queries
+    until close: every query is sent to all shards, each shard calculates
+    distances to its words with calculate_distance and answers with its local
+    top k, and the answers are merged with the tie-break rules of
+    choose_closest_words. For the frequency-based method the candidates of
+    the token are generated once by the coordinator, and shards only look
+    them up among their words. Forked workers inherit their shards, other
+    start methods receive them once at startup.
+    """
+
+    def __init__(self, vocabulary: dict[str, float], shards: int | None = None) -> None:
+        """
+        Initialize an instance of the ShardedSpellchecker.
+
+        Args:
+            vocabulary (dict[str, float]): Dictionary with words and their relative frequencies
+            shards (int | None): Number of shards and worker processes, None for the CPU count
+        """
+        self._vocabulary: dict[str, float] = {}
+        self._workers: list[tuple[multiprocessing.process.BaseProcess, Connection]] = []
+        if check_dict(vocabulary, str, float, False):
+            self._vocabulary = vocabulary
+        count = multiprocessing.cpu_count()
+        if shards is not None and check_positive_int(shards):
+            count = shards
+        self._shards = max(1, min(count, len(self._vocabulary)))
+
+    def __enter__(self) -> "ShardedSpellchecker":
+        """
+        Enter the context of the spellchecker.
+
+        Returns:
+            ShardedSpellchecker: The spellchecker itself
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """
+        Stop the workers.
+
+        Args:
+            exc_type (type[BaseException] | None): Type of the raised exception
+            exc_value (BaseException | None): Raised exception
+            traceback (TracebackType | None): Traceback of the raised exception
+        """
+        self.close()
+
+    @property
+    def shards(self) -> int:
+        """
+        Get the number of shards.
+
+        Returns:
+            int: Number of worker processes
+        """
+        return self._shards
+
+    def start(self) -> None:
+        """
+        Start a worker process for every shard unless they are running.
+        """
+        if self._workers or not self._vocabulary:
+            return
+        start_method = "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+        context = multiprocessing.get_context(start_method)
+        words = list(self._vocabulary)
+        for index in range(self._shards):
+            shard = {word: self._vocabulary[word] for word in words[index :: self._shards]}
+            connection, worker_connection = context.Pipe()
+            process = context.Process(
+                target=_serve_shard, args=(worker_connection, shard), daemon=True
+            )
+            process.start()
+            worker_connection.close()
+            self._workers.append((process, connection))
+
+    def close(self) -> None:
+        """
+        Stop the worker processes.
+        """
+        for process, connection in self._workers:
+            try:
+                connection.send(None)
+            except OSError:
+                pass
+            connection.close()
+            process.join(_JOIN_TIMEOUT)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        self._workers = []
+
+    def calculate_distance(
+        self, first_token: str, method: Method, alphabet: list[str] | None = None
+    ) -> dict[str, float] | None:
+        """
+        Calculate distances to all vocabulary words with the result of calculate_distance.
+
+        Args:
+            first_token (str): First string to compare
+            method (Method): Method to use for comparison
+            alphabet (list[str] | None): The alphabet with letters
+
+        Returns:
+            dict[str, float] | None: Vocabulary words and distances to them.
+
+        In case of corrupt input arguments, unsupported method or empty vocabulary,
+        None is returned.
+        """
+        answers = self._query((first_token, method, alphabet, None, None))
+        if answers is None:
+            return None
+        return {word: distance for answer in answers for distance, word in answer}
+
+    def suggest(
+        self, wrong_word: str, method: Method, k: int, alphabet: list[str] | None = None
+    ) -> list[str] | None:
+        """
+        Find k closest words with the result of suggest.
+
+        Args:
+            wrong_word (str): Word that might be misspelled
+            method (Method): Method to use for comparison
+            k (int): Number of words to find
+            alphabet (list[str] | None): The alphabet with letters
+
+        Returns:
+            list[str] | None: Words ordered by distance, then by closeness in length,
+                then lexicographically.
+
+        In case of corrupt input arguments, unsupported method or empty vocabulary,
+        None is returned.
+        """
+        if not check_positive_int(k):
+            return None
+        answers = self._query((wrong_word, method, alphabet, k, None))
+        if answers is None:
+            return None
+        best = nsmallest(
+            k,
+            (candidate for answer in answers for candidate in answer),
+            key=lambda candidate: _rank(wrong_word, candidate),
+        )
+        return [word for _, word in best]
+
+    def find_correct_word(
+        self, wrong_word: str, method: Method, alphabet: list[str] | None = None
+    ) -> str | None:
+        """
+        Find the closest word with the result of find_correct_word.
+
+        Args:
+            wrong_word (str): Word that might be misspelled
+            method (Method): Method to use for comparison
+            alphabet (list[str] | None): The alphabet with letters
+
+        Returns:
+            str | None: The most similar word.
+
+        In case of corrupt input arguments, unsupported method or empty vocabulary,
+        None is returned.
+        """
+        closest = self.suggest(wrong_word, method, 1, alphabet)
+        if not closest:
+            return None
+        return closest[0]
+
+    def _query(self, request: Request) -> list[list[tuple[float, str]]] | None:
+        """
+        Send a request to every shard and collect the answers.
+
+        Args:
+            request (Request): Token, method, alphabet, number of words to keep
+                and vocabulary candidates, the latter filled in for the
+                frequency-based method
+
+        Returns:
+            list[list[tuple[float, str]]] | None: Distances and words of every shard.
+
+        In case of corrupt input arguments, unsupported method or empty vocabulary,
+        None is returned.
+        """
+        token, method, alphabet, k, _ = request
+        if not self._vocabulary or not (alphabet is None or check_list(alphabet, str, True)):
+            return None
+        if method == "frequency-based":
+            if not isinstance(token, str) or alphabet is None:
+                return None
+            candidates = _find_vocabulary_candidates(token, alphabet, self._vocabulary)
+            request = (token, method, None, k, sorted(candidates))
+        self.start()
+        for _, connection in self._workers:
+            connection.send(request)
+        answers = [connection.recv() for _, connection in self._workers]
+        if any(answer is None for answer in answers):
+            return None
+        return answers
+
+
+def _rank(wrong_word: str, candidate: tuple[float, str]) -> tuple[float, int, str]:
+    """
+    Build the sort key of choose_closest_words.
+
+    Args:
+        wrong_word (str): Word that might be misspelled
+        candidate (tuple[float, str]): Distance and word
+
+    Returns:
+        tuple[float, int, str]: Distance, difference in length and the word
+    """
+    distance, word = candidate
+    return distance, abs(len(word) - len(wrong_word)), word
+
+
+def _serve_shard(connection: Connection, shard: dict[str, float]) -> None:
+    """
+    Answer requests against a shard until the stop signal.
+
+    Args:
+        connection (Connection): End of the pipe to the coordinator
+        shard (dict[str, float]): Words of the shard and their relative frequencies
+    """
+    while True:
+        try:
+            request = connection.recv()
+        except EOFError:
+            return
+        if request is None:
+            return
+        token, method, alphabet, k, candidates = request
+        if candidates is None:
+            distances = calculate_distance(token, shard, method, alphabet)
+        else:
+            distances = dict.fromkeys(shard, 1.0)
+            distances.update((word, shard[word]) for word in candidates if word in shard)
+        if distances is None:
+            connection.send(None)
+            continue
+        candidates = [(distance, word) for word, distance in distances.items()]
+        if k is not None:
+            candidates = nsmallest(k, candidates, key=lambda candidate: _rank(token, candidate))
+        connection.send(candidates)
@@ -0,0 +1,414 @@
+"""
+Long-lived spellcheck service speaking JSON Lines over stdin/stdout or TCP.
+
+Every request line is a JSON object ``{"id": ..., "text": "..."}`` and gets the
+response line ``{"id": ..., "corrections": {"wrong": "correct", ...}}`` in the
+order of requests; ``corrections`` is null for malformed requests and for
+requests whose batch failed, the latter response also having an ``error``.
+The request line ``{"id": ..., "stats": true}`` gets the current counters,
+latency percentiles and throughput as ``{"id": ..., "statistics": {...}}``.
+"""
+
+import asyncio
+import json
+import math
+import signal
+import sys
+from argparse import ArgumentParser
+from collections import deque
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Literal
+
+from lab_1_keywords_tfidf.main import (
+    check_list,
+    check_positive_int,
+    clean_and_tokenize,
+    remove_stop_words,
+)
+from lab_2_spellcheck.main import build_vocabulary, find_out_of_vocab_words
+from lab_2_spellcheck.vocabulary_indexes import VocabularyIndexes
+
+ASSETS_PATH = Path(__file__).parent / "assets"
+LATENCY_WINDOW = 4096
+
+Method = Literal[
+    "jaccard", "frequency-based", "levenshtein", "jaro-winkler", "weighted-levenshtein"
+]
+Request = tuple[list[str], "asyncio.Future[dict[str, str]]", float]
+
+
+class SpellcheckService:
+    """
+    Corrects texts in micro-batches against vocabulary indexes kept in memory.
+
+    Requests wait in a bounded queue; when it is full, producers are suspended,
+    so a client that sends faster than the service corrects stops being read.
+    The batcher takes the first waiting request, collects more for at most
+    ``max_delay`` seconds or up to ``max_batch_size`` requests, and corrects
+    every unique out-of-vocabulary word of the batch once. If correcting a
+    batch fails, its requests get the error and the batcher goes on.
+    """
+
+    def __init__(
+        self,
+        indexes: VocabularyIndexes,
+        method: Method,
+        alphabet: list[str] | None = None,
+        stop_words: list[str] | None = None,
+    ) -> None:
+        """
+        Initialize an instance of the SpellcheckService.
+
+        Args:
+            indexes (VocabularyIndexes): Vocabulary with its lookup structures
+            method (Method): Method to use for comparison
+            alphabet (list[str] | None): The alphabet with letters
+            stop_words (list[str] | None): Words removed before the check
+        """
+        self._indexes = indexes
+        self._method = method
+        self._alphabet = alphabet
+        self._stop_words = stop_words or []
+        self._batching = (64, 0.002)
+        self._queue: asyncio.Queue[Request] = asyncio.Queue(maxsize=1024)
+        self._batcher: asyncio.Task[None] | None = None
+        self._latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._counters = {
+            "requests": 0,
+            "batches": 0,
+            "words": 0,
+            "corrected_words": 0,
+            "failed_requests": 0,
+        }
+        self._started = 0.0
+
+    @property
+    def statistics(self) -> dict[str, float]:
+        """
+        Get latency and throughput of the served requests.
+
+        Returns:
+            dict[str, float]: Numbers of served requests, batches, out-of-vocabulary
+                and corrected words and failed requests, p50 and p99 latency in
+                milliseconds over the last LATENCY_WINDOW requests and requests per second
+        """
+        elapsed = perf_counter() - self._started if self._started else 0.0
+        ordered = sorted(self._latencies)
+        return {
+            **{name: float(value) for name, value in self._counters.items()},
+            "p50_ms": _percentile(ordered, 50) * 1000,
+            "p99_ms": _percentile(ordered, 99) * 1000,
+            "requests_per_second": self._counters["requests"] / elapsed if elapsed else 0.0,
+        }
+
+    async def start(
+        self, max_batch_size: int = 64, max_delay: float = 0.002, max_queue_size: int = 1024
+    ) -> None:
+        """
+        Build the indexes and launch the batcher.
+
+        Args:
+            max_batch_size (int): Largest number of requests in a batch
+            max_delay (float): Seconds to wait for more requests after the first one
+            max_queue_size (int): Number of requests waiting before producers are suspended
+        """
+        self._indexes.build(self._method)
+        self._batching = (max_batch_size, max_delay)
+        self._queue = asyncio.Queue(maxsize=max_queue_size)
+        self._started = perf_counter()
+        self._batcher = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Finish the waiting requests and stop the batcher.
+        """
+        await self._queue.join()
+        if self._batcher is not None:
+            self._batcher.cancel()
+            await asyncio.gather(self._batcher, return_exceptions=True)
+            self._batcher = None
+
+    async def correct(self, text: str) -> dict[str, str] | None:
+        """
+        Find corrections of out-of-vocabulary words of the text.
+
+        Args:
+            text (str): Text to check
+
+        Returns:
+            dict[str, str] | None: Out-of-vocabulary words and their corrections.
+
+        In case of corrupt input arguments, None is returned. If correcting the
+        batch of the request fails, its error is raised.
+
+        Raises:
+            RuntimeError: If the service is not started
+        """
+        if self._batcher is None:
+            raise RuntimeError("spellcheck service is not started")
+        tokens = clean_and_tokenize(text)
+        if tokens is None:
+            return None
+        tokens = remove_stop_words(tokens, self._stop_words) if self._stop_words else tokens
+        out_of_vocab = find_out_of_vocab_words(tokens, self._indexes.vocabulary) if tokens else []
+        if out_of_vocab is None:
+            return None
+        future: asyncio.Future[dict[str, str]] = asyncio.get_running_loop().create_future()
+        await self._queue.put((out_of_vocab, future, perf_counter()))
+        return await future
+
+    async def _run(self) -> None:
+        """
+        Collect waiting requests into batches and correct them.
+        """
+        loop = asyncio.get_running_loop()
+        max_batch_size, max_delay = self._batching
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + max_delay
+            while len(batch) < max_batch_size:
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), deadline - loop.time()))
+                except asyncio.TimeoutError:
+                    break
+            unique_words = sorted({word for words, _, _ in batch for word in words})
+            try:
+                corrections = await asyncio.to_thread(self._correct_words, unique_words)
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                self._fail(batch, error)
+                continue
+            finished = perf_counter()
+            for words, future, received in batch:
+                if not future.done():
+                    future.set_result(
+                        {word: corrections[word] for word in words if word in corrections}
+                    )
+                self._latencies.append(finished - received)
+                self._queue.task_done()
+            self._counters["requests"] += len(batch)
+            self._counters["batches"] += 1
+            self._counters["words"] += sum(len(words) for words, _, _ in batch)
+            self._counters["corrected_words"] += len(unique_words)
+
+    def _fail(self, batch: list[Request], error: Exception) -> None:
+        """
+        Pass the error of a batch to its requests.
+
+        Args:
+            batch (list[Request]): Requests of the failed batch
+            error (Exception): Raised error
+        """
+        for _, future, _ in batch:
+            if not future.done():
+                future.set_exception(error)
+            self._queue.task_done()
+        self._counters["failed_requests"] += len(batch)
+
+    def _correct_words(self, words: list[str]) -> dict[str, str]:
+        """
+        Correct unique words of a batch.
+
+        Args:
+            words (list[str]): Unique out-of-vocabulary words
+
+        Returns:
+            dict[str, str]: Words that have a correction and their corrections
+        """
+        corrections = {}
+        for word in words:
+            correction = self._indexes.find_correct_word(word, self._method, self._alphabet)
+            if correction is not None:
+                corrections[word] = correction
+        return corrections
+
+
+async def serve_lines(
+    service: SpellcheckService,
+    reader: asyncio.StreamReader,
+    send: Callable[[str], Awaitable[None]],
+    max_pending: int = 256,
+) -> None:
+    """
+    Answer JSON Lines requests read from the stream until it ends.
+
+    Requests of one stream are corrected concurrently, so they share batches,
+    while responses are sent in the order of requests. At most max_pending
+    requests are in flight before reading is suspended. If sending a response
+    fails, reading stops, the requests in flight are cancelled and the error
+    of send is raised.
+
+    Args:
+        service (SpellcheckService): Started spellcheck service
+        reader (asyncio.StreamReader): Stream of request lines
+        send (Callable[[str], Awaitable[None]]): Coroutine writing a response line
+        max_pending (int): Number of requests in flight
+    """
+    pending: asyncio.Queue[asyncio.Task[str] | None] = asyncio.Queue(maxsize=max_pending)
+    reading = asyncio.current_task()
+
+    async def respond() -> None:
+        while (task := await pending.get()) is not None:
+            await send(await task)
+
+    def stop_reading(responder: asyncio.Task[None]) -> None:
+        if reading is not None and not responder.cancelled() and responder.exception():
+            reading.cancel()
+
+    responder = asyncio.create_task(respond())
+    responder.add_done_callback(stop_reading)
+    try:
+        while line := await reader.readline():
+            if line.strip():
+                await pending.put(asyncio.create_task(_answer(service, line)))
+        await pending.put(None)
+        await responder
+    except asyncio.CancelledError:
+        if not responder.done() or responder.cancelled():
+            raise
+        if reading is not None:
+            reading.uncancel()
+    finally:
+        responder.cancel()
+        while not pending.empty():
+            if (task := pending.get_nowait()) is not None:
+                task.cancel()
+    await responder
+
+
+async def _answer(service: SpellcheckService, line: bytes) -> str:
+    """
+    Answer one request line.
+
+    Args:
+        service (SpellcheckService): Started spellcheck service
+        line (bytes): JSON request
+
+    Returns:
+        str: JSON response
+    """
+    request: Any = None
+    try:
+        request = json.loads(line)
+    except ValueError:
+        pass
+    if not isinstance(request, dict):
+        return json.dumps({"id": None, "corrections": None})
+    if request.get("stats") is True:
+        return json.dumps({"id": request.get("id"), "statistics": service.statistics})
+    response = {"id": request.get("id"), "corrections": None}
+    if isinstance(request.get("text"), str):
+        try:
+            response["corrections"] = await service.correct(request["text"])
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            response["error"] = str(error) or type(error).__name__
+    return json.dumps(response, ensure_ascii=False)
+
+
+def _percentile(ordered: list[float], rank: float) -> float:
+    """
+    Get the nearest-rank percentile of sorted values.
+
+    Args:
+        ordered (list[float]): Sorted values
+        rank (float): Percentile in range (0, 100]
+
+    Returns:
+        float: Percentile, 0.0 for no values
+    """
+    if not ordered:
+        return 0.0
+    return ordered[max(math.ceil(rank / 100 * len(ordered)) - 1, 0)]
+
+
+async def _serve(service: SpellcheckService, port: int | None) -> None:
+    """
+    Serve stdin/stdout or TCP connections on localhost until SIGINT or SIGTERM.
+
+    Args:
+        service (SpellcheckService): Spellcheck service
+        port (int | None): TCP port, None for stdin/stdout
+    """
+    await service.start()
+    loop = asyncio.get_running_loop()
+    serving = asyncio.current_task()
+    for signal_number in (signal.SIGINT, signal.SIGTERM):
+        if serving is not None:
+            loop.add_signal_handler(signal_number, serving.cancel)
+    try:
+        if port is None:
+            reader = asyncio.StreamReader()
+            await loop.connect_read_pipe(
+                lambda: asyncio.StreamReaderProtocol(reader), sys.stdin.buffer
+            )
+
+            async def send_stdout(response: str) -> None:
+                sys.stdout.write(response + "\n")
+                sys.stdout.flush()
+
+            await serve_lines(service, reader, send_stdout)
+            return
+
+        async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            async def send(response: str) -> None:
+                writer.write(response.encode("utf-8") + b"\n")
+                await writer.drain()
+
+            try:
+                await serve_lines(service, reader, send)
+            except ConnectionError:
+                pass
+            finally:
+                writer.close()
+
+        server = await asyncio.start_server(handle, "127.0.0.1", port)
+        async with server:
+            await server.serve_forever()
+    except asyncio.CancelledError:
+        pass
+    finally:
+        await service.stop()
+        print(json.dumps(service.statistics), file=sys.stderr)
+
+
+def main() -> None:
+    """
+    Launches the service.
+    """
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--method",
+        choices=(
+            "jaccard",
+            "frequency-based",
+            "levenshtein",
+            "jaro-winkler",
+            "weighted-levenshtein",
+        ),
+        default="levenshtein",
+    )
+    parser.add_argument("--port", type=int, help="serve TCP on localhost instead of stdin")
+    parser.add_argument(
+        "--vocabulary", type=Path, default=ASSETS_PATH / "Master_and_Margarita_chapter1.txt"
+    )
+    parser.add_argument("--stop-words", type=Path, default=ASSETS_PATH / "stop_words.txt")
+    arguments = parser.parse_args()
+
+    with open(arguments.stop_words, "r", encoding="utf-8") as file:
+        stop_words = file.read().split("\n")
+    with open(arguments.vocabulary, "r", encoding="utf-8") as file:
+        tokens = remove_stop_words(clean_and_tokenize(file.read()) or [], stop_words) or []
+    vocabulary = build_vocabulary(tokens) or {}
+    alphabet = sorted({letter for word in vocabulary for letter in word if letter.isalpha()})
+    if not check_list(alphabet, str, False) or not (
+        arguments.port is None or check_positive_int(arguments.port)
+    ):
+        parser.error("empty vocabulary or wrong port")
+    service = SpellcheckService(
+        VocabularyIndexes(vocabulary), arguments.method, alphabet, stop_words
+    )
+    asyncio.run(_serve(service, arguments.port))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Checks the second lab batch spellchecking
+"""
+
+# pylint: disable=duplicate-code
+
+import unittest
+
+import pytest
+
+from lab_1_keywords_tfidf.main import clean_and_tokenize
+from lab_2_spellcheck.batch_spellcheck import spellcheck_documents
+from lab_2_spellcheck.main import find_correct_word, find_out_of_vocab_words
+from lab_2_spellcheck.vocabulary_indexes import VocabularyIndexes
+
+
+class BatchSpellcheckTest(unittest.TestCase):
+    """
+    Tests spellchecking of document batches.
+    """
+
+    def setUp(self) -> None:
+        self.vocabulary = {
+            "35": 0.04,
+            "across": 0.08,
+            "boy": 0.04,
+            "cat": 0.16,
+            "coffee": 0.04,
+            "friend": 0.04,
+            "kind": 0.04,
+            "library": 0.12,
+            "lived": 0.04,
+            "loved": 0.08,
+            "named": 0.04,
+            "opened": 0.04,
+            "shops": 0.04,
+            "smart": 0.04,
+            "stories": 0.04,
+            "stories101": 0.04,
+            "street": 0.08,
+        }
+
+        self.documents = [
+            "The boyi lived on the streat.",
+            "A cta loved coffe, the boyi said.",
+            "",
+            "The library opened.",
+        ]
+        self.indexes = VocabularyIndexes(self.vocabulary)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_spellcheck_documents_ideal(self):
+        """
+        Ideal scenario
+        """
+        for method in ["jaccard", "levenshtein", "jaro-winkler"]:
+            expected = []
+            for document in self.documents:
+                tokens = clean_and_tokenize(document)
+                out_of_vocab = find_out_of_vocab_words(tokens, self.vocabulary) if tokens else []
+                expected.append(
+                    {
+                        word: find_correct_word(word, self.vocabulary, method)
+                        for word in out_of_vocab
+                    }
+                )
+            for processes in (1, 2):
+                result = spellcheck_documents(
+                    self.documents, self.indexes, method, processes=processes
+                )
+                self.assertIsNotNone(result)
+                corrections, _ = result
+                self.assertListEqual(corrections, expected)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_spellcheck_documents_statistics(self):
+        """
+        Out-of-vocabulary words are deduplicated across the batch
+        """
+        result = spellcheck_documents(
+            self.documents, self.indexes, "levenshtein", stop_words=["the", "a"], processes=1
+        )
+        self.assertIsNotNone(result)
+        corrections, statistics = result
+        self.assertDictEqual(corrections[0], {"boyi": "boy", "on": "35", "streat": "street"})
+        self.assertEqual(statistics["documents"], 4)
+        self.assertEqual(statistics["tokens"], 11)
+        self.assertEqual(statistics["out_of_vocab_words"], 7)
+        self.assertEqual(statistics["unique_out_of_vocab_words"], 6)
+        self.assertGreater(statistics["seconds"], 0)
+        self.assertGreater(statistics["words_per_second"], 0)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_spellcheck_documents_bad_input(self):
+        """
+        Bad input scenario
+        """
+        for bad_input in [None, True, 42, 3.14, (), "document", {}, [1]]:
+            self.assertIsNone(spellcheck_documents(bad_input, self.indexes, "jaccard"))
+        for bad_input in [None, True, 42, 3.14, (), "document", {}, [], self.vocabulary]:
+            self.assertIsNone(spellcheck_documents(self.documents, bad_input, "jaccard"))
+        self.assertIsNone(spellcheck_documents(self.documents, VocabularyIndexes({}), "jaccard"))
+        for bad_processes in [0, -1, True, 3.14, "2"]:
+            self.assertIsNone(
+                spellcheck_documents(
+                    self.documents, self.indexes, "jaccard", processes=bad_processes
+                )
+            )
+        self.assertIsNone(spellcheck_documents(self.documents, self.indexes, "jaccard", "abc"))
+        self.assertIsNone(
+            spellcheck_documents(self.documents, self.indexes, "jaccard", stop_words="the")
+        )
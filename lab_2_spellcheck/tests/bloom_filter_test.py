@@ -0,0 +1,124 @@
+"""
+Checks the second lab Bloom filter
+"""
+
+# pylint: disable=duplicate-code
+
+import random
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from lab_2_spellcheck.bloom_filter import BloomFilter
+from lab_2_spellcheck.compact_vocabulary import CompactVocabulary
+from lab_2_spellcheck.main import find_out_of_vocab_words
+
+
+class BloomFilterTest(unittest.TestCase):
+    """
+    Tests out of vocabulary prefiltering.
+    """
+
+    def setUp(self) -> None:
+        self.vocabulary = {
+            "35": 0.04,
+            "across": 0.08,
+            "boy": 0.04,
+            "cat": 0.16,
+            "coffee": 0.04,
+            "friend": 0.04,
+            "kind": 0.04,
+            "library": 0.12,
+            "lived": 0.04,
+            "loved": 0.08,
+            "named": 0.04,
+            "opened": 0.04,
+            "shops": 0.04,
+            "smart": 0.04,
+            "stories": 0.04,
+            "stories101": 0.04,
+            "street": 0.08,
+        }
+        self.tokens = ["cat", "cta", "library", "libary", "35", "36", "street", "streat"]
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_find_out_of_vocab_words_ideal(self):
+        """
+        Ideal scenario
+        """
+        bloom_filter = BloomFilter(self.vocabulary)
+        for word in self.vocabulary:
+            self.assertIn(word, bloom_filter)
+        expected = find_out_of_vocab_words(self.tokens, self.vocabulary)
+        self.assertEqual(
+            bloom_filter.find_out_of_vocab_words(self.tokens, self.vocabulary), expected
+        )
+        self.assertEqual(
+            bloom_filter.find_out_of_vocab_words(self.tokens, CompactVocabulary(self.vocabulary)),
+            expected,
+        )
+        statistics = bloom_filter.statistics
+        self.assertEqual(statistics["definite"] + statistics["verified"], 2 * len(self.tokens))
+        self.assertGreaterEqual(statistics["verified"], 2 * 4)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_false_positive_rate(self):
+        """
+        False positives stay close to the target rate
+        """
+        generator = random.Random(42)
+        vocabulary = {"".join(generator.choices("abcdefghij", k=8)): 0.001 for _ in range(1000)}
+        bloom_filter = BloomFilter(vocabulary, 0.01)
+        self.assertLess(bloom_filter.nbytes, 1000 * 10 // 8 + 8)
+        for word in vocabulary:
+            self.assertIn(word, bloom_filter)
+        absent = [f"{index}-absent" for index in range(5000)]
+        false_positives = sum(1 for word in absent if word in bloom_filter)
+        self.assertLess(false_positives / len(absent), 0.02)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_save_load(self):
+        """
+        Filter is restored from the disk
+        """
+        bloom_filter = BloomFilter(self.vocabulary, key="version")
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / "vocabulary.bloom"
+            bloom_filter.save(path)
+            loaded = BloomFilter.load(path)
+            self.assertIsNotNone(loaded)
+            self.assertEqual(loaded.key, "version")
+            self.assertEqual(
+                loaded.find_out_of_vocab_words(self.tokens, self.vocabulary),
+                bloom_filter.find_out_of_vocab_words(self.tokens, self.vocabulary),
+            )
+            self.assertIsNotNone(BloomFilter.load(path, "version"))
+            self.assertIsNone(BloomFilter.load(path, "other"))
+
+            path.write_bytes(path.read_bytes()[:-1])
+            self.assertIsNone(BloomFilter.load(path))
+            path.write_bytes(b"corrupt")
+            self.assertIsNone(BloomFilter.load(path))
+            self.assertIsNone(BloomFilter.load(Path(directory) / "missing.bloom"))
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_bloom_filter_bad_input(self):
+        """
+        Bad input scenario
+        """
+        bloom_filter = BloomFilter(self.vocabulary)
+        self.assertNotIn(None, bloom_filter)
+        self.assertIsNone(bloom_filter.find_out_of_vocab_words(None, self.vocabulary))
+        self.assertIsNone(bloom_filter.find_out_of_vocab_words([], self.vocabulary))
+        self.assertIsNone(bloom_filter.find_out_of_vocab_words(self.tokens, {}))
+        self.assertIsNone(bloom_filter.find_out_of_vocab_words(self.tokens, ["cat"]))
+
+        empty = BloomFilter(None)
+        self.assertNotIn("cat", empty)
+        self.assertNotIn("cat", BloomFilter(self.vocabulary, 1.5))
@@ -0,0 +1,133 @@
+"""
+Checks the second lab compact vocabulary
+"""
+
+# pylint: disable=duplicate-code
+
+import pickle
+import unittest
+
+import pytest
+
+from lab_2_spellcheck.compact_vocabulary import CompactVocabulary
+from lab_2_spellcheck.main import calculate_distance, find_out_of_vocab_words
+
+
+class CompactVocabularyTest(unittest.TestCase):
+    """
+    Tests the array-backed vocabulary.
+    """
+
+    def setUp(self) -> None:
+        self.vocabulary = {
+            "35": 0.04,
+            "across": 0.08,
+            "boy": 0.04,
+            "cat": 0.16,
+            "coffee": 0.04,
+            "friend": 0.04,
+            "kind": 0.04,
+            "library": 0.12,
+            "lived": 0.04,
+            "loved": 0.08,
+            "named": 0.04,
+            "opened": 0.04,
+            "shops": 0.04,
+            "smart": 0.04,
+            "stories": 0.04,
+            "stories101": 0.04,
+            "street": 0.08,
+        }
+        self.compact = CompactVocabulary(self.vocabulary)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_compact_vocabulary_mapping(self):
+        """
+        Ideal scenario
+        """
+        self.assertEqual(len(self.compact), len(self.vocabulary))
+        self.assertEqual(list(self.compact), sorted(self.vocabulary))
+        for word, frequency in self.vocabulary.items():
+            self.assertIn(word, self.compact)
+            self.assertAlmostEqual(self.compact[word], frequency)
+        self.assertNotIn("cta", self.compact)
+        self.assertNotIn("", self.compact)
+        self.assertNotIn(35, self.compact)
+        self.assertIsNone(self.compact.get("cta"))
+        self.assertRaises(KeyError, self.compact.__getitem__, "stories1")
+        self.assertEqual(self.compact.nbytes, 91 + 18 * 8 + 17 * 4)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_compact_vocabulary_unicode(self):
+        """
+        Cyrillic words are found in order of code points
+        """
+        vocabulary = {"ёж": 0.25, "ель": 0.25, "яма": 0.25, "жук": 0.25}
+        compact = CompactVocabulary(vocabulary)
+        self.assertEqual(list(compact), sorted(vocabulary))
+        for word in vocabulary:
+            self.assertIn(word, compact)
+        self.assertNotIn("еж", compact)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_find_out_of_vocab_words(self):
+        """
+        Out of vocabulary words match find_out_of_vocab_words
+        """
+        tokens = ["cat", "cta", "library", "libary", "35", "36"]
+        self.assertEqual(
+            self.compact.find_out_of_vocab_words(tokens),
+            find_out_of_vocab_words(tokens, self.vocabulary),
+        )
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_calculate_distance(self):
+        """
+        Distances match calculate_distance
+        """
+        alphabet = list("abcdefghijklmnopqrstuvwxyz")
+        for method in (
+            "jaccard",
+            "frequency-based",
+            "levenshtein",
+            "jaro-winkler",
+            "weighted-levenshtein",
+        ):
+            for token in ("lovd", "stories", "cta", ""):
+                expected = calculate_distance(token, self.vocabulary, method, alphabet)
+                actual = self.compact.calculate_distance(token, method, alphabet)
+                self.assertEqual(set(actual), set(expected))
+                for word, distance in expected.items():
+                    self.assertAlmostEqual(actual[word], distance)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_compact_vocabulary_pickle(self):
+        """
+        Vocabulary survives transfer to worker processes
+        """
+        restored = pickle.loads(pickle.dumps(self.compact))
+        self.assertEqual(dict(restored), dict(self.compact))
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_compact_vocabulary_bad_input(self):
+        """
+        Bad input scenario
+        """
+        empty = CompactVocabulary(None)
+        self.assertEqual(len(empty), 0)
+        self.assertNotIn("cat", empty)
+        self.assertIsNone(empty.find_out_of_vocab_words(["cat"]))
+        self.assertIsNone(empty.calculate_distance("cat", "levenshtein"))
+
+        self.assertIsNone(self.compact.find_out_of_vocab_words([]))
+        self.assertIsNone(self.compact.find_out_of_vocab_words(None))
+        self.assertIsNone(self.compact.calculate_distance(None, "levenshtein"))
+        self.assertIsNone(self.compact.calculate_distance("cat", "unknown"))
+        self.assertIsNone(self.compact.calculate_distance("cat", "frequency-based"))
+        self.assertIsNone(self.compact.calculate_distance("cat", "frequency-based", [1]))
@@ -0,0 +1,248 @@
+"""
+Checks the second lab correction cache
+"""
+
+# pylint: disable=duplicate-code
+
+import sqlite3
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from lab_2_spellcheck.correction_cache import (
+    CorrectionCache,
+    fingerprint_vocabulary,
+    VersionedVocabulary,
+)
+from lab_2_spellcheck.main import find_correct_word
+
+
+class CorrectionCacheTest(unittest.TestCase):
+    """
+    Tests cached word correction.
+    """
+
+    def setUp(self) -> None:
+        self.vocabulary = {
+            "35": 0.04,
+            "across": 0.08,
+            "boy": 0.04,
+            "cat": 0.16,
+            "coffee": 0.04,
+            "friend": 0.04,
+            "kind": 0.04,
+            "library": 0.12,
+            "lived": 0.04,
+            "loved": 0.08,
+            "named": 0.04,
+            "opened": 0.04,
+            "shops": 0.04,
+            "smart": 0.04,
+            "stories": 0.04,
+            "stories101": 0.04,
+            "street": 0.08,
+        }
+
+        self.misspelled = ["boyi", "streat", "coffe", "cta"]
+        self.methods = [
+            "jaccard",
+            "frequency-based",
+            "levenshtein",
+            "jaro-winkler",
+            "weighted-levenshtein",
+        ]
+        self.alphabet_en = list("abcdefghijklmnopqrstuvwxyz")
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_find_correct_word_ideal(self):
+        """
+        Ideal scenario
+        """
+        cache = CorrectionCache()
+        for _ in range(2):
+            for method in self.methods:
+                for misspelled in self.misspelled:
+                    self.assertEqual(
+                        cache.find_correct_word(
+                            misspelled, self.vocabulary, method, self.alphabet_en
+                        ),
+                        find_correct_word(misspelled, self.vocabulary, method, self.alphabet_en),
+                    )
+        self.assertDictEqual(
+            cache.statistics,
+            {
+                "hits": 20,
+                "disk_hits": 0,
+                "misses": 20,
+                "evictions": 0,
+                "invalidations": 0,
+                "disk_errors": 0,
+            },
+        )
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_find_correct_word_key(self):
+        """
+        Method and alphabet are parts of the key
+        """
+        cache = CorrectionCache()
+        cache.find_correct_word("cta", self.vocabulary, "levenshtein")
+        cache.find_correct_word("cta", self.vocabulary, "jaccard")
+        cache.find_correct_word("cta", self.vocabulary, "levenshtein", self.alphabet_en)
+        self.assertEqual(cache.statistics["misses"], 3)
+        self.assertEqual(cache.statistics["hits"], 0)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_find_correct_word_eviction(self):
+        """
+        Least recently used entries are evicted
+        """
+        cache = CorrectionCache(max_size=2)
+        cache.find_correct_word("boyi", self.vocabulary, "levenshtein")
+        cache.find_correct_word("streat", self.vocabulary, "levenshtein")
+        cache.find_correct_word("boyi", self.vocabulary, "levenshtein")
+        cache.find_correct_word("coffe", self.vocabulary, "levenshtein")
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.statistics["evictions"], 1)
+
+        cache.find_correct_word("boyi", self.vocabulary, "levenshtein")
+        self.assertEqual(cache.statistics["hits"], 2)
+        cache.find_correct_word("streat", self.vocabulary, "levenshtein")
+        self.assertEqual(cache.statistics["misses"], 4)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_find_correct_word_vocabulary_change(self):
+        """
+        Changing the vocabulary in place invalidates corrections
+        """
+        cache = CorrectionCache()
+        vocabulary = {"cat": 0.5, "dog": 0.5}
+        self.assertEqual(cache.find_correct_word("cot", vocabulary, "levenshtein"), "cat")
+
+        del vocabulary["cat"]
+        vocabulary["cot"] = 0.5
+        self.assertEqual(cache.find_correct_word("cot", vocabulary, "levenshtein"), "cot")
+        self.assertEqual(cache.statistics["invalidations"], 1)
+        self.assertEqual(cache.statistics["hits"], 0)
+
+        self.assertEqual(cache.find_correct_word("cot", vocabulary, "levenshtein"), "cot")
+        self.assertEqual(cache.statistics["hits"], 1)
+
+        self.assertEqual(cache.find_correct_word("lovd", self.vocabulary, "levenshtein"), "loved")
+        self.assertEqual(cache.statistics["invalidations"], 2)
+        self.assertEqual(len(cache), 3)
+        cache.prune()
+        self.assertEqual(len(cache), 1)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_find_correct_word_versioned_vocabulary(self):
+        """
+        Changes of a versioned vocabulary are seen from its version
+        """
+        cache = CorrectionCache()
+        vocabulary = VersionedVocabulary(self.vocabulary)
+        self.assertEqual(cache.find_correct_word("lovd", vocabulary, "levenshtein"), "loved")
+        self.assertEqual(cache.find_correct_word("lovd", vocabulary, "levenshtein"), "loved")
+        self.assertEqual(cache.statistics["hits"], 1)
+
+        vocabulary["lord"] = 0.5
+        self.assertEqual(vocabulary.version, 1)
+        self.assertEqual(cache.find_correct_word("lovd", vocabulary, "levenshtein"), "lord")
+        vocabulary.pop("lord")
+        self.assertEqual(cache.find_correct_word("lovd", vocabulary, "levenshtein"), "loved")
+        self.assertEqual(cache.statistics["hits"], 2)
+        vocabulary |= {"lord": 0.01}
+        self.assertEqual(vocabulary.version, 3)
+        self.assertEqual(cache.find_correct_word("lovd", vocabulary, "levenshtein"), "lord")
+        self.assertEqual(cache.statistics["invalidations"], 3)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_find_correct_word_locked_store(self):
+        """
+        Corrections are committed at once and a locked store is skipped
+        """
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / "corrections.sqlite"
+            with CorrectionCache(path=path) as first, CorrectionCache(path=path) as second:
+                self.assertEqual(first.find_correct_word("cta", self.vocabulary, "jaccard"), "cat")
+                self.assertEqual(second.find_correct_word("cta", self.vocabulary, "jaccard"), "cat")
+                self.assertEqual(second.statistics["disk_hits"], 1)
+
+                connection = sqlite3.connect(path)
+                connection.execute("BEGIN EXCLUSIVE")
+                self.assertEqual(
+                    second.find_correct_word("lovd", self.vocabulary, "levenshtein"), "loved"
+                )
+                self.assertEqual(second.statistics["disk_errors"], 2)
+                connection.rollback()
+                connection.close()
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_find_correct_word_persistence(self):
+        """
+        Corrections are reused from the disk store
+        """
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / "corrections.sqlite"
+            with CorrectionCache(path=path) as cache:
+                cache.find_correct_word("cta", self.vocabulary, "jaro-winkler")
+
+            with CorrectionCache(path=path) as cache:
+                self.assertEqual(
+                    cache.find_correct_word("cta", self.vocabulary, "jaro-winkler"), "cat"
+                )
+                self.assertEqual(cache.statistics["disk_hits"], 1)
+                self.assertEqual(cache.statistics["misses"], 0)
+
+                changed = dict(self.vocabulary, act=0.5)
+                cache.find_correct_word("cta", changed, "jaro-winkler")
+                self.assertEqual(cache.statistics["misses"], 1)
+
+            with CorrectionCache(path=path) as cache:
+                cache.find_correct_word("cta", self.vocabulary, "jaro-winkler")
+                self.assertEqual(cache.statistics["disk_hits"], 1)
+                cache.prune()
+
+            with CorrectionCache(path=path) as cache:
+                cache.find_correct_word("cta", changed, "jaro-winkler")
+                self.assertEqual(cache.statistics["misses"], 1)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_fingerprint_vocabulary(self):
+        """
+        Fingerprint depends on contents only
+        """
+        reordered = dict(reversed(list(self.vocabulary.items())))
+        self.assertEqual(fingerprint_vocabulary(reordered), fingerprint_vocabulary(self.vocabulary))
+        changed = dict(self.vocabulary, cat=0.17)
+        self.assertNotEqual(
+            fingerprint_vocabulary(changed), fingerprint_vocabulary(self.vocabulary)
+        )
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_correction_cache_bad_input(self):
+        """
+        Bad input scenario
+        """
+        cache = CorrectionCache()
+        bad_vocabularies = [None, True, 42, 3.14, (), "document", [], {}, {"good": "bad"}, {1: 0}]
+        for bad_vocabulary in bad_vocabularies:
+            self.assertIsNone(fingerprint_vocabulary(bad_vocabulary))
+            self.assertIsNone(cache.find_correct_word("word", bad_vocabulary, "levenshtein"))
+        for bad_input in [None, True, 42, 3.14, (), {}, []]:
+            self.assertIsNone(cache.find_correct_word(bad_input, self.vocabulary, "jaccard"))
+            self.assertIsNone(cache.find_correct_word("word", self.vocabulary, bad_input))
+        self.assertIsNone(cache.find_correct_word("word", self.vocabulary, "jacard"))
+        self.assertIsNone(cache.find_correct_word("word", self.vocabulary, "levenshtein", ""))
+        self.assertEqual(len(cache), 0)
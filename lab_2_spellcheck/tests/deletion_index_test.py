@@ -0,0 +1,111 @@
+"""
+Checks the second lab deletion index candidate generation
+"""
+
+# pylint: disable=duplicate-code
+
+import unittest
+
+import pytest
+
+from lab_2_spellcheck.deletion_index import DeletionIndex
+from lab_2_spellcheck.main import calculate_frequency_distance, propose_candidates
+
+
+class DeletionIndexTest(unittest.TestCase):
+    """
+    Tests deletion index candidate generation.
+    """
+
+    def setUp(self) -> None:
+        self.vocabulary = {
+            "35": 0.04,
+            "across": 0.08,
+            "boy": 0.04,
+            "cat": 0.16,
+            "coffee": 0.04,
+            "friend": 0.04,
+            "kind": 0.04,
+            "library": 0.12,
+            "lived": 0.04,
+            "loved": 0.08,
+            "named": 0.04,
+            "opened": 0.04,
+            "shops": 0.04,
+            "smart": 0.04,
+            "stories": 0.04,
+            "stories101": 0.04,
+            "street": 0.08,
+        }
+
+        self.misspelled = [
+            "boyi",
+            "streat",
+            "coffe",
+            "cta",
+            "",
+            "libbrary",
+            "lovd",
+            "35",
+            "acrss",
+            "tac",
+            "storeis1",
+        ]
+        self.alphabet_en = list("abcdefghijklmnopqrstuvwxyz")
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_propose_candidates_ideal(self):
+        """
+        Ideal scenario
+        """
+        index = DeletionIndex(self.vocabulary)
+        for alphabet in (self.alphabet_en, [], list("eo")):
+            for misspelled in self.misspelled:
+                expected = tuple(
+                    candidate
+                    for candidate in propose_candidates(misspelled, alphabet)
+                    if candidate in self.vocabulary
+                )
+                self.assertTupleEqual(index.propose_candidates(misspelled, alphabet), expected)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_calculate_frequency_distance_ideal(self):
+        """
+        Same result as calculate_frequency_distance
+        """
+        index = DeletionIndex(self.vocabulary)
+        for alphabet in (self.alphabet_en, []):
+            for misspelled in self.misspelled:
+                self.assertDictEqual(
+                    index.calculate_frequency_distance(misspelled, alphabet),
+                    calculate_frequency_distance(misspelled, self.vocabulary, alphabet),
+                )
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_deletion_keys(self):
+        """
+        Every word is stored under itself and its deletion variants
+        """
+        index = DeletionIndex({"cat": 0.5, "cut": 0.5})
+        self.assertEqual(len(index), 11)
+        self.assertTupleEqual(index.propose_candidates("ct", []), ())
+        self.assertTupleEqual(index.propose_candidates("ct", ["a"]), ("cat",))
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_deletion_index_bad_input(self):
+        """
+        Bad input scenario
+        """
+        index = DeletionIndex(self.vocabulary)
+        for bad_word in (None, 1, [], ()):
+            self.assertIsNone(index.propose_candidates(bad_word, self.alphabet_en))
+            self.assertIsNone(index.calculate_frequency_distance(bad_word, self.alphabet_en))
+        for bad_alphabet in (None, "abc", [1, 2], {}):
+            self.assertIsNone(index.propose_candidates("cat", bad_alphabet))
+        self.assertIsNone(DeletionIndex({}).propose_candidates("cat", self.alphabet_en))
+        self.assertIsNone(DeletionIndex([]).calculate_frequency_distance("cat", self.alphabet_en))
+        self.assertListEqual(list(index.iterate_candidates(None, self.alphabet_en)), [])
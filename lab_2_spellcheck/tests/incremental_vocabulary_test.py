@@ -0,0 +1,148 @@
+"""
+Checks the second lab incremental vocabulary
+"""
+
+# pylint: disable=duplicate-code
+
+import random
+import unittest
+
+import pytest
+
+from lab_2_spellcheck.incremental_vocabulary import IncrementalVocabulary
+from lab_2_spellcheck.main import build_vocabulary, calculate_distance, suggest
+
+
+class IncrementalVocabularyTest(unittest.TestCase):
+    """
+    Tests vocabulary updates with delta maintained lookup structures.
+    """
+
+    def setUp(self) -> None:
+        self.tokens = [
+            "35",
+            "across",
+            "boy",
+            "cat",
+            "cat",
+            "cat",
+            "cat",
+            "coffee",
+            "friend",
+            "kind",
+            "library",
+            "library",
+            "library",
+            "lived",
+            "loved",
+            "loved",
+            "named",
+            "opened",
+            "shops",
+            "smart",
+            "stories",
+            "stories101",
+            "street",
+            "street",
+        ]
+        self.alphabet = list("abcdefghijklmnopqrstuvwxyz")
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_incremental_vocabulary_ideal(self):
+        """
+        Ideal scenario
+        """
+        vocabulary = IncrementalVocabulary(self.tokens)
+        self.assertEqual(vocabulary.vocabulary, build_vocabulary(self.tokens))
+        self.assertEqual(vocabulary.total, 24)
+        self.assertEqual(len(vocabulary), 17)
+        self.assertIn("cat", vocabulary)
+        self.assertAlmostEqual(vocabulary.get_frequency("cat"), 4 / 24)
+        self.assertEqual(vocabulary.get_frequency("cta"), 0.0)
+        self.assertEqual(vocabulary.get_words_of_length(3), ["boy", "cat"])
+
+        self.assertTrue(vocabulary.add_tokens(["cat", "bat"]))
+        self.assertTrue(vocabulary.remove_tokens(["boy", "library"]))
+        tokens = self.tokens + ["cat", "bat"]
+        tokens.remove("boy")
+        tokens.remove("library")
+        self.assertEqual(vocabulary.vocabulary, build_vocabulary(tokens))
+        self.assertEqual(vocabulary.get_words_of_length(3), ["bat", "cat"])
+        self.assertNotIn("boy", vocabulary)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_incremental_vocabulary_random_updates(self):
+        """
+        Lookup structures match a rebuilt vocabulary after every update
+        """
+        generator = random.Random(42)
+        vocabulary = IncrementalVocabulary()
+        tokens: list[str] = []
+        for _ in range(30):
+            if tokens and generator.random() < 0.4:
+                removed = generator.sample(tokens, generator.randint(1, len(tokens)))
+                for token in removed:
+                    tokens.remove(token)
+                self.assertTrue(vocabulary.remove_tokens(removed))
+            else:
+                added = generator.choices(self.tokens + ["bat", "cot", "loud"], k=5)
+                tokens.extend(added)
+                self.assertTrue(vocabulary.add_tokens(added))
+            if not tokens:
+                self.assertEqual(vocabulary.vocabulary, {})
+                continue
+            expected = build_vocabulary(tokens)
+            self.assertEqual(vocabulary.vocabulary, expected)
+            for token in ("lovd", "cta", "stories"):
+                self.assertEqual(
+                    vocabulary.calculate_jaccard_distances(token),
+                    calculate_distance(token, expected, "jaccard"),
+                )
+                self.assertEqual(
+                    vocabulary.calculate_frequency_distance(token, self.alphabet),
+                    calculate_distance(token, expected, "frequency-based", self.alphabet),
+                )
+                self.assertEqual(
+                    vocabulary.find_nearest_words(token, 3),
+                    suggest(token, expected, "levenshtein", 3),
+                )
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_remove_tokens_missing(self):
+        """
+        Removal of tokens that are not counted changes nothing
+        """
+        vocabulary = IncrementalVocabulary(["cat", "boy"])
+        self.assertFalse(vocabulary.remove_tokens(["cat", "cat"]))
+        self.assertFalse(vocabulary.remove_tokens(["cat", "dog"]))
+        self.assertEqual(vocabulary.vocabulary, {"cat": 0.5, "boy": 0.5})
+        self.assertTrue(vocabulary.remove_tokens(["cat", "boy"]))
+        self.assertEqual(vocabulary.vocabulary, {})
+        self.assertEqual(vocabulary.total, 0)
+        self.assertEqual(vocabulary.get_frequency("cat"), 0.0)
+        self.assertEqual(vocabulary.get_words_of_length(3), [])
+        self.assertIsNone(vocabulary.calculate_jaccard_distances("cat"))
+        self.assertIsNone(vocabulary.calculate_frequency_distance("cat", self.alphabet))
+        self.assertIsNone(vocabulary.find_nearest_words("cat", 1))
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_incremental_vocabulary_bad_input(self):
+        """
+        Bad input scenario
+        """
+        vocabulary = IncrementalVocabulary(self.tokens)
+        self.assertFalse(vocabulary.add_tokens(None))
+        self.assertFalse(vocabulary.add_tokens([]))
+        self.assertFalse(vocabulary.add_tokens(["cat", 1]))
+        self.assertFalse(vocabulary.remove_tokens(None))
+        self.assertFalse(vocabulary.remove_tokens([]))
+        self.assertEqual(vocabulary.total, 24)
+        self.assertIsNone(vocabulary.get_frequency(None))
+        self.assertEqual(vocabulary.get_words_of_length(-1), [])
+        self.assertIsNone(vocabulary.calculate_jaccard_distances(None))
+        self.assertIsNone(vocabulary.calculate_frequency_distance("cat", None))
+        self.assertIsNone(vocabulary.find_nearest_words("cat", 0))
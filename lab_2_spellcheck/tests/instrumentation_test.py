@@ -0,0 +1,189 @@
+"""
+Checks the second lab instrumentation of distance computations
+"""
+
+# pylint: disable=duplicate-code
+
+import atexit
+import json
+import os
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+import pytest
+
+from lab_2_spellcheck import main, sharded_spellcheck
+from lab_2_spellcheck.instrumentation import (
+    ENVIRONMENT_VARIABLE,
+    Instrumentation,
+    start_from_environment,
+)
+from lab_2_spellcheck.qgram_index import QGramIndex
+from lab_2_spellcheck.vectorized_levenshtein import VectorizedLevenshtein
+from lab_2_spellcheck.vocabulary_indexes import VocabularyIndexes
+
+
+class InstrumentationTest(unittest.TestCase):
+    """
+    Tests counters of the spellcheck functions.
+    """
+
+    def setUp(self) -> None:
+        self.vocabulary = {
+            "35": 0.04,
+            "across": 0.08,
+            "boy": 0.04,
+            "cat": 0.16,
+            "coffee": 0.04,
+            "friend": 0.04,
+            "kind": 0.04,
+            "library": 0.12,
+            "lived": 0.04,
+            "loved": 0.08,
+            "named": 0.04,
+            "opened": 0.04,
+            "shops": 0.04,
+            "smart": 0.04,
+            "stories": 0.04,
+            "stories101": 0.04,
+            "street": 0.08,
+        }
+
+        self.alphabet = list("abcdefghijklmnopqrstuvwxyz")
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_instrumentation_ideal(self):
+        """
+        Ideal scenario
+        """
+        with Instrumentation() as instrumentation:
+            actual = main.find_correct_word("streat", self.vocabulary, "levenshtein")
+        self.assertEqual(actual, "street")
+
+        summary = instrumentation.summary
+        self.assertEqual(summary["find_correct_word"]["calls"], 1)
+        self.assertEqual(summary["calculate_distance"]["scanned"], 17)
+        self.assertEqual(summary["calculate_levenshtein_distance"]["calls"], 17)
+        self.assertEqual(
+            summary["fill_levenshtein_matrix"]["cells"],
+            sum(len("streat") * len(word) for word in self.vocabulary),
+        )
+        self.assertEqual(summary["choose_closest_words"]["candidates"], 1)
+        self.assertEqual(summary["choose_closest_words"]["discarded"], 16)
+        self.assertNotIn("check_non_negative_int", summary)
+        for counters in summary.values():
+            self.assertGreaterEqual(counters["seconds"], counters["own_seconds"])
+            self.assertGreaterEqual(counters["own_seconds"], 0.0)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_instrumentation_candidates(self):
+        """
+        Candidates are counted for frequency-based distance
+        """
+        with Instrumentation() as instrumentation:
+            main.calculate_distance("libbrary", self.vocabulary, "frequency-based", self.alphabet)
+            main.propose_candidates("cat", self.alphabet)
+        summary = instrumentation.summary
+        self.assertEqual(summary["_find_vocabulary_candidates"]["candidates"], 1)
+        self.assertEqual(
+            summary["propose_candidates"]["candidates"],
+            len(main.propose_candidates("cat", self.alphabet)),
+        )
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_instrumentation_indexes(self):
+        """
+        Work of index searches is taken from their statistics
+        """
+        indexes = VocabularyIndexes(self.vocabulary)
+        engine = VectorizedLevenshtein(self.vocabulary)
+        with Instrumentation() as instrumentation:
+            indexes.find_correct_word("streat", "levenshtein")
+            indexes.find_correct_word("streat", "jaro-winkler")
+            indexes.trie.find_nearest_word("streat")
+            engine.calculate_distance_array("streat")
+        summary = instrumentation.summary
+        qgrams = summary["QGramIndex.find_nearest_words"]
+        self.assertEqual(qgrams["calls"], 1)
+        self.assertEqual(qgrams["checked"], indexes.qgrams.statistics["checked"])
+        self.assertEqual(qgrams["filtered"], indexes.qgrams.statistics["filtered"])
+        jaro_winkler = summary["JaroWinklerIndex.find_nearest_words"]
+        self.assertEqual(jaro_winkler["evaluated"], indexes.jaro_winkler.statistics["evaluated"])
+        self.assertEqual(jaro_winkler["pruned"], indexes.jaro_winkler.statistics["pruned"])
+        trie = summary["VocabularyTrie.find_nearest_words"]
+        self.assertEqual(trie["visited"], indexes.trie.statistics["visited"])
+        self.assertEqual(
+            summary["VectorizedLevenshtein.calculate_distance_array"]["cells"],
+            engine.statistics["cells"],
+        )
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_instrumentation_restores_functions(self):
+        """
+        Original functions are restored after the context
+        """
+        calculate_distance = main.calculate_distance
+        sharded_calculate_distance = sharded_spellcheck.calculate_distance
+        find_nearest_words = QGramIndex.find_nearest_words
+        with Instrumentation():
+            self.assertIsNot(main.calculate_distance, calculate_distance)
+            self.assertIsNot(sharded_spellcheck.calculate_distance, calculate_distance)
+            self.assertIsNot(QGramIndex.find_nearest_words, find_nearest_words)
+        self.assertIs(main.calculate_distance, calculate_distance)
+        self.assertIs(sharded_spellcheck.calculate_distance, sharded_calculate_distance)
+        self.assertIs(QGramIndex.find_nearest_words, find_nearest_words)
+
+        instrumentation = Instrumentation()
+        instrumentation.start()
+        instrumentation.stop()
+        main.find_correct_word("streat", self.vocabulary, "jaccard")
+        self.assertDictEqual(instrumentation.summary, {})
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_instrumentation_export(self):
+        """
+        Collapsed stacks and summary are written
+        """
+        with Instrumentation() as instrumentation:
+            main.find_correct_word("streat", self.vocabulary, "jaro-winkler")
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / "profile.folded"
+            instrumentation.export(path)
+            lines = path.read_text(encoding="utf-8").splitlines()
+            with open(Path(directory) / "profile.folded.json", "r", encoding="utf-8") as file:
+                summary = json.load(file)
+        self.assertDictEqual(summary, instrumentation.summary)
+        stacks = {line.rsplit(" ", 1)[0] for line in lines}
+        self.assertIn(
+            "find_correct_word;suggest;calculate_distance;_calculate_distances;"
+            "calculate_jaro_winkler_distance;get_matches",
+            stacks,
+        )
+        for line in lines:
+            self.assertTrue(line.rsplit(" ", 1)[1].isdigit())
+
+        instrumentation.reset()
+        self.assertDictEqual(instrumentation.summary, {})
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_start_from_environment(self):
+        """
+        Instrumentation is started only if the variable is set
+        """
+        with mock.patch.dict(os.environ, {ENVIRONMENT_VARIABLE: ""}):
+            self.assertIsNone(start_from_environment())
+        with mock.patch.dict(os.environ, {ENVIRONMENT_VARIABLE: "profile.folded"}):
+            instrumentation = start_from_environment()
+        self.assertIsInstance(instrumentation, Instrumentation)
+        atexit.unregister(instrumentation.export)
+        main.find_correct_word("streat", self.vocabulary, "jaccard")
+        instrumentation.stop()
+        self.assertEqual(instrumentation.summary["find_correct_word"]["calls"], 1)
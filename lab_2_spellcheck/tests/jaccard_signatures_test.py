@@ -0,0 +1,112 @@
+"""
+Checks the second lab bitmask Jaccard signatures
+"""
+
+# pylint: disable=duplicate-code
+
+import unittest
+
+import pytest
+
+from lab_2_spellcheck.jaccard_signatures import JaccardSignatures
+from lab_2_spellcheck.main import calculate_jaccard_distance
+
+
+class JaccardSignaturesTest(unittest.TestCase):
+    """
+    Tests batch Jaccard distance calculation over bitmask signatures.
+    """
+
+    def setUp(self) -> None:
+        self.vocabulary = {
+            "35": 0.04,
+            "across": 0.08,
+            "boy": 0.04,
+            "cat": 0.16,
+            "coffee": 0.04,
+            "friend": 0.04,
+            "kind": 0.04,
+            "library": 0.12,
+            "lived": 0.04,
+            "loved": 0.08,
+            "named": 0.04,
+            "opened": 0.04,
+            "shops": 0.04,
+            "smart": 0.04,
+            "stories": 0.04,
+            "stories101": 0.04,
+            "street": 0.08,
+        }
+
+        self.misspelled = ["boyi", "streat", "coffe", "cta", "", "zzz", "кот"]
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_calculate_distances_ideal(self):
+        """
+        Ideal scenario
+        """
+        signatures = JaccardSignatures(self.vocabulary)
+        for misspelled in self.misspelled:
+            expected = {
+                word: calculate_jaccard_distance(misspelled, word) for word in self.vocabulary
+            }
+            self.assertDictEqual(signatures.calculate_distances(misspelled), expected)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_calculate_distances_cyrillic(self):
+        """
+        Cyrillic vocabulary scenario
+        """
+        vocabulary = {"молоко": 0.5, "малина": 0.25, "": 0.25}
+        signatures = JaccardSignatures(vocabulary)
+        for misspelled in ("малоко", "мoлоко", ""):
+            expected = {word: calculate_jaccard_distance(misspelled, word) for word in vocabulary}
+            self.assertDictEqual(signatures.calculate_distances(misspelled), expected)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_signatures_value_check(self):
+        """
+        Check signatures of vocabulary words
+        """
+        jaccard_signatures = JaccardSignatures(self.vocabulary)
+        signatures = jaccard_signatures.signatures
+        self.assertEqual(signatures.keys(), self.vocabulary.keys())
+        self.assertEqual(signatures["cat"], jaccard_signatures.encode("tac"))
+        self.assertEqual(signatures["stories"].bit_count(), len(set("stories")))
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_add_remove_word(self):
+        """
+        Words with unseen letters get new bits without changing other signatures
+        """
+        signatures = JaccardSignatures(self.vocabulary)
+        before = dict(signatures.signatures)
+        signatures.add_word("jazz")
+        signatures.remove_word("cat")
+        signatures.remove_word("absent")
+        self.assertNotIn("cat", signatures.signatures)
+        for word, mask in before.items():
+            if word != "cat":
+                self.assertEqual(signatures.signatures[word], mask)
+        distances = signatures.calculate_distances("jaz")
+        self.assertEqual(distances["jazz"], 0.0)
+        self.assertEqual(distances["library"], calculate_jaccard_distance("jaz", "library"))
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_calculate_distances_bad_input(self):
+        """
+        Bad input scenario
+        """
+        bad_inputs = [None, True, 42, 3.14, (), [], {}]
+        signatures = JaccardSignatures(self.vocabulary)
+        for bad_input in bad_inputs:
+            self.assertIsNone(signatures.calculate_distances(bad_input))
+
+        bad_vocabularies = [None, True, 42, 3.14, (), "document", [], {}, {"good": "bad"}]
+        for bad_vocabulary in bad_vocabularies:
+            self.assertIsNone(JaccardSignatures(bad_vocabulary).calculate_distances("word"))
@@ -0,0 +1,114 @@
+"""
+Checks the second lab bounded Jaro-Winkler search
+"""
+
+# pylint: disable=duplicate-code
+
+import random
+import unittest
+
+import pytest
+
+from lab_2_spellcheck.jaro_winkler_index import JaroWinklerIndex
+from lab_2_spellcheck.main import calculate_jaro_winkler_distance, find_correct_word, suggest
+
+
+class JaroWinklerIndexTest(unittest.TestCase):
+    """
+    Tests Jaro-Winkler search pruned by bounds.
+    """
+
+    def setUp(self) -> None:
+        self.vocabulary = {
+            "35": 0.04,
+            "across": 0.08,
+            "boy": 0.04,
+            "cat": 0.16,
+            "coffee": 0.04,
+            "friend": 0.04,
+            "kind": 0.04,
+            "library": 0.12,
+            "lived": 0.04,
+            "loved": 0.08,
+            "named": 0.04,
+            "opened": 0.04,
+            "shops": 0.04,
+            "smart": 0.04,
+            "stories": 0.04,
+            "stories101": 0.04,
+            "street": 0.08,
+        }
+        self.misspelled = ["boyi", "streat", "coffe", "cta", "", "lovd", "xyz"]
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_find_nearest_words_ideal(self):
+        """
+        Ideal scenario
+        """
+        index = JaroWinklerIndex(self.vocabulary)
+        for token in self.misspelled:
+            self.assertEqual(
+                index.find_nearest_word(token),
+                find_correct_word(token, self.vocabulary, "jaro-winkler"),
+            )
+            for k in (1, 3, 20):
+                self.assertListEqual(
+                    index.find_nearest_words(token, k),
+                    suggest(token, self.vocabulary, "jaro-winkler", k),
+                )
+        statistics = index.statistics
+        self.assertEqual(statistics["searches"], 28)
+        self.assertGreater(statistics["pruned"], 0)
+        self.assertEqual(statistics["pruned"] + statistics["evaluated"], 28 * len(self.vocabulary))
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_calculate_bounds(self):
+        """
+        Bounds never exceed distances
+        """
+        generator = random.Random(42)
+        for _ in range(300):
+            vocabulary = {
+                "".join(generator.choice("abc") for _ in range(generator.randint(0, 7))): 0.1
+                for _ in range(10)
+            }
+            token = "".join(generator.choice("abcd") for _ in range(generator.randint(0, 7)))
+            for prefix_scaling in (0.1, 0.3):
+                bounds = JaroWinklerIndex(vocabulary, prefix_scaling).calculate_bounds(token)
+                for word, bound in bounds.items():
+                    self.assertLessEqual(
+                        bound,
+                        calculate_jaro_winkler_distance(token, word, prefix_scaling) + 1e-12,
+                    )
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_find_nearest_words_max_distance(self):
+        """
+        Words farther than the threshold are not returned
+        """
+        index = JaroWinklerIndex(self.vocabulary)
+        self.assertListEqual(index.find_nearest_words("lovd", 5, 0.2), ["loved", "lived"])
+        self.assertListEqual(index.find_nearest_words("cta", 5, 0.45), ["cat", "coffee"])
+        self.assertListEqual(index.find_nearest_words("xyz", 5, 0.5), [])
+        self.assertIsNone(index.find_nearest_word("xyz", 0.5))
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_find_nearest_words_bad_input(self):
+        """
+        Bad input scenario
+        """
+        for bad_vocabulary in [None, True, 42, 3.14, (), "document", [], {}, {"good": "bad"}]:
+            self.assertIsNone(JaroWinklerIndex(bad_vocabulary).find_nearest_word("cat"))
+        self.assertIsNone(JaroWinklerIndex(self.vocabulary, 1).find_nearest_word("cat"))
+        index = JaroWinklerIndex(self.vocabulary)
+        for bad_input in [None, True, 42, 3.14, (), {}, []]:
+            self.assertIsNone(index.find_nearest_word(bad_input))
+            self.assertIsNone(index.calculate_bounds(bad_input))
+        for bad_k in [None, True, 0, -1, 3.14]:
+            self.assertIsNone(index.find_nearest_words("cat", bad_k))
+        for bad_distance in [None, True, 1, "0.5"]:
+            self.assertIsNone(index.find_nearest_word("cat", bad_distance))
@@ -0,0 +1,84 @@
+"""
+Checks the second lab position-indexed Jaro-Winkler distance
+"""
+
+# pylint: disable=duplicate-code
+
+import random
+import unittest
+
+import pytest
+
+from lab_2_spellcheck.jaro_winkler_query import JaroWinklerQuery
+from lab_2_spellcheck.main import calculate_distance, calculate_jaro_winkler_distance
+
+
+class JaroWinklerQueryTest(unittest.TestCase):
+    """
+    Tests Jaro-Winkler distance with position-indexed matching.
+    """
+
+    def setUp(self) -> None:
+        self.vocabulary = {
+            "35": 0.04,
+            "across": 0.08,
+            "boy": 0.04,
+            "cat": 0.16,
+            "coffee": 0.04,
+            "friend": 0.04,
+            "kind": 0.04,
+            "library": 0.12,
+            "lived": 0.04,
+            "loved": 0.08,
+            "named": 0.04,
+            "opened": 0.04,
+            "shops": 0.04,
+            "smart": 0.04,
+            "stories": 0.04,
+            "stories101": 0.04,
+            "street": 0.08,
+        }
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_calculate_distances_ideal(self):
+        """
+        Ideal scenario
+        """
+        for token in ["boyi", "streat", "coffe", "cta", "", "аbс", "abracadabra"]:
+            self.assertDictEqual(
+                JaroWinklerQuery(token).calculate_distances(self.vocabulary),
+                calculate_distance(token, self.vocabulary, "jaro-winkler"),
+            )
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_calculate_distance_random_words(self):
+        """
+        Distances are equal to calculate_jaro_winkler_distance on repeated letters
+        """
+        generator = random.Random(42)
+        for _ in range(5000):
+            token, candidate = (
+                "".join(generator.choice("abcd") for _ in range(generator.randint(0, 10)))
+                for _ in range(2)
+            )
+            prefix_scaling = generator.choice([0.1, 0.2, 0.25])
+            self.assertEqual(
+                JaroWinklerQuery(token, prefix_scaling).calculate_distance(candidate),
+                calculate_jaro_winkler_distance(token, candidate, prefix_scaling),
+            )
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_calculate_distance_bad_input(self):
+        """
+        Bad input scenario
+        """
+        for bad_input in [None, True, 42, 3.14, (), {}, []]:
+            self.assertIsNone(JaroWinklerQuery(bad_input).calculate_distance("cat"))
+            self.assertIsNone(JaroWinklerQuery("cat").calculate_distance(bad_input))
+            self.assertIsNone(JaroWinklerQuery("cat").calculate_distances(bad_input))
+        for bad_scaling in [None, True, 1, "0.1", []]:
+            self.assertIsNone(JaroWinklerQuery("cat", bad_scaling).calculate_distance("cat"))
+        self.assertIsNone(JaroWinklerQuery("cat").calculate_distances({"cat": "bad"}))
@@ -0,0 +1,125 @@
+"""
+Checks the second lab MinHash LSH index
+"""
+
+# pylint: disable=duplicate-code
+
+import unittest
+
+import pytest
+
+from lab_2_spellcheck.main import calculate_jaccard_distance
+from lab_2_spellcheck.minhash_index import MinHashIndex
+
+
+class MinHashIndexTest(unittest.TestCase):
+    """
+    Tests MinHash candidate retrieval for Jaccard distance.
+    """
+
+    def setUp(self) -> None:
+        self.vocabulary = {
+            "35": 0.04,
+            "across": 0.08,
+            "boy": 0.04,
+            "cat": 0.16,
+            "coffee": 0.04,
+            "friend": 0.04,
+            "kind": 0.04,
+            "library": 0.12,
+            "lived": 0.04,
+            "loved": 0.08,
+            "named": 0.04,
+            "opened": 0.04,
+            "shops": 0.04,
+            "smart": 0.04,
+            "stories": 0.04,
+            "stories101": 0.04,
+            "street": 0.08,
+        }
+
+        self.misspelled = ["boyi", "streat", "coffe", "cta"]
+        self.expected = ["boy", "street", "coffee", "cat"]
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_calculate_distances_ideal(self):
+        """
+        Ideal scenario
+        """
+        index = MinHashIndex(self.vocabulary, bands=16, rows=2)
+        for misspelled, expected in zip(self.misspelled, self.expected):
+            distances = index.calculate_distances(misspelled)
+            self.assertIn(expected, distances)
+            for word, distance in distances.items():
+                self.assertEqual(distance, calculate_jaccard_distance(misspelled, word))
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_get_candidates_same_letters(self):
+        """
+        Words with the same set of letters always collide
+        """
+        for ngram_size in (1, 2):
+            index = MinHashIndex(self.vocabulary, bands=2, rows=8, ngram_size=ngram_size)
+            for word in self.vocabulary:
+                self.assertIn(word, index.get_candidates(word))
+        self.assertIn("cat", MinHashIndex(self.vocabulary, bands=1, rows=8).get_candidates("tac"))
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_get_candidates_deterministic(self):
+        """
+        Independently built indexes produce same candidates
+        """
+        first = MinHashIndex(self.vocabulary, bands=4, rows=3)
+        second = MinHashIndex(self.vocabulary, bands=4, rows=3)
+        for misspelled in self.misspelled:
+            self.assertSetEqual(first.get_candidates(misspelled), second.get_candidates(misspelled))
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_candidate_probability(self):
+        """
+        Check collision probability
+        """
+        index = MinHashIndex(self.vocabulary, bands=4, rows=2)
+        self.assertAlmostEqual(index.candidate_probability(1.0), 1.0)
+        self.assertAlmostEqual(index.candidate_probability(0.0), 0.0)
+        self.assertAlmostEqual(index.candidate_probability(0.5), 1 - 0.75**4)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_get_candidates_empty_token(self):
+        """
+        Empty token scenario
+        """
+        index = MinHashIndex(self.vocabulary)
+        self.assertSetEqual(index.get_candidates(""), set())
+        self.assertDictEqual(index.calculate_distances(""), {})
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_minhash_index_bad_input(self):
+        """
+        Bad input scenario
+        """
+        bad_tokens = [None, True, 42, 3.14, (), [], {}]
+        index = MinHashIndex(self.vocabulary)
+        for bad_token in bad_tokens:
+            self.assertIsNone(index.get_candidates(bad_token))
+            self.assertIsNone(index.calculate_distances(bad_token))
+
+        bad_vocabularies = [None, True, 42, 3.14, (), "document", [], {}, {"good": "bad"}]
+        for bad_vocabulary in bad_vocabularies:
+            self.assertIsNone(MinHashIndex(bad_vocabulary).get_candidates("word"))
+
+        bad_parameters = [None, True, 3.14, -1, 0, "", ()]
+        for bad_parameter in bad_parameters:
+            self.assertIsNone(
+                MinHashIndex(self.vocabulary, bands=bad_parameter).get_candidates("a")
+            )
+            self.assertIsNone(MinHashIndex(self.vocabulary, rows=bad_parameter).get_candidates("a"))
+            self.assertIsNone(
+                MinHashIndex(self.vocabulary, ngram_size=bad_parameter).get_candidates("a")
+            )
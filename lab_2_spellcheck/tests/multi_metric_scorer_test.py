@@ -0,0 +1,115 @@
+"""
+Checks the second lab multi-metric scorer
+"""
+
+# pylint: disable=duplicate-code
+
+import unittest
+
+import pytest
+
+from lab_2_spellcheck.main import calculate_distance
+from lab_2_spellcheck.multi_metric_scorer import METHODS, MultiMetricScorer
+from lab_2_spellcheck.vocabulary_indexes import VocabularyIndexes
+
+
+class MultiMetricScorerTest(unittest.TestCase):
+    """
+    Tests scoring with all methods at once.
+    """
+
+    def setUp(self) -> None:
+        self.vocabulary = {
+            "35": 0.04,
+            "across": 0.08,
+            "boy": 0.04,
+            "cat": 0.16,
+            "coffee": 0.04,
+            "friend": 0.04,
+            "kind": 0.04,
+            "library": 0.12,
+            "lived": 0.04,
+            "loved": 0.08,
+            "named": 0.04,
+            "opened": 0.04,
+            "shops": 0.04,
+            "smart": 0.04,
+            "stories": 0.04,
+            "stories101": 0.04,
+            "street": 0.08,
+        }
+        self.misspelled = ["boyi", "streat", "coffe", "cta", "", "lovd"]
+        self.alphabet = list("abcdefghijklmnopqrstuvwxyz")
+        self.indexes = VocabularyIndexes(self.vocabulary)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_score_ideal(self):
+        """
+        Ideal scenario
+        """
+        scorer = MultiMetricScorer(self.indexes, None)
+        for token in self.misspelled:
+            table = scorer.score(token, self.alphabet)
+            self.assertSetEqual(set(table), set(self.vocabulary))
+            for method in METHODS:
+                expected = calculate_distance(token, self.vocabulary, method, self.alphabet)
+                self.assertDictEqual(
+                    {word: scores[method] for word, scores in table.items()}, expected
+                )
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_score_shortlist(self):
+        """
+        Only words of close length are scored
+        """
+        scorer = MultiMetricScorer(self.indexes, 1)
+        self.assertListEqual(sorted(scorer.get_shortlist("cta")), ["35", "boy", "cat", "kind"])
+        table = scorer.score("cta")
+        self.assertSetEqual(set(table), {"35", "boy", "cat", "kind"})
+        self.assertSetEqual(
+            set(table["cat"]), {"jaccard", "levenshtein", "jaro-winkler", "weighted-levenshtein"}
+        )
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_rank(self):
+        """
+        Blended distances rank shortlisted words
+        """
+        scorer = MultiMetricScorer(self.indexes)
+        self.assertListEqual(scorer.rank("cta", {"levenshtein": 1.0}, 1), ["cat"])
+        self.assertListEqual(
+            scorer.rank("lovd", {"levenshtein": 0.5, "jaro-winkler": 2.0}, 2), ["loved", "lived"]
+        )
+        for method in ["jaccard", "levenshtein", "jaro-winkler", "weighted-levenshtein"]:
+            for token in self.misspelled:
+                table = scorer.score(token)
+                ranked = sorted(
+                    table,
+                    key=lambda word, scores=table, name=method, query=token: (
+                        scores[word][name],
+                        abs(len(word) - len(query)),
+                        word,
+                    ),
+                )
+                self.assertListEqual(scorer.rank(token, {method: 1.0}, 3), ranked[:3])
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_score_bad_input(self):
+        """
+        Bad input scenario
+        """
+        scorer = MultiMetricScorer(self.indexes)
+        for bad_input in [None, True, 42, 3.14, (), {}, []]:
+            self.assertIsNone(scorer.score(bad_input))
+            self.assertIsNone(scorer.rank(bad_input, {"jaccard": 1.0}, 1))
+            self.assertIsNone(MultiMetricScorer(bad_input).score("cat"))
+        self.assertIsNone(scorer.score("cat", "abc"))
+        self.assertIsNone(MultiMetricScorer(self.indexes, -1).score("cat"))
+        for bad_weights in [None, {}, {"jacard": 1.0}, {"jaccard": 1}, {"frequency-based": 1.0}]:
+            self.assertIsNone(scorer.rank("cat", bad_weights, 1))
+        for bad_k in [None, True, 0, -1, 3.14]:
+            self.assertIsNone(scorer.rank("cat", {"jaccard": 1.0}, bad_k))
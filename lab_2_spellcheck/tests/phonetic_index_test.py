@@ -0,0 +1,118 @@
+"""
+Checks the second lab phonetic blocking index
+"""
+
+# pylint: disable=duplicate-code
+
+import unittest
+
+import pytest
+
+from lab_2_spellcheck.main import find_correct_word
+from lab_2_spellcheck.phonetic_index import encode_phonetic, PhoneticIndex
+
+
+class PhoneticIndexTest(unittest.TestCase):
+    """
+    Tests phonetic blocking of Russian words.
+    """
+
+    def setUp(self) -> None:
+        self.vocabulary = {
+            "аннушка": 0.05,
+            "берлиоз": 0.1,
+            "бездомный": 0.1,
+            "вода": 0.05,
+            "трамвай": 0.05,
+            "масло": 0.1,
+            "маргарита": 0.05,
+            "мастер": 0.1,
+            "патриарших": 0.1,
+            "прудах": 0.05,
+            "сказал": 0.1,
+            "скамейке": 0.05,
+            "улице": 0.05,
+            "35": 0.05,
+        }
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_encode_phonetic_ideal(self):
+        """
+        Ideal scenario
+        """
+        self.assertEqual(encode_phonetic("берлиоз"), "прлс")
+        self.assertEqual(encode_phonetic("Берлеос"), "прлс")
+        self.assertEqual(encode_phonetic("аннушка"), "ншк")
+        self.assertEqual(encode_phonetic("анушка"), "ншк")
+        self.assertEqual(encode_phonetic("улица"), "лс")
+        self.assertEqual(encode_phonetic("сделаться"), "стлс")
+        self.assertEqual(encode_phonetic("ёж"), "ш")
+        self.assertEqual(encode_phonetic("35"), "35")
+        self.assertEqual(encode_phonetic(""), "")
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_get_candidates_ideal(self):
+        """
+        Candidates come from the same and the neighbouring buckets
+        """
+        index = PhoneticIndex(self.vocabulary)
+        self.assertEqual(index.get_candidates("берлеос"), ["берлиоз"])
+        self.assertIn("маргарита", index.get_candidates("моргорита"))
+        self.assertIn("маргарита", index.get_candidates("маркрита"))
+        self.assertIn("мастер", index.get_candidates("мастера"))
+        self.assertEqual(index.get_candidates("щщщщ"), [])
+
+        exact = PhoneticIndex(self.vocabulary, include_neighbours=False)
+        self.assertEqual(exact.get_candidates("мастира"), ["мастер"])
+        self.assertEqual(exact.get_candidates("маргрит"), ["маргарита"])
+        self.assertEqual(exact.get_candidates("мрак"), [])
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_find_correct_word_ideal(self):
+        """
+        Phonetic typos are corrected as by the full scan
+        """
+        index = PhoneticIndex(self.vocabulary)
+        for wrong_word in ("берлеос", "аннушька", "трамваи", "моргорита", "патреарших"):
+            for method in ("levenshtein", "jaro-winkler", "jaccard", "weighted-levenshtein"):
+                self.assertEqual(
+                    index.find_correct_word(wrong_word, method),
+                    find_correct_word(wrong_word, self.vocabulary, method),
+                )
+        statistics = index.statistics
+        self.assertEqual(statistics["searches"], 20)
+        self.assertLess(statistics["scored"], 20 * len(self.vocabulary))
+        self.assertEqual(statistics["fallbacks"], 0)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_find_correct_word_fallback(self):
+        """
+        Tokens without candidates are compared with the whole vocabulary
+        """
+        index = PhoneticIndex(self.vocabulary)
+        self.assertEqual(
+            index.find_correct_word("щщщщ", "levenshtein"),
+            find_correct_word("щщщщ", self.vocabulary, "levenshtein"),
+        )
+        self.assertEqual(index.statistics["fallbacks"], 1)
+        self.assertEqual(index.statistics["scored"], len(self.vocabulary))
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_phonetic_index_bad_input(self):
+        """
+        Bad input scenario
+        """
+        self.assertIsNone(encode_phonetic(None))
+        index = PhoneticIndex(self.vocabulary)
+        self.assertIsNone(index.get_candidates(None))
+        self.assertIsNone(index.find_correct_word(None, "levenshtein"))
+        self.assertIsNone(index.find_correct_word("берлеос", "unknown"))
+        for bad_vocabulary in (None, {}, {"слово": "плохо"}):
+            empty = PhoneticIndex(bad_vocabulary)
+            self.assertIsNone(empty.get_candidates("слово"))
+            self.assertIsNone(empty.find_correct_word("слово", "levenshtein"))
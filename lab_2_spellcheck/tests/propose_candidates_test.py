@@ -9,7 +9,13 @@ from pathlib import Path
 
 import pytest
 
-from lab_2_spellcheck.main import propose_candidates
+from lab_2_spellcheck.main import (
+    add_letter,
+    delete_letter,
+    propose_candidates,
+    replace_letter,
+    swap_adjacent,
+)
 
 
 class ProposeCandidatesTest(unittest.TestCase):
@@ -117,3 +123,27 @@ class ProposeCandidatesTest(unittest.TestCase):
         Empty word scenario
         """
         self.assertTupleEqual(propose_candidates("", []), ())
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_propose_candidates_matches_single_edits(self):
+        """
+        Long word scenario checked against the sorted single edit functions
+        """
+        word = "колокольчик"
+
+        def edit(token: str) -> set[str]:
+            return set(
+                delete_letter(token)
+                + add_letter(token, self.alphabet_ru)
+                + replace_letter(token, self.alphabet_ru)
+                + swap_adjacent(token)
+            )
+
+        first_level = edit(word)
+        expected = set(first_level)
+        for candidate in first_level:
+            expected.update(edit(candidate))
+
+        actual = propose_candidates(word, self.alphabet_ru)
+        self.assertTupleEqual(actual, tuple(sorted(expected)))
@@ -0,0 +1,119 @@
+"""
+Checks the second lab q-gram index
+"""
+
+# pylint: disable=duplicate-code
+
+import random
+import unittest
+
+import pytest
+
+from lab_2_spellcheck.main import calculate_levenshtein_distance, find_correct_word, suggest
+from lab_2_spellcheck.qgram_index import QGramIndex
+
+
+class QGramIndexTest(unittest.TestCase):
+    """
+    Tests Levenshtein search with q-gram count filtering.
+    """
+
+    def setUp(self) -> None:
+        self.vocabulary = {
+            "35": 0.04,
+            "across": 0.08,
+            "boy": 0.04,
+            "cat": 0.16,
+            "coffee": 0.04,
+            "friend": 0.04,
+            "kind": 0.04,
+            "library": 0.12,
+            "lived": 0.04,
+            "loved": 0.08,
+            "named": 0.04,
+            "opened": 0.04,
+            "shops": 0.04,
+            "smart": 0.04,
+            "stories": 0.04,
+            "stories101": 0.04,
+            "street": 0.08,
+        }
+        self.misspelled = ["boyi", "streat", "coffe", "cta", "", "lovd", "stories1O1"]
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_find_nearest_words_ideal(self):
+        """
+        Ideal scenario
+        """
+        for q in (1, 2, 3):
+            index = QGramIndex(self.vocabulary, q)
+            for token in self.misspelled:
+                self.assertEqual(
+                    index.find_nearest_word(token),
+                    find_correct_word(token, self.vocabulary, "levenshtein"),
+                )
+                for k in (2, 5, 20):
+                    self.assertListEqual(
+                        index.find_nearest_words(token, k),
+                        suggest(token, self.vocabulary, "levenshtein", k),
+                    )
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_get_candidates_complete(self):
+        """
+        Candidates include every word within the distance
+        """
+        generator = random.Random(42)
+        for _ in range(300):
+            vocabulary = {
+                "".join(generator.choice("abc") for _ in range(generator.randint(0, 8))): 0.1
+                for _ in range(10)
+            }
+            token = "".join(generator.choice("abcd") for _ in range(generator.randint(0, 8)))
+            for q in (2, 3):
+                index = QGramIndex(vocabulary, q)
+                for distance in range(4):
+                    expected = {
+                        word
+                        for word in vocabulary
+                        if calculate_levenshtein_distance(token, word) <= distance
+                    }
+                    self.assertLessEqual(expected, set(index.get_candidates(token, distance)))
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_get_candidates_filtering(self):
+        """
+        Words sharing too few q-grams are filtered out
+        """
+        index = QGramIndex(self.vocabulary)
+        self.assertListEqual(index.get_candidates("stories", 0), ["stories"])
+        self.assertListEqual(index.get_candidates("stores", 1), ["stories"])
+        self.assertListEqual(index.find_nearest_words("lovd", 5, 1), ["loved"])
+        self.assertIsNone(index.find_nearest_word("xyz", 1))
+        statistics = index.statistics
+        self.assertEqual(statistics["searches"], 2)
+        self.assertGreater(statistics["filtered"], 0)
+        self.assertEqual(statistics["checked"] + statistics["filtered"], 2 * len(self.vocabulary))
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_find_nearest_words_bad_input(self):
+        """
+        Bad input scenario
+        """
+        for bad_vocabulary in [None, True, 42, 3.14, (), "document", [], {}, {"good": "bad"}]:
+            self.assertIsNone(QGramIndex(bad_vocabulary).find_nearest_word("cat"))
+        for bad_q in [None, True, 0, -1, 3.14]:
+            self.assertIsNone(QGramIndex(self.vocabulary, bad_q).find_nearest_word("cat"))
+        index = QGramIndex(self.vocabulary)
+        for bad_input in [None, True, 42, 3.14, (), {}, []]:
+            self.assertIsNone(index.find_nearest_word(bad_input))
+            self.assertIsNone(index.get_candidates(bad_input, 1))
+        for bad_number in [None, True, -1, 3.14]:
+            self.assertIsNone(index.find_nearest_words("cat", bad_number))
+            self.assertIsNone(index.get_candidates("cat", bad_number))
+        for bad_distance in [True, -1, 3.14, "1"]:
+            self.assertIsNone(index.find_nearest_word("cat", bad_distance))
@@ -0,0 +1,122 @@
+"""
+Checks the second lab sentence correction pipeline
+"""
+
+# pylint: disable=duplicate-code
+
+import unittest
+from types import GeneratorType
+
+import pytest
+
+from lab_1_keywords_tfidf.main import clean_and_tokenize
+from lab_2_spellcheck.main import find_correct_word, find_out_of_vocab_words
+from lab_2_spellcheck.sentence_corrector import SentenceCorrector
+from lab_2_spellcheck.vocabulary_indexes import VocabularyIndexes
+
+
+class SentenceCorrectorTest(unittest.TestCase):
+    """
+    Tests correction of whole sentences.
+    """
+
+    def setUp(self) -> None:
+        self.vocabulary = {
+            "35": 0.04,
+            "across": 0.08,
+            "boy": 0.04,
+            "cat": 0.16,
+            "coffee": 0.04,
+            "friend": 0.04,
+            "kind": 0.04,
+            "library": 0.12,
+            "lived": 0.04,
+            "loved": 0.08,
+            "named": 0.04,
+            "opened": 0.04,
+            "shops": 0.04,
+            "smart": 0.04,
+            "stories": 0.04,
+            "stories101": 0.04,
+            "street": 0.08,
+        }
+        self.indexes = VocabularyIndexes(self.vocabulary)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_correct_ideal(self):
+        """
+        Ideal scenario
+        """
+        corrector = SentenceCorrector(self.indexes, "levenshtein", stop_words=["the", "a"])
+        self.assertEqual(
+            corrector.correct("The  boyi lovd a cta,  across the streat!\n"),
+            "The  boy loved a cat,  across the street!\n",
+        )
+        self.assertEqual(corrector.correct("Lovd CTA (libary)."), "Loved CAT (library).")
+        self.assertEqual(corrector.correct("cat boy"), "cat boy")
+        self.assertEqual(corrector.correct(""), "")
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_correct_matches_pipeline(self):
+        """
+        Replaced words match the manual pipeline
+        """
+        sentence = "A smrat boi opend the librery, stories-101 lovd the coffe."
+        tokens = clean_and_tokenize(sentence)
+        for method in ("jaro-winkler", "weighted-levenshtein"):
+            corrector = SentenceCorrector(self.indexes, method)
+            corrected = corrector.correct(sentence)
+            expected = [
+                (
+                    find_correct_word(token, self.vocabulary, method)
+                    if token in find_out_of_vocab_words(tokens, self.vocabulary)
+                    else token
+                )
+                for token in tokens
+            ]
+            self.assertEqual(clean_and_tokenize(corrected), expected)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_correct_batch_unique_words(self):
+        """
+        Every unique out of vocabulary word is corrected once per batch
+        """
+        corrector = SentenceCorrector(self.indexes, "levenshtein")
+        corrected = corrector.correct_batch(["cta cta boyi", "boyi cat", "cta"])
+        self.assertEqual(corrected, ["cat cat boy", "boy cat", "cat"])
+        self.assertEqual(
+            corrector.statistics,
+            {"sentences": 3, "tokens": 6, "out_of_vocab_words": 5, "corrections": 2},
+        )
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_iterate_corrections(self):
+        """
+        Sentences are corrected lazily in batches
+        """
+        corrector = SentenceCorrector(self.indexes, "levenshtein")
+        sentences = (sentence for sentence in ["cta", "boyi", "cta", "lovd", "cta"])
+        corrections = corrector.iterate_corrections(sentences, 2)
+        self.assertIsInstance(corrections, GeneratorType)
+        self.assertEqual(list(corrections), ["cat", "boy", "cat", "loved", "cat"])
+        self.assertEqual(corrector.statistics["corrections"], 5)
+        self.assertEqual(list(corrector.iterate_corrections(["cta", 1, "cta"], 1)), ["cat"])
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_sentence_corrector_bad_input(self):
+        """
+        Bad input scenario
+        """
+        corrector = SentenceCorrector(self.indexes, "levenshtein")
+        self.assertIsNone(corrector.correct(None))
+        self.assertIsNone(corrector.correct_batch([]))
+        self.assertIsNone(corrector.correct_batch(["cta", None]))
+        self.assertEqual(list(corrector.iterate_corrections(["cta"], 0)), [])
+        self.assertIsNone(SentenceCorrector(None, "levenshtein").correct("cta"))
+        self.assertIsNone(SentenceCorrector(self.indexes, "levenshtein", [1]).correct("cta"))
+        self.assertEqual(SentenceCorrector(self.indexes, "unknown").correct("cta"), "cta")
@@ -0,0 +1,143 @@
+"""
+Checks the second lab sharded spellchecking
+"""
+
+# pylint: disable=duplicate-code
+
+import unittest
+from unittest import mock
+
+import pytest
+
+from lab_2_spellcheck.main import (
+    _find_vocabulary_candidates,
+    calculate_distance,
+    find_correct_word,
+    suggest,
+)
+from lab_2_spellcheck.sharded_spellcheck import ShardedSpellchecker
+
+
+class ShardedSpellcheckerTest(unittest.TestCase):
+    """
+    Tests spellchecking over vocabulary shards in worker processes.
+    """
+
+    def setUp(self) -> None:
+        self.vocabulary = {
+            "35": 0.04,
+            "across": 0.08,
+            "boy": 0.04,
+            "cat": 0.16,
+            "coffee": 0.04,
+            "friend": 0.04,
+            "kind": 0.04,
+            "library": 0.12,
+            "lived": 0.04,
+            "loved": 0.08,
+            "named": 0.04,
+            "opened": 0.04,
+            "shops": 0.04,
+            "smart": 0.04,
+            "stories": 0.04,
+            "stories101": 0.04,
+            "street": 0.08,
+        }
+        self.misspelled = ["boyi", "streat", "coffe", "cta", "", "libbrary", "lovd", "35"]
+        self.methods = (
+            "jaccard",
+            "frequency-based",
+            "levenshtein",
+            "jaro-winkler",
+            "weighted-levenshtein",
+        )
+        self.alphabet = list("abcdefghijklmnopqrstuvwxyz")
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_suggest_ideal(self):
+        """
+        Ideal scenario
+        """
+        with ShardedSpellchecker(self.vocabulary, 3) as spellchecker:
+            self.assertEqual(spellchecker.shards, 3)
+            for method in self.methods:
+                for misspelled in self.misspelled:
+                    for k in (1, 3, 20):
+                        self.assertEqual(
+                            spellchecker.suggest(misspelled, method, k, self.alphabet),
+                            suggest(misspelled, self.vocabulary, method, k, self.alphabet),
+                        )
+                    self.assertEqual(
+                        spellchecker.find_correct_word(misspelled, method, self.alphabet),
+                        find_correct_word(misspelled, self.vocabulary, method, self.alphabet),
+                    )
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_calculate_distance_ideal(self):
+        """
+        Distances of all shards are merged
+        """
+        with ShardedSpellchecker(self.vocabulary, 2) as spellchecker:
+            for method in self.methods:
+                self.assertDictEqual(
+                    spellchecker.calculate_distance("lovd", method, self.alphabet),
+                    calculate_distance("lovd", self.vocabulary, method, self.alphabet),
+                )
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_frequency_candidates_generated_once(self):
+        """
+        Frequency-based candidates are generated by the coordinator only
+        """
+        with (
+            mock.patch(
+                "lab_2_spellcheck.sharded_spellcheck._find_vocabulary_candidates",
+                wraps=_find_vocabulary_candidates,
+            ) as find_candidates,
+            ShardedSpellchecker(self.vocabulary, 3) as spellchecker,
+        ):
+            self.assertListEqual(
+                spellchecker.suggest("lovd", "frequency-based", 3, self.alphabet),
+                suggest("lovd", self.vocabulary, "frequency-based", 3, self.alphabet),
+            )
+        find_candidates.assert_called_once_with("lovd", self.alphabet, self.vocabulary)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_workers_persist(self):
+        """
+        Workers are started once and stopped on close
+        """
+        spellchecker = ShardedSpellchecker(self.vocabulary, 2)
+        spellchecker.find_correct_word("cta", "levenshtein")
+        workers = list(spellchecker._workers)  # pylint: disable=protected-access
+        spellchecker.find_correct_word("lovd", "jaro-winkler")
+        self.assertEqual(spellchecker._workers, workers)  # pylint: disable=protected-access
+        spellchecker.close()
+        for process, _ in workers:
+            self.assertFalse(process.is_alive())
+        self.assertEqual(spellchecker.find_correct_word("cta", "levenshtein"), "cat")
+        spellchecker.close()
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_sharded_spellchecker_bad_input(self):
+        """
+        Bad input scenario
+        """
+        self.assertEqual(ShardedSpellchecker({"cat": 1.0}, 4).shards, 1)
+        with ShardedSpellchecker(self.vocabulary, 2) as spellchecker:
+            self.assertIsNone(spellchecker.suggest(None, "levenshtein", 1))
+            self.assertIsNone(spellchecker.suggest("cta", "unknown", 1))
+            self.assertIsNone(spellchecker.suggest("cta", "levenshtein", 0))
+            self.assertIsNone(spellchecker.suggest("cta", "frequency-based", 1))
+            self.assertIsNone(spellchecker.suggest("cta", "levenshtein", 1, [1]))
+            self.assertIsNone(spellchecker.calculate_distance("cta", "unknown"))
+            self.assertEqual(spellchecker.find_correct_word("cta", "levenshtein"), "cat")
+
+        for bad_vocabulary in (None, {}, {"cat": "bad"}):
+            with ShardedSpellchecker(bad_vocabulary) as spellchecker:
+                self.assertIsNone(spellchecker.find_correct_word("cta", "levenshtein"))
@@ -0,0 +1,228 @@
+"""
+Checks the second lab spellcheck service
+"""
+
+# pylint: disable=duplicate-code
+
+import asyncio
+import json
+import unittest
+from unittest import mock
+
+import pytest
+
+from lab_2_spellcheck.main import find_correct_word
+from lab_2_spellcheck.spellcheck_server import serve_lines, SpellcheckService
+from lab_2_spellcheck.vocabulary_indexes import VocabularyIndexes
+
+
+class SpellcheckServiceTest(unittest.TestCase):
+    """
+    Tests micro-batching spellcheck service.
+    """
+
+    def setUp(self) -> None:
+        self.vocabulary = {
+            "35": 0.04,
+            "across": 0.08,
+            "boy": 0.04,
+            "cat": 0.16,
+            "coffee": 0.04,
+            "friend": 0.04,
+            "kind": 0.04,
+            "library": 0.12,
+            "lived": 0.04,
+            "loved": 0.08,
+            "named": 0.04,
+            "opened": 0.04,
+            "shops": 0.04,
+            "smart": 0.04,
+            "stories": 0.04,
+            "stories101": 0.04,
+            "street": 0.08,
+        }
+
+        self.texts = ["The boyi lived on the streat.", "A cta loved coffe.", "The boyi said."]
+
+    def correct_all(self, texts: list[str], **batching: float) -> tuple[list, dict[str, float]]:
+        """
+        Correct texts concurrently with a started service.
+        """
+
+        async def run() -> tuple[list, dict[str, float]]:
+            service = SpellcheckService(VocabularyIndexes(self.vocabulary), "levenshtein")
+            await service.start(**batching)
+            results = await asyncio.gather(*(service.correct(text) for text in texts))
+            await service.stop()
+            return list(results), service.statistics
+
+        return asyncio.run(run())
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_correct_ideal(self):
+        """
+        Ideal scenario
+        """
+        results, _ = self.correct_all(self.texts)
+        for text, result in zip(self.texts, results):
+            words = [word.strip(".").lower() for word in text.split()]
+            self.assertDictEqual(
+                result,
+                {
+                    word: find_correct_word(word, self.vocabulary, "levenshtein")
+                    for word in words
+                    if word not in self.vocabulary
+                },
+            )
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_correct_batching(self):
+        """
+        Concurrent requests share a batch and duplicate words are corrected once
+        """
+        _, statistics = self.correct_all(self.texts, max_delay=0.5)
+        self.assertEqual(statistics["requests"], 3)
+        self.assertEqual(statistics["batches"], 1)
+        self.assertEqual(statistics["words"], 11)
+        self.assertEqual(statistics["corrected_words"], 8)
+        self.assertGreater(statistics["requests_per_second"], 0)
+        self.assertGreaterEqual(statistics["p99_ms"], statistics["p50_ms"])
+
+        _, statistics = self.correct_all(self.texts, max_batch_size=1)
+        self.assertEqual(statistics["batches"], 3)
+        self.assertEqual(statistics["corrected_words"], 10)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_serve_lines(self):
+        """
+        Responses follow the order of request lines
+        """
+        lines = [
+            json.dumps({"id": index, "text": text}) for index, text in enumerate(self.texts)
+        ] + [
+            "not json",
+            json.dumps({"id": 5}),
+            "",
+            json.dumps([1]),
+            json.dumps({"id": 6, "stats": True}),
+        ]
+        responses = []
+
+        async def send(response: str) -> None:
+            responses.append(json.loads(response))
+
+        async def run() -> None:
+            reader = asyncio.StreamReader()
+            reader.feed_data("\n".join(lines).encode("utf-8"))
+            reader.feed_eof()
+            service = SpellcheckService(VocabularyIndexes(self.vocabulary), "levenshtein")
+            await service.start()
+            await serve_lines(service, reader, send)
+            await service.stop()
+
+        asyncio.run(run())
+        self.assertListEqual(
+            [response["id"] for response in responses], [0, 1, 2, None, 5, None, 6]
+        )
+        self.assertDictEqual(
+            responses[1]["corrections"], {"a": "35", "coffe": "coffee", "cta": "cat"}
+        )
+        for response in responses[3:-1]:
+            self.assertIsNone(response["corrections"])
+        self.assertIn("p99_ms", responses[-1]["statistics"])
+        self.assertIn("requests_per_second", responses[-1]["statistics"])
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_serve_lines_send_failure(self):
+        """
+        Failed send stops reading an unfinished stream and is raised
+        """
+        failure = ConnectionResetError("client is gone")
+
+        async def send(response: str) -> None:
+            raise failure
+
+        async def run() -> BaseException | None:
+            reader = asyncio.StreamReader()
+            for index, text in enumerate(self.texts * 4):
+                reader.feed_data(json.dumps({"id": index, "text": text}).encode("utf-8") + b"\n")
+            service = SpellcheckService(VocabularyIndexes(self.vocabulary), "levenshtein")
+            await service.start()
+            raised = None
+            try:
+                await asyncio.wait_for(serve_lines(service, reader, send, max_pending=2), 5)
+            except ConnectionResetError as error:
+                raised = error
+            await service.stop()
+            return raised
+
+        self.assertIs(asyncio.run(run()), failure)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_correct_not_started(self):
+        """
+        Requests to a service that is not started are rejected
+        """
+        service = SpellcheckService(VocabularyIndexes(self.vocabulary), "levenshtein")
+        with self.assertRaises(RuntimeError):
+            asyncio.run(service.correct(self.texts[0]))
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_correct_failure(self):
+        """
+        Failed batch passes its error to the requests and the batcher goes on
+        """
+        responses = []
+
+        async def send(response: str) -> None:
+            responses.append(json.loads(response))
+
+        async def run() -> tuple[dict[str, str] | None, dict[str, float]]:
+            service = SpellcheckService(VocabularyIndexes(self.vocabulary), "levenshtein")
+            await service.start()
+            failure = RuntimeError("index failure")
+            with mock.patch.object(service, "_correct_words", side_effect=failure):
+                try:
+                    await service.correct(self.texts[0])
+                except RuntimeError as error:
+                    self.assertIs(error, failure)
+                reader = asyncio.StreamReader()
+                reader.feed_data(json.dumps({"id": 1, "text": self.texts[1]}).encode("utf-8"))
+                reader.feed_eof()
+                await serve_lines(service, reader, send)
+            result = await service.correct(self.texts[1])
+            await service.stop()
+            return result, service.statistics
+
+        result, statistics = asyncio.run(run())
+        self.assertDictEqual(result, {"a": "35", "coffe": "coffee", "cta": "cat"})
+        self.assertDictEqual(responses[0], {"id": 1, "corrections": None, "error": "index failure"})
+        self.assertEqual(statistics["failed_requests"], 2)
+        self.assertEqual(statistics["requests"], 1)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_latency_window(self):
+        """
+        Latency percentiles are taken over the last requests only
+        """
+        with mock.patch("lab_2_spellcheck.spellcheck_server.LATENCY_WINDOW", 2):
+            _, statistics = self.correct_all(self.texts, max_batch_size=1)
+        self.assertEqual(statistics["requests"], 3)
+        self.assertGreaterEqual(statistics["p99_ms"], statistics["p50_ms"])
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_correct_bad_input(self):
+        """
+        Bad input scenario
+        """
+        results, statistics = self.correct_all([None, 42, []])
+        self.assertListEqual(results, [None, None, None])
+        self.assertEqual(statistics["requests"], 0)
@@ -0,0 +1,103 @@
+"""
+Checks the second lab top-k suggestion function
+"""
+
+# pylint: disable=duplicate-code
+
+import unittest
+
+import pytest
+
+from lab_2_spellcheck.main import (
+    calculate_distance,
+    choose_closest_words,
+    find_correct_word,
+    suggest,
+)
+
+
+class SuggestTest(unittest.TestCase):
+    """
+    Tests function for top-k suggestions.
+    """
+
+    def setUp(self) -> None:
+        self.vocabulary = {
+            "35": 0.04,
+            "across": 0.08,
+            "boy": 0.04,
+            "cat": 0.16,
+            "coffee": 0.04,
+            "friend": 0.04,
+            "kind": 0.04,
+            "library": 0.12,
+            "lived": 0.04,
+            "loved": 0.08,
+            "named": 0.04,
+            "opened": 0.04,
+            "shops": 0.04,
+            "smart": 0.04,
+            "stories": 0.04,
+            "stories101": 0.04,
+            "street": 0.08,
+        }
+
+        self.misspelled = ["boyi", "streat", "coffe", "cta", "lovd"]
+        self.methods = ["jaccard", "frequency-based", "levenshtein", "jaro-winkler"]
+        self.alphabet = list("abcdefghijklmnopqrstuvwxyz")
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_suggest_ideal(self):
+        """
+        Ideal scenario
+        """
+        self.assertListEqual(
+            suggest("lovd", self.vocabulary, "levenshtein", 4), ["loved", "lived", "kind", "boy"]
+        )
+        self.assertListEqual(
+            suggest("cta", self.vocabulary, "jaccard", 3), ["cat", "smart", "across"]
+        )
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_suggest_matches_full_sort(self):
+        """
+        Suggestions are the head of all words sorted with the tie-break rules
+        """
+        for method in self.methods:
+            for word in self.misspelled:
+                distances = calculate_distance(word, self.vocabulary, method, self.alphabet)
+                ordered = sorted(
+                    distances,
+                    key=lambda candidate, token=word, scores=distances: (
+                        scores[candidate],
+                        abs(len(candidate) - len(token)),
+                        candidate,
+                    ),
+                )
+                for k in (1, 3, len(self.vocabulary), len(self.vocabulary) + 5):
+                    self.assertListEqual(
+                        suggest(word, self.vocabulary, method, k, self.alphabet), ordered[:k]
+                    )
+                self.assertEqual(
+                    find_correct_word(word, self.vocabulary, method, self.alphabet), ordered[0]
+                )
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_suggest_bad_input(self):
+        """
+        Bad input scenario
+        """
+        for bad_k in [None, True, 0, -1, 3.14, "3", [], {}]:
+            self.assertIsNone(suggest("cta", self.vocabulary, "levenshtein", bad_k))
+            self.assertIsNone(choose_closest_words("cta", {"cat": 1.0}, bad_k))
+        for bad_input in [None, True, 42, 3.14, (), {}, []]:
+            self.assertIsNone(suggest(bad_input, self.vocabulary, "levenshtein", 2))
+            self.assertIsNone(suggest("cta", bad_input, "levenshtein", 2))
+            self.assertIsNone(suggest("cta", self.vocabulary, bad_input, 2))
+            self.assertIsNone(choose_closest_words(bad_input, {"cat": 1.0}, 2))
+        self.assertIsNone(suggest("cta", self.vocabulary, "frequency-based", 2))
+        self.assertIsNone(suggest("cta", self.vocabulary, "levenshtein", 2, ""))
+        self.assertIsNone(choose_closest_words("cta", {}, 2))
@@ -0,0 +1,90 @@
+"""
+Checks the second lab vectorized Levenshtein engine
+"""
+
+# pylint: disable=duplicate-code
+
+import unittest
+
+import pytest
+
+from lab_2_spellcheck.main import calculate_distance, calculate_levenshtein_distance
+from lab_2_spellcheck.vectorized_levenshtein import VectorizedLevenshtein
+
+
+class VectorizedLevenshteinTest(unittest.TestCase):
+    """
+    Tests batch Levenshtein distance calculation.
+    """
+
+    def setUp(self) -> None:
+        self.vocabulary = {
+            "35": 0.04,
+            "across": 0.08,
+            "boy": 0.04,
+            "cat": 0.16,
+            "coffee": 0.04,
+            "friend": 0.04,
+            "kind": 0.04,
+            "library": 0.12,
+            "lived": 0.04,
+            "loved": 0.08,
+            "named": 0.04,
+            "opened": 0.04,
+            "shops": 0.04,
+            "smart": 0.04,
+            "stories": 0.04,
+            "stories101": 0.04,
+            "street": 0.08,
+        }
+
+        self.misspelled = ["boyi", "streat", "coffe", "cta", "", "librarystories101"]
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_calculate_distances_ideal(self):
+        """
+        Ideal scenario
+        """
+        for bucket_width in (1, 4, 100):
+            engine = VectorizedLevenshtein(self.vocabulary, bucket_width)
+            for misspelled in self.misspelled:
+                self.assertDictEqual(
+                    engine.calculate_distances(misspelled),
+                    calculate_distance(misspelled, self.vocabulary, "levenshtein"),
+                )
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_calculate_distance_array_cyrillic(self):
+        """
+        Cyrillic vocabulary with an empty word scenario
+        """
+        vocabulary = {"молоко": 0.4, "малина": 0.2, "": 0.2, "ёж": 0.2}
+        engine = VectorizedLevenshtein(vocabulary)
+        for misspelled in ("малоко", "еж", "", "кот"):
+            expected = [calculate_levenshtein_distance(misspelled, word) for word in vocabulary]
+            self.assertListEqual(engine.calculate_distance_array(misspelled).tolist(), expected)
+        self.assertListEqual(engine.words, list(vocabulary))
+        self.assertDictEqual(
+            engine.statistics, {"searches": 4, "cells": (6 + 2 + 0 + 3) * (2 * 6 + 2 * 2)}
+        )
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_vectorized_levenshtein_bad_input(self):
+        """
+        Bad input scenario
+        """
+        engine = VectorizedLevenshtein(self.vocabulary)
+        for bad_token in [None, True, 42, 3.14, (), [], {}]:
+            self.assertIsNone(engine.calculate_distance_array(bad_token))
+            self.assertIsNone(engine.calculate_distances(bad_token))
+
+        bad_vocabularies = [None, True, 42, 3.14, (), "document", [], {}, {"good": "bad"}]
+        for bad_vocabulary in bad_vocabularies:
+            self.assertIsNone(VectorizedLevenshtein(bad_vocabulary).calculate_distances("word"))
+
+        for bad_width in [None, True, 3.14, -1, 0, ""]:
+            engine = VectorizedLevenshtein(self.vocabulary, bad_width)
+            self.assertIsNone(engine.calculate_distances("word"))
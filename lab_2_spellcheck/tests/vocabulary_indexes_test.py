@@ -0,0 +1,124 @@
+"""
+Checks the second lab shared vocabulary indexes
+"""
+
+# pylint: disable=duplicate-code
+
+import unittest
+from unittest import mock
+
+import pytest
+
+from lab_2_spellcheck.main import find_correct_word, suggest
+from lab_2_spellcheck.vocabulary_indexes import VocabularyIndexes
+
+
+class VocabularyIndexesTest(unittest.TestCase):
+    """
+    Tests word correction with shared indexes.
+    """
+
+    def setUp(self) -> None:
+        self.vocabulary = {
+            "35": 0.04,
+            "across": 0.08,
+            "boy": 0.04,
+            "cat": 0.16,
+            "coffee": 0.04,
+            "friend": 0.04,
+            "kind": 0.04,
+            "library": 0.12,
+            "lived": 0.04,
+            "loved": 0.08,
+            "named": 0.04,
+            "opened": 0.04,
+            "shops": 0.04,
+            "smart": 0.04,
+            "stories": 0.04,
+            "stories101": 0.04,
+            "street": 0.08,
+        }
+
+        self.misspelled = ["boyi", "streat", "coffe", "cta", "", "librari", "35a", "zzz"]
+        self.methods = [
+            "jaccard",
+            "frequency-based",
+            "levenshtein",
+            "jaro-winkler",
+            "weighted-levenshtein",
+        ]
+        self.alphabet_en = list("abcdefghijklmnopqrstuvwxyz")
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_find_correct_word_ideal(self):
+        """
+        Ideal scenario
+        """
+        indexes = VocabularyIndexes(self.vocabulary)
+        for method in self.methods:
+            for alphabet in (self.alphabet_en, None, []):
+                for misspelled in self.misspelled:
+                    self.assertEqual(
+                        indexes.find_correct_word(misspelled, method, alphabet),
+                        find_correct_word(misspelled, self.vocabulary, method, alphabet),
+                    )
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_suggest_ideal(self):
+        """
+        Suggestions are the same as of suggest
+        """
+        indexes = VocabularyIndexes(self.vocabulary)
+        for method in self.methods:
+            for k in (1, 3, 20):
+                for misspelled in self.misspelled:
+                    self.assertEqual(
+                        indexes.suggest(misspelled, method, k, self.alphabet_en),
+                        suggest(misspelled, self.vocabulary, method, k, self.alphabet_en),
+                    )
+        for bad_k in [None, True, 0, -1, 3.14]:
+            self.assertIsNone(indexes.suggest("cta", "levenshtein", bad_k))
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_build(self):
+        """
+        Only the index of the method is built, once, and reused
+        """
+        indexes = VocabularyIndexes(self.vocabulary)
+        with (
+            mock.patch("lab_2_spellcheck.vocabulary_indexes.DeletionIndex") as deletion_index,
+            mock.patch("lab_2_spellcheck.vocabulary_indexes.JaroWinklerIndex") as jaro_winkler,
+        ):
+            indexes.build("levenshtein")
+            indexes.build("weighted-levenshtein")
+        deletion_index.assert_not_called()
+        jaro_winkler.assert_not_called()
+
+        indexes.build("frequency-based")
+        built = (indexes.qgrams, indexes.deletion_index, indexes.encodings)
+        for method in self.methods:
+            indexes.find_correct_word("cta", method, list("abc"))
+        self.assertIs(indexes.qgrams, built[0])
+        self.assertIs(indexes.deletion_index, built[1])
+        self.assertIs(indexes.encodings, built[2])
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_find_correct_word_bad_input(self):
+        """
+        Bad input scenario
+        """
+        for bad_vocabulary in [None, True, 42, 3.14, (), "document", [], {}, {"good": "bad"}]:
+            indexes = VocabularyIndexes(bad_vocabulary)
+            self.assertEqual(indexes.vocabulary, {})
+            self.assertIsNone(indexes.find_correct_word("word", "levenshtein"))
+        indexes = VocabularyIndexes(self.vocabulary)
+        for bad_input in [None, True, 42, 3.14, (), {}, []]:
+            self.assertIsNone(indexes.find_correct_word(bad_input, "jaccard"))
+            self.assertIsNone(indexes.find_correct_word("word", bad_input))
+        self.assertIsNone(indexes.find_correct_word("word", "jacard"))
+        self.assertIsNone(indexes.find_correct_word("word", "levenshtein", ""))
+        self.assertIsNone(indexes.find_correct_word("word", "frequency-based"))
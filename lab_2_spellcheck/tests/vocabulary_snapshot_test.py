@@ -0,0 +1,204 @@
+"""
+Checks the second lab vocabulary snapshots
+"""
+
+# pylint: disable=duplicate-code
+
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from lab_1_keywords_tfidf.main import clean_and_tokenize, remove_stop_words
+from lab_2_spellcheck.main import build_vocabulary
+from lab_2_spellcheck.vocabulary_snapshot import (
+    hash_sources,
+    load_snapshot,
+    VocabularySnapshot,
+    write_snapshot,
+)
+
+ASSETS_PATH = Path(__file__).parent.parent / "assets"
+
+
+class VocabularySnapshotTest(unittest.TestCase):
+    """
+    Tests persisted vocabulary snapshots.
+    """
+
+    def setUp(self) -> None:
+        self.vocabulary = {
+            "35": 0.04,
+            "across": 0.08,
+            "boy": 0.04,
+            "cat": 0.16,
+            "coffee": 0.04,
+            "friend": 0.04,
+            "kind": 0.04,
+            "library": 0.12,
+            "lived": 0.04,
+            "loved": 0.08,
+            "named": 0.04,
+            "opened": 0.04,
+            "shops": 0.04,
+            "smart": 0.04,
+            "stories": 0.04,
+            "stories101": 0.04,
+            "street": 0.08,
+        }
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_write_snapshot_ideal(self):
+        """
+        Ideal scenario
+        """
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / "vocabulary.snapshot"
+            write_snapshot(path, self.vocabulary, "hash")
+            with VocabularySnapshot(path) as snapshot:
+                self.assertEqual(snapshot.source_hash, "hash")
+                self.assertEqual(snapshot.words, list(self.vocabulary))
+                self.assertEqual(snapshot.vocabulary, self.vocabulary)
+                self.assertEqual(snapshot.lengths.tolist(), [len(word) for word in self.vocabulary])
+                self.assertEqual(
+                    snapshot.get_words_of_length(5), ["lived", "loved", "named", "shops", "smart"]
+                )
+                self.assertEqual(snapshot.get_words_of_length(2), ["35"])
+                self.assertEqual(snapshot.get_words_of_length(8), [])
+                self.assertEqual(snapshot.get_words_of_length(100), [])
+
+                for word, signature in zip(snapshot.words, snapshot.signatures.tolist()):
+                    letters = {
+                        letter
+                        for index, letter in enumerate(snapshot.letters)
+                        if signature[index // 64] >> (index % 64) & 1
+                    }
+                    self.assertEqual(letters, set(word))
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_close_with_arrays_held(self):
+        """
+        Arrays taken from the snapshot outlive its context
+        """
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / "vocabulary.snapshot"
+            write_snapshot(path, self.vocabulary, "hash")
+            with VocabularySnapshot(path) as snapshot:
+                frequencies = snapshot.frequencies
+                lengths = snapshot.lengths
+            snapshot.close()
+            self.assertEqual(frequencies.tolist()[:2], [0.04, 0.08])
+            self.assertEqual(lengths.tolist()[:2], [2, 6])
+            del frequencies, lengths
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_closed_snapshot(self):
+        """
+        Data of a closed snapshot cannot be read, its header can
+        """
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / "vocabulary.snapshot"
+            write_snapshot(path, self.vocabulary, "hash")
+            with VocabularySnapshot(path) as snapshot:
+                self.assertEqual(len(snapshot.words), len(self.vocabulary))
+            for accessor in ("words", "vocabulary", "frequencies", "lengths", "signatures"):
+                with self.assertRaisesRegex(ValueError, "closed"):
+                    getattr(snapshot, accessor)
+            with self.assertRaisesRegex(ValueError, "closed"):
+                snapshot.get_words_of_length(3)
+            self.assertEqual(snapshot.source_hash, "hash")
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_write_snapshot_empty_vocabulary(self):
+        """
+        Empty vocabulary scenario
+        """
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / "vocabulary.snapshot"
+            write_snapshot(path, {}, "hash")
+            with VocabularySnapshot(path) as snapshot:
+                self.assertEqual(snapshot.vocabulary, {})
+                self.assertEqual(snapshot.get_words_of_length(0), [])
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_load_snapshot_source_text(self):
+        """
+        Snapshot of the chapter matches build_vocabulary
+        """
+        source_path = ASSETS_PATH / "Master_and_Margarita_chapter1.txt"
+        stop_words_path = ASSETS_PATH / "stop_words.txt"
+        tokens = clean_and_tokenize(source_path.read_text(encoding="utf-8"))
+        tokens = remove_stop_words(tokens, stop_words_path.read_text(encoding="utf-8").split("\n"))
+        expected = build_vocabulary(tokens)
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / "vocabulary.snapshot"
+            with load_snapshot(path, source_path, stop_words_path) as snapshot:
+                self.assertEqual(snapshot.vocabulary, expected)
+                self.assertEqual(snapshot.source_hash, hash_sources(source_path, stop_words_path))
+            modified = path.stat().st_mtime_ns
+
+            with load_snapshot(path, source_path, stop_words_path) as snapshot:
+                self.assertEqual(snapshot.vocabulary, expected)
+            self.assertEqual(path.stat().st_mtime_ns, modified)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_load_snapshot_rebuild(self):
+        """
+        Snapshot is rebuilt when the source changes or the file is corrupt
+        """
+        with TemporaryDirectory() as directory:
+            source_path = Path(directory) / "source.txt"
+            path = Path(directory) / "vocabulary.snapshot"
+            source_path.write_text("The cat and the boy.", encoding="utf-8")
+            with load_snapshot(path, source_path) as snapshot:
+                self.assertEqual(
+                    snapshot.vocabulary, {"the": 0.4, "cat": 0.2, "and": 0.2, "boy": 0.2}
+                )
+
+            source_path.write_text("A cat.", encoding="utf-8")
+            with load_snapshot(path, source_path) as snapshot:
+                self.assertEqual(snapshot.vocabulary, {"a": 0.5, "cat": 0.5})
+
+            path.write_bytes(b"corrupt")
+            with load_snapshot(path, source_path) as snapshot:
+                self.assertEqual(snapshot.vocabulary, {"a": 0.5, "cat": 0.5})
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_hash_sources(self):
+        """
+        Hash depends on the contents of both files
+        """
+        with TemporaryDirectory() as directory:
+            first_path = Path(directory) / "first.txt"
+            second_path = Path(directory) / "second.txt"
+            first_path.write_text("cat", encoding="utf-8")
+            second_path.write_text("cat", encoding="utf-8")
+            self.assertEqual(hash_sources(first_path), hash_sources(second_path))
+            self.assertNotEqual(hash_sources(first_path), hash_sources(first_path, second_path))
+            second_path.write_text("boy", encoding="utf-8")
+            self.assertNotEqual(
+                hash_sources(first_path, first_path), hash_sources(first_path, second_path)
+            )
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_vocabulary_snapshot_bad_input(self):
+        """
+        Bad input scenario
+        """
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / "vocabulary.snapshot"
+            path.write_bytes(b"corrupt")
+            self.assertRaises(ValueError, VocabularySnapshot, path)
+            write_snapshot(path, self.vocabulary, "hash")
+            with VocabularySnapshot(path) as snapshot:
+                self.assertEqual(snapshot.get_words_of_length(-1), [])
+                self.assertEqual(snapshot.get_words_of_length(None), [])
@@ -0,0 +1,116 @@
+"""
+Checks the second lab trie-based Levenshtein search
+"""
+
+# pylint: disable=duplicate-code
+
+import unittest
+
+import pytest
+
+from lab_2_spellcheck.main import calculate_distance, find_correct_word
+from lab_2_spellcheck.vocabulary_trie import VocabularyTrie
+
+
+class VocabularyTrieLevenshteinTest(unittest.TestCase):
+    """
+    Tests nearest word search over the vocabulary trie.
+    """
+
+    def setUp(self) -> None:
+        self.vocabulary = {
+            "35": 0.04,
+            "across": 0.08,
+            "boy": 0.04,
+            "cat": 0.16,
+            "coffee": 0.04,
+            "friend": 0.04,
+            "kind": 0.04,
+            "library": 0.12,
+            "lived": 0.04,
+            "loved": 0.08,
+            "named": 0.04,
+            "opened": 0.04,
+            "shops": 0.04,
+            "smart": 0.04,
+            "stories": 0.04,
+            "stories101": 0.04,
+            "street": 0.08,
+        }
+
+        self.misspelled = ["boyi", "streat", "coffe", "cta", "", "lovd", "stories10"]
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_find_nearest_word_ideal(self):
+        """
+        Ideal scenario
+        """
+        trie = VocabularyTrie(self.vocabulary)
+        for misspelled in self.misspelled:
+            self.assertEqual(
+                trie.find_nearest_word(misspelled),
+                find_correct_word(misspelled, self.vocabulary, "levenshtein"),
+            )
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_find_nearest_words_ideal(self):
+        """
+        Top-k words follow the tie-break rules of find_correct_word
+        """
+        trie = VocabularyTrie(self.vocabulary)
+        for misspelled in self.misspelled:
+            distances = calculate_distance(misspelled, self.vocabulary, "levenshtein")
+            expected = sorted(
+                distances,
+                key=lambda word, scores=distances, token=misspelled: (
+                    scores[word],
+                    abs(len(word) - len(token)),
+                    word,
+                ),
+            )
+            for k in (1, 3, 17, 100):
+                self.assertListEqual(trie.find_nearest_words(misspelled, k), expected[:k])
+            within_two = [word for word in expected if distances[word] <= 2]
+            self.assertListEqual(trie.find_nearest_words(misspelled, 100, 2), within_two)
+        self.assertEqual(trie.statistics["searches"], 5 * len(self.misspelled))
+        self.assertGreater(trie.statistics["visited"], 0)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_find_nearest_word_max_distance(self):
+        """
+        No word within max distance scenario
+        """
+        trie = VocabularyTrie(self.vocabulary)
+        self.assertIsNone(trie.find_nearest_word("zzzzzz", 1))
+        self.assertListEqual(trie.find_nearest_words("zzzzzz", 3, 0), [])
+        self.assertEqual(trie.find_nearest_word("cat", 0), "cat")
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_find_nearest_word_empty_word_in_vocabulary(self):
+        """
+        Vocabulary with an empty word scenario
+        """
+        trie = VocabularyTrie({"": 0.5, "ёж": 0.5})
+        self.assertEqual(trie.find_nearest_word("е"), "")
+        self.assertListEqual(trie.find_nearest_words("еж", 2), ["ёж", ""])
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_find_nearest_words_bad_input(self):
+        """
+        Bad input scenario
+        """
+        trie = VocabularyTrie(self.vocabulary)
+        for bad_token in [None, True, 42, 3.14, (), [], {}]:
+            self.assertIsNone(trie.find_nearest_word(bad_token))
+            self.assertIsNone(trie.find_nearest_words(bad_token, 1))
+        for bad_number in [True, 3.14, -1, "", ()]:
+            self.assertIsNone(trie.find_nearest_words("word", bad_number))
+            self.assertIsNone(trie.find_nearest_words("word", 1, bad_number))
+        self.assertIsNone(trie.find_nearest_words("word", None))
+        self.assertIsNone(trie.find_nearest_words("word", 0))
+        self.assertIsNone(VocabularyTrie({}).find_nearest_word("word"))
@@ -0,0 +1,164 @@
+"""
+Checks the second lab vocabulary trie candidate generation
+"""
+
+# pylint: disable=duplicate-code
+
+import unittest
+from types import GeneratorType
+
+import pytest
+
+from lab_2_spellcheck.main import calculate_frequency_distance, propose_candidates
+from lab_2_spellcheck.vocabulary_trie import VocabularyTrie
+
+
+class VocabularyTrieTest(unittest.TestCase):
+    """
+    Tests trie-based candidate generation.
+    """
+
+    def setUp(self) -> None:
+        self.vocabulary = {
+            "35": 0.04,
+            "across": 0.08,
+            "boy": 0.04,
+            "cat": 0.16,
+            "coffee": 0.04,
+            "friend": 0.04,
+            "kind": 0.04,
+            "library": 0.12,
+            "lived": 0.04,
+            "loved": 0.08,
+            "named": 0.04,
+            "opened": 0.04,
+            "shops": 0.04,
+            "smart": 0.04,
+            "stories": 0.04,
+            "stories101": 0.04,
+            "street": 0.08,
+        }
+
+        self.misspelled = ["boyi", "streat", "coffe", "cta", "", "libbrary", "lovd", "35"]
+        self.alphabet_en = list("abcdefghijklmnopqrstuvwxyz")
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_propose_candidates_ideal(self):
+        """
+        Ideal scenario
+        """
+        trie = VocabularyTrie(self.vocabulary)
+        for alphabet in (self.alphabet_en, [], list("eo")):
+            for misspelled in self.misspelled:
+                expected = tuple(
+                    candidate
+                    for candidate in propose_candidates(misspelled, alphabet)
+                    if candidate in self.vocabulary
+                )
+                self.assertTupleEqual(trie.propose_candidates(misspelled, alphabet), expected)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_calculate_frequency_distance_ideal(self):
+        """
+        Same result as calculate_frequency_distance
+        """
+        trie = VocabularyTrie(self.vocabulary)
+        for alphabet in (self.alphabet_en, []):
+            for misspelled in self.misspelled:
+                self.assertDictEqual(
+                    trie.calculate_frequency_distance(misspelled, alphabet),
+                    calculate_frequency_distance(misspelled, self.vocabulary, alphabet),
+                )
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_iterate_candidates_lazy(self):
+        """
+        Candidates are produced lazily and without repetitions
+        """
+        trie = VocabularyTrie(self.vocabulary)
+        candidates = trie.iterate_candidates("stret", self.alphabet_en)
+        self.assertIsInstance(candidates, GeneratorType)
+        self.assertEqual(next(candidates), "street")
+        self.assertListEqual(list(candidates), [])
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_iterate_candidates_dense(self):
+        """
+        Consecutive edits acting on each other are found in a dense vocabulary
+        """
+        words = [""]
+        for _ in range(5):
+            words = [""] + [word + letter for word in words for letter in "abc"]
+        vocabulary = dict.fromkeys(words, 0.1)
+        trie = VocabularyTrie(vocabulary)
+        for alphabet in ([], ["a"], ["b", "d"], ["a", "b", "c"]):
+            for misspelled in ("", "a", "abc", "acb", "abcx", "xab", "cabca"):
+                expected = {
+                    candidate
+                    for candidate in propose_candidates(misspelled, alphabet) or ()
+                    if candidate in vocabulary
+                }
+                actual = list(trie.iterate_candidates(misspelled, alphabet))
+                self.assertEqual(len(actual), len(expected))
+                self.assertSetEqual(set(actual), expected)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_propose_candidates_cyrillic(self):
+        """
+        Cyrillic vocabulary scenario
+        """
+        vocabulary = {"молоко": 0.4, "малина": 0.2, "мир": 0.2, "ёж": 0.2}
+        alphabet_ru = list("абвгдеёжзийклмнопрстуфхцчшщъыьэюя")
+        trie = VocabularyTrie(vocabulary)
+        self.assertTupleEqual(trie.propose_candidates("малоко", alphabet_ru), ("молоко",))
+        self.assertTupleEqual(trie.propose_candidates("мри", alphabet_ru), ("мир",))
+        self.assertTupleEqual(trie.propose_candidates("еж", alphabet_ru), ("ёж",))
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_add_remove_word(self):
+        """
+        Updated trie matches a trie built from the updated vocabulary
+        """
+        trie = VocabularyTrie(self.vocabulary)
+        trie.add_word("cot", 0.5)
+        trie.remove_word("stories101")
+        trie.remove_word("cat")
+        trie.remove_word("absent")
+        vocabulary = dict(self.vocabulary, cot=0.5)
+        del vocabulary["stories101"]
+        del vocabulary["cat"]
+        for misspelled in self.misspelled + ["stories10", "ca"]:
+            self.assertDictEqual(
+                trie.calculate_frequency_distance(misspelled, self.alphabet_en),
+                calculate_frequency_distance(misspelled, vocabulary, self.alphabet_en),
+            )
+        self.assertNotIn("a", trie.root.children["c"].children)
+        self.assertIn("stories", self.vocabulary)
+        self.assertIn("cat", self.vocabulary)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_vocabulary_trie_bad_input(self):
+        """
+        Bad input scenario
+        """
+        trie = VocabularyTrie(self.vocabulary)
+        bad_words = [None, True, 42, 3.14, (), [], {}]
+        bad_alphabets = [None, True, 42, 3.14, (), "", {}]
+        for bad_word in bad_words:
+            self.assertIsNone(trie.propose_candidates(bad_word, self.alphabet_en))
+            self.assertIsNone(trie.calculate_frequency_distance(bad_word, self.alphabet_en))
+            self.assertListEqual(list(trie.iterate_candidates(bad_word, self.alphabet_en)), [])
+        for bad_alphabet in bad_alphabets:
+            self.assertIsNone(trie.propose_candidates("word", bad_alphabet))
+            self.assertIsNone(trie.calculate_frequency_distance("word", bad_alphabet))
+
+        bad_vocabularies = [None, True, 42, 3.14, (), "document", [], {}, {"good": "bad"}]
+        for bad_vocabulary in bad_vocabularies:
+            self.assertIsNone(VocabularyTrie(bad_vocabulary).propose_candidates("word", []))
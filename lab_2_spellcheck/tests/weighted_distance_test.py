@@ -0,0 +1,145 @@
+"""
+Checks the second lab weighted edit distance
+"""
+
+# pylint: disable=duplicate-code
+
+import unittest
+
+import pytest
+
+from lab_2_spellcheck.main import (
+    calculate_distance,
+    calculate_levenshtein_distance,
+    find_correct_word,
+)
+from lab_2_spellcheck.weighted_distance import (
+    ADJACENT_KEY_COST,
+    calculate_weighted_distance,
+    CostTable,
+    KEYBOARD_COSTS,
+    YO_COST,
+)
+
+
+class WeightedDistanceTest(unittest.TestCase):
+    """
+    Tests weighted Damerau-Levenshtein distance.
+    """
+
+    def setUp(self) -> None:
+        self.vocabulary = {
+            "35": 0.04,
+            "across": 0.08,
+            "boy": 0.04,
+            "cat": 0.16,
+            "coffee": 0.04,
+            "friend": 0.04,
+            "kind": 0.04,
+            "library": 0.12,
+            "lived": 0.04,
+            "loved": 0.08,
+            "named": 0.04,
+            "opened": 0.04,
+            "shops": 0.04,
+            "smart": 0.04,
+            "stories": 0.04,
+            "stories101": 0.04,
+            "street": 0.08,
+        }
+
+        self.misspelled = ["boyi", "streat", "coffe", "cta", "", "libbrary", "lovd", "35"]
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_unit_costs_ideal(self):
+        """
+        Unit costs give Levenshtein distance with swaps of adjacent letters
+        """
+        costs = CostTable(list("abcdefghijklmnopqrstuvwxyz"))
+        for token in self.misspelled:
+            for word in self.vocabulary:
+                expected = calculate_levenshtein_distance(token, word)
+                actual = costs.calculate_distance(token, word)
+                self.assertLessEqual(actual, expected)
+                self.assertGreaterEqual(actual, expected / 2)
+        self.assertEqual(costs.calculate_distance("cta", "cat"), 1.0)
+        self.assertEqual(costs.calculate_distance("ca", "abc"), 3.0)
+        self.assertEqual(costs.calculate_distance("", "cat"), 3.0)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_custom_costs(self):
+        """
+        Costs of letter pairs are taken from the tables
+        """
+        costs = CostTable(list("abc"), {("a", "b"): 0.25}, {("a", "c"): 0.5}, 2.0)
+        self.assertListEqual(costs.alphabet, ["a", "b", "c"])
+        self.assertListEqual(costs.encode("cab!"), [2, 0, 1, 3])
+        self.assertEqual(costs.calculate_distance("ba", "aa"), 0.25)
+        self.assertEqual(costs.calculate_distance("ab", "ba"), 0.5)
+        self.assertEqual(costs.calculate_distance("bc", "cb"), 1.0)
+        self.assertEqual(costs.calculate_distance("ac", "ca"), 0.5)
+        self.assertEqual(costs.calculate_distance("a", ""), 2.0)
+        self.assertEqual(costs.calculate_distance("!", "?"), 1.0)
+        self.assertEqual(costs.get_substitution_cost("b", "a"), 0.25)
+        self.assertEqual(costs.get_substitution_cost("!", "!"), 0.0)
+        self.assertDictEqual(
+            costs.calculate_distances("cab", {"abc": 0.5, "cb": 0.5}),
+            costs.calculate_distances("cab", {"cb": 0.5, "abc": 0.5}),
+        )
+        encodings = costs.encode_words(["abc", "cb"])
+        self.assertDictEqual(encodings, {"abc": [0, 1, 2], "cb": [2, 1]})
+        self.assertDictEqual(
+            costs.calculate_distances("cab", {"abc": 0.5, "cb": 0.5, "a": 0.5}, encodings),
+            costs.calculate_distances("cab", {"abc": 0.5, "cb": 0.5, "a": 0.5}),
+        )
+        self.assertFalse(hasattr(costs, "_encodings"))
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_keyboard_costs(self):
+        """
+        Neighbouring keys and yo are cheaper than other substitutions
+        """
+        self.assertEqual(calculate_weighted_distance("ещё", "еще"), YO_COST)
+        self.assertEqual(calculate_weighted_distance("cst", "cat"), ADJACENT_KEY_COST)
+        self.assertEqual(calculate_weighted_distance("cbt", "cat"), 1.0)
+        self.assertEqual(KEYBOARD_COSTS.get_substitution_cost("ц", "ы"), ADJACENT_KEY_COST)
+        self.assertEqual(KEYBOARD_COSTS.get_substitution_cost("ы", "ц"), ADJACENT_KEY_COST)
+        self.assertEqual(KEYBOARD_COSTS.get_substitution_cost("ц", "ж"), 1.0)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_weighted_method_ideal(self):
+        """
+        Weighted distance is selectable in calculate_distance and find_correct_word
+        """
+        distances = calculate_distance("cst", self.vocabulary, "weighted-levenshtein")
+        self.assertDictEqual(distances, KEYBOARD_COSTS.calculate_distances("cst", self.vocabulary))
+        self.assertEqual(distances["cat"], ADJACENT_KEY_COST)
+        self.assertEqual(find_correct_word("cst", self.vocabulary, "weighted-levenshtein"), "cat")
+        self.assertEqual(
+            find_correct_word("stroet", self.vocabulary, "weighted-levenshtein"), "street"
+        )
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_weighted_distance_bad_input(self):
+        """
+        Bad input scenario
+        """
+        for bad_input in (None, 1, [], {}):
+            self.assertIsNone(calculate_weighted_distance(bad_input, "cat"))
+            self.assertIsNone(calculate_weighted_distance("cat", bad_input))
+            self.assertIsNone(KEYBOARD_COSTS.calculate_distances(bad_input, self.vocabulary))
+            self.assertIsNone(KEYBOARD_COSTS.calculate_distances("cat", bad_input))
+            self.assertIsNone(KEYBOARD_COSTS.get_substitution_cost(bad_input, "a"))
+        for bad_words in (None, 1, "cat", [1]):
+            self.assertIsNone(KEYBOARD_COSTS.encode_words(bad_words))
+        self.assertIsNone(KEYBOARD_COSTS.calculate_distances("cat", self.vocabulary, []))
+        for bad_letter in ("", "ab", "аб"):
+            self.assertIsNone(KEYBOARD_COSTS.get_substitution_cost(bad_letter, "a"))
+            self.assertIsNone(KEYBOARD_COSTS.get_substitution_cost("a", bad_letter))
+        self.assertListEqual(CostTable(None).alphabet, [])
+        self.assertIsNone(calculate_distance(None, self.vocabulary, "weighted-levenshtein"))
@@ -0,0 +1,123 @@
+"""
+Levenshtein distance from one token to the whole vocabulary with NumPy.
+"""
+
+import numpy as np
+
+from lab_1_keywords_tfidf.main import check_dict, check_positive_int
+
+
+class VectorizedLevenshtein:
+    """
+    Batch Levenshtein engine over a vocabulary packed into code point matrices.
+
+    Vocabulary words are grouped by length and every group is stored as a padded
+    ``uint32`` matrix of code points. The Wagner-Fischer matrix is filled row by
+    row over the letters of the query, each row being computed for all words of
+    a group at once. Insertions inside a row are resolved with a running minimum:
+    ``row[j] = min(k <= j) (candidates[k] + j - k)``.
+    """
+
+    def __init__(self, vocabulary: dict[str, float], bucket_width: int = 4) -> None:
+        """
+        Initialize an instance of the VectorizedLevenshtein.
+
+        Args:
+            vocabulary (dict[str, float]): Dictionary with words and their relative frequencies
+            bucket_width (int): Range of word lengths packed into one matrix
+        """
+        self._words: list[str] = []
+        self._groups: list[tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        self._statistics = {"searches": 0, "cells": 0}
+        if not check_dict(vocabulary, str, float, False) or not check_positive_int(bucket_width):
+            return
+        self._words = list(vocabulary)
+        buckets: dict[int, list[int]] = {}
+        for position, word in enumerate(self._words):
+            buckets.setdefault(len(word) // bucket_width, []).append(position)
+        for positions in buckets.values():
+            lengths = np.array([len(self._words[position]) for position in positions])
+            codes = np.zeros((len(positions), int(lengths.max())), dtype=np.uint32)
+            for row, position in enumerate(positions):
+                codes[row, : lengths[row]] = _encode(self._words[position])
+            self._groups.append((np.array(positions), codes, lengths))
+
+    @property
+    def words(self) -> list[str]:
+        """
+        Get vocabulary words in the order of calculated distances.
+
+        Returns:
+            list[str]: Vocabulary words
+        """
+        return self._words
+
+    @property
+    def statistics(self) -> dict[str, int]:
+        """
+        Get search counters.
+
+        Returns:
+            dict[str, int]: Numbers of searches and filled cells of the
+                padded Wagner-Fischer matrices
+        """
+        return dict(self._statistics)
+
+    def calculate_distance_array(self, token: str) -> np.ndarray | None:
+        """
+        Calculate Levenshtein distance between the token and every vocabulary word.
+
+        Args:
+            token (str): Word to compare with the vocabulary
+
+        Returns:
+            np.ndarray | None: Distances aligned with the vocabulary words.
+
+        In case of corrupt input arguments or empty vocabulary, None is returned.
+        """
+        if not isinstance(token, str) or not self._words:
+            return None
+        query = _encode(token)
+        distances = np.empty(len(self._words), dtype=np.int64)
+        for positions, codes, lengths in self._groups:
+            offsets = np.arange(codes.shape[1] + 1, dtype=np.int32)
+            row = np.tile(offsets, (len(positions), 1))
+            for index, letter in enumerate(query, start=1):
+                candidates = np.empty_like(row)
+                candidates[:, 0] = index
+                np.minimum(row[:, :-1] + (codes != letter), row[:, 1:] + 1, out=candidates[:, 1:])
+                row = np.minimum.accumulate(candidates - offsets, axis=1) + offsets
+            distances[positions] = row[np.arange(len(positions)), lengths]
+            self._statistics["cells"] += len(query) * codes.size
+        self._statistics["searches"] += 1
+        return distances
+
+    def calculate_distances(self, token: str) -> dict[str, float] | None:
+        """
+        Calculate Levenshtein distances in the format of calculate_distance.
+
+        Args:
+            token (str): Word to compare with the vocabulary
+
+        Returns:
+            dict[str, float] | None: Vocabulary words and Levenshtein distances to them.
+
+        In case of corrupt input arguments or empty vocabulary, None is returned.
+        """
+        distances = self.calculate_distance_array(token)
+        if distances is None:
+            return None
+        return {word: float(distance) for word, distance in zip(self._words, distances.tolist())}
+
+
+def _encode(word: str) -> np.ndarray:
+    """
+    Convert a word into an array of code points.
+
+    Args:
+        word (str): Word to convert
+
+    Returns:
+        np.ndarray: Code points of the word letters
+    """
+    return np.frombuffer(word.encode("utf-32-le"), dtype=np.uint32)
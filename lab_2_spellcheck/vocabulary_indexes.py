@@ -0,0 +1,217 @@
+"""
+Lookup structures of one vocabulary shared by spellcheck entry points.
+"""
+
+from typing import Literal
+
+from lab_1_keywords_tfidf.main import check_dict, check_list, check_positive_int
+from lab_2_spellcheck.deletion_index import DeletionIndex
+from lab_2_spellcheck.jaccard_signatures import JaccardSignatures
+from lab_2_spellcheck.jaro_winkler_index import JaroWinklerIndex
+from lab_2_spellcheck.main import choose_closest_words
+from lab_2_spellcheck.qgram_index import QGramIndex
+from lab_2_spellcheck.vocabulary_trie import VocabularyTrie
+from lab_2_spellcheck.weighted_distance import KEYBOARD_COSTS
+
+Method = Literal[
+    "jaccard", "frequency-based", "levenshtein", "jaro-winkler", "weighted-levenshtein"
+]
+
+
+class VocabularyIndexes:
+    """
+    Vocabulary together with the indexes used to correct words against it.
+
+    Indexes are built on first use and then reused for every correction, so an
+    instance is meant to be built once and shared, e.g. inherited by forked
+    worker processes.
+    """
+
+    def __init__(self, vocabulary: dict[str, float]) -> None:
+        """
+        Initialize an instance of the VocabularyIndexes.
+
+        Args:
+            vocabulary (dict[str, float]): Dictionary with words and their relative frequencies
+        """
+        self._vocabulary: dict[str, float] = {}
+        if check_dict(vocabulary, str, float, False):
+            self._vocabulary = vocabulary
+        self._trie: VocabularyTrie | None = None
+        self._signatures: JaccardSignatures | None = None
+        self._jaro_winkler: JaroWinklerIndex | None = None
+        self._qgrams: QGramIndex | None = None
+        self._deletions: DeletionIndex | None = None
+        self._encodings: dict[str, list[int]] | None = None
+
+    @property
+    def vocabulary(self) -> dict[str, float]:
+        """
+        Get the indexed vocabulary.
+
+        Returns:
+            dict[str, float]: Words and their relative frequencies
+        """
+        return self._vocabulary
+
+    @property
+    def trie(self) -> VocabularyTrie:
+        """
+        Get the character trie of the vocabulary.
+
+        Returns:
+            VocabularyTrie: Vocabulary trie
+        """
+        if self._trie is None:
+            self._trie = VocabularyTrie(self._vocabulary)
+        return self._trie
+
+    @property
+    def signatures(self) -> JaccardSignatures:
+        """
+        Get bitmask signatures of the vocabulary.
+
+        Returns:
+            JaccardSignatures: Letter signatures of vocabulary words
+        """
+        if self._signatures is None:
+            self._signatures = JaccardSignatures(self._vocabulary)
+        return self._signatures
+
+    @property
+    def jaro_winkler(self) -> JaroWinklerIndex:
+        """
+        Get letter histograms of the vocabulary for Jaro-Winkler search.
+
+        Returns:
+            JaroWinklerIndex: Jaro-Winkler index
+        """
+        if self._jaro_winkler is None:
+            self._jaro_winkler = JaroWinklerIndex(self._vocabulary)
+        return self._jaro_winkler
+
+    @property
+    def qgrams(self) -> QGramIndex:
+        """
+        Get the bigram inverted index of the vocabulary.
+
+        Returns:
+            QGramIndex: Q-gram index
+        """
+        if self._qgrams is None:
+            self._qgrams = QGramIndex(self._vocabulary)
+        return self._qgrams
+
+    @property
+    def deletion_index(self) -> DeletionIndex:
+        """
+        Get the deletion index of the vocabulary for frequency-based search.
+
+        Returns:
+            DeletionIndex: Deletion index
+        """
+        if self._deletions is None:
+            self._deletions = DeletionIndex(self._vocabulary)
+        return self._deletions
+
+    @property
+    def encodings(self) -> dict[str, list[int]]:
+        """
+        Get the vocabulary words encoded for the keyboard cost table.
+
+        The encodings belong to this vocabulary and are freed with it.
+
+        Returns:
+            dict[str, list[int]]: Alphabet indices of every word
+        """
+        if self._encodings is None:
+            self._encodings = KEYBOARD_COSTS.encode_words(self._vocabulary) or {}
+        return self._encodings
+
+    def build(self, method: Method) -> None:
+        """
+        Build the index used by the method in advance.
+
+        Args:
+            method (Method): Method whose corrections are going to be requested
+        """
+        if method == "levenshtein":
+            _ = self.qgrams
+        elif method == "jaro-winkler":
+            _ = self.jaro_winkler
+        elif method == "jaccard":
+            _ = self.signatures
+        elif method == "frequency-based":
+            _ = self.deletion_index
+        elif method == "weighted-levenshtein":
+            _ = self.encodings
+
+    def find_correct_word(
+        self,
+        wrong_word: str,
+        method: Method,
+        alphabet: list[str] | None = None,
+    ) -> str | None:
+        """
+        Find the most similar word with the result of find_correct_word.
+
+        Args:
+            wrong_word (str): Word that might be misspelled
+            method (Method): Method to use for comparison
+            alphabet (list[str]): The alphabet with letters
+
+        Returns:
+            str | None: Word from vocabulary with the lowest distance score.
+
+        In case of corrupt input arguments or empty vocabulary, None is returned.
+        """
+        suggestions = self.suggest(wrong_word, method, 1, alphabet)
+        if not suggestions:
+            return None
+        return suggestions[0]
+
+    def suggest(
+        self,
+        wrong_word: str,
+        method: Method,
+        k: int,
+        alphabet: list[str] | None = None,
+    ) -> list[str] | None:
+        """
+        Find k most similar words with the result of suggest.
+
+        Args:
+            wrong_word (str): Word that might be misspelled
+            method (Method): Method to use for comparison
+            k (int): Number of words to find
+            alphabet (list[str]): The alphabet with letters
+
+        Returns:
+            list[str] | None: Words from vocabulary ordered by distance score,
+                then by closeness in length, then lexicographically.
+
+        In case of corrupt input arguments or empty vocabulary, None is returned.
+        """
+        if not isinstance(wrong_word, str) or not self._vocabulary or not check_positive_int(k):
+            return None
+        if alphabet is not None and not check_list(alphabet, str, True):
+            return None
+        if method == "levenshtein":
+            return self.qgrams.find_nearest_words(wrong_word, k)
+        if method == "jaro-winkler":
+            return self.jaro_winkler.find_nearest_words(wrong_word, k)
+        if method == "jaccard":
+            distances = self.signatures.calculate_distances(wrong_word)
+        elif method == "frequency-based":
+            if alphabet is None:
+                return None
+            distances = self.deletion_index.calculate_frequency_distance(wrong_word, alphabet)
+        elif method == "weighted-levenshtein":
+            distances = KEYBOARD_COSTS.calculate_distances(
+                wrong_word, self._vocabulary, self.encodings
+            )
+        else:
+            return None
+        if not distances:
+            return None
+        return choose_closest_words(wrong_word, distances, k)
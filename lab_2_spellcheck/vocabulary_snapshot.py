@@ -0,0 +1,364 @@
+"""
+Memory-mapped vocabulary snapshots validated by the hash of the source text.
+"""
+
+import json
+import mmap
+import os
+from hashlib import blake2b
+from pathlib import Path
+from types import TracebackType
+
+import numpy as np
+
+from lab_1_keywords_tfidf.main import clean_and_tokenize, remove_stop_words
+from lab_2_spellcheck.main import build_vocabulary
+
+_MAGIC = b"L2VSNAP1"
+_ALIGNMENT = 64
+
+
+def hash_sources(source_path: str | Path, stop_words_path: str | Path | None = None) -> str:
+    """
+    Calculate the content hash of the texts the vocabulary is built from.
+
+    Args:
+        source_path (str | Path): Path to the text
+        stop_words_path (str | Path | None): Path to the stop words
+
+    Returns:
+        str: Hexadecimal digest of the contents
+    """
+    digest = blake2b(digest_size=16)
+    for path in (source_path, stop_words_path):
+        if path is not None:
+            digest.update(Path(path).read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class VocabularySnapshot:
+    """
+    Read-only view of a snapshot file.
+
+    The file starts with a JSON header followed by aligned arrays: UTF-8 words
+    with their offsets, relative frequencies, word lengths, positions of words
+    ordered by length with bucket boundaries, and letter bitmask signatures as
+    ``uint64`` blocks. Arrays are views of a memory map, so opening a snapshot
+    only parses the header; words are decoded on first access to the vocabulary.
+    Once the snapshot is closed, only the header properties can be read.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        Initialize an instance of the VocabularySnapshot.
+
+        Args:
+            path (str | Path): Path to the snapshot file
+        """
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[: len(_MAGIC)] != _MAGIC:
+            self.close()
+            raise ValueError("Not a vocabulary snapshot")
+        header_size = int.from_bytes(self._map[len(_MAGIC) : len(_MAGIC) + 8], "little")
+        start = len(_MAGIC) + 8
+        self._header = json.loads(self._map[start : start + header_size])
+        self._arrays: dict[str, np.ndarray] = {}
+        for name, (dtype, shape, offset) in self._header["arrays"].items():
+            count = int(np.prod(shape))
+            if offset + count * np.dtype(dtype).itemsize > len(self._map):
+                self.close()
+                raise ValueError("Truncated vocabulary snapshot")
+            self._arrays[name] = np.frombuffer(
+                self._map, dtype=dtype, count=count, offset=offset
+            ).reshape(shape)
+        self._words: list[str] | None = None
+        self._closed = False
+
+    def __enter__(self) -> "VocabularySnapshot":
+        """
+        Enter the context of the snapshot.
+
+        Returns:
+            VocabularySnapshot: The snapshot itself
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """
+        Close the memory map.
+
+        Args:
+            exc_type (type[BaseException] | None): Type of the raised exception
+            exc_value (BaseException | None): Raised exception
+            traceback (TracebackType | None): Traceback of the raised exception
+        """
+        self.close()
+
+    @property
+    def source_hash(self) -> str:
+        """
+        Get the hash of the texts the snapshot was built from.
+
+        Returns:
+            str: Hexadecimal digest
+        """
+        return str(self._header["source_hash"])
+
+    @property
+    def letters(self) -> str:
+        """
+        Get letters in the order of signature bits.
+
+        Returns:
+            str: Sorted letters of the vocabulary
+        """
+        return str(self._header["letters"])
+
+    @property
+    def words(self) -> list[str]:
+        """
+        Get vocabulary words in the order of the arrays.
+
+        Returns:
+            list[str]: Vocabulary words
+
+        Raises:
+            ValueError: If the snapshot is closed
+        """
+        self._check_open()
+        if self._words is None:
+            data = self._arrays["word_data"].tobytes()
+            offsets = self._arrays["word_offsets"].tolist()
+            self._words = [
+                data[start:end].decode("utf-8") for start, end in zip(offsets, offsets[1:])
+            ]
+        return self._words
+
+    @property
+    def vocabulary(self) -> dict[str, float]:
+        """
+        Get words and their relative frequencies.
+
+        Returns:
+            dict[str, float]: Vocabulary as built by build_vocabulary
+
+        Raises:
+            ValueError: If the snapshot is closed
+        """
+        return dict(zip(self.words, self._arrays["frequencies"].tolist()))
+
+    @property
+    def frequencies(self) -> np.ndarray:
+        """
+        Get relative frequencies aligned with the words.
+
+        Returns:
+            np.ndarray: Relative frequencies
+
+        Raises:
+            ValueError: If the snapshot is closed
+        """
+        self._check_open()
+        return self._arrays["frequencies"]
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """
+        Get lengths of the words.
+
+        Returns:
+            np.ndarray: Word lengths
+
+        Raises:
+            ValueError: If the snapshot is closed
+        """
+        self._check_open()
+        return self._arrays["lengths"]
+
+    @property
+    def signatures(self) -> np.ndarray:
+        """
+        Get letter bitmasks of the words.
+
+        Bit ``i`` of block ``i // 64`` is set when the word contains ``letters[i]``.
+
+        Returns:
+            np.ndarray: Matrix of ``uint64`` blocks, one row per word
+
+        Raises:
+            ValueError: If the snapshot is closed
+        """
+        self._check_open()
+        return self._arrays["signatures"]
+
+    def get_words_of_length(self, length: int) -> list[str]:
+        """
+        Get the length bucket of the vocabulary.
+
+        Args:
+            length (int): Length of words
+
+        Returns:
+            list[str]: Words of the length
+
+        Raises:
+            ValueError: If the snapshot is closed
+        """
+        self._check_open()
+        starts = self._arrays["bucket_starts"]
+        if not isinstance(length, int) or not 0 <= length < len(starts) - 1:
+            return []
+        positions = self._arrays["length_order"][starts[length] : starts[length + 1]]
+        words = self.words
+        return [words[position] for position in positions.tolist()]
+
+    def close(self) -> None:
+        """
+        Release the arrays and close the memory map.
+
+        Afterwards the words, the vocabulary, the arrays and the length buckets
+        raise ValueError, while the source hash and the letters stay readable.
+        Arrays obtained before are views of the map and remain valid: while a
+        caller still holds one, the map cannot be closed; it is then unmapped
+        when the last view is released.
+        """
+        self._closed = True
+        self._arrays = {}
+        self._words = None
+        if not self._map.closed:
+            try:
+                self._map.close()
+            except BufferError:
+                pass
+
+    def _check_open(self) -> None:
+        """
+        Check that the arrays of the snapshot can still be read.
+
+        Raises:
+            ValueError: If the snapshot is closed
+        """
+        if self._closed:
+            raise ValueError("Vocabulary snapshot is closed")
+
+
+def write_snapshot(path: str | Path, vocabulary: dict[str, float], source_hash: str) -> None:
+    """
+    Save the vocabulary with its lookup data into a snapshot file.
+
+    The file is written next to the target and then renamed, so readers never
+    see a partially written snapshot.
+
+    Args:
+        path (str | Path): Path to the snapshot file
+        vocabulary (dict[str, float]): Dictionary with words and their relative frequencies
+        source_hash (str): Hash of the texts the vocabulary is built from
+    """
+    arrays, letters = _build_arrays(vocabulary)
+    header: dict = {"source_hash": source_hash, "letters": letters, "arrays": {}}
+    header_size = 4096
+    while True:
+        offset = _align(len(_MAGIC) + 8 + header_size)
+        for name, array in arrays.items():
+            header["arrays"][name] = (array.dtype.str, list(array.shape), offset)
+            offset = _align(offset + array.nbytes)
+        encoded_header = json.dumps(header, ensure_ascii=False).encode("utf-8")
+        if len(encoded_header) <= header_size:
+            break
+        header_size = len(encoded_header)
+    temporary_path = Path(f"{path}.tmp")
+    with open(temporary_path, "wb") as file:
+        file.write(_MAGIC + header_size.to_bytes(8, "little"))
+        file.write(encoded_header.ljust(header_size))
+        for name, array in arrays.items():
+            file.seek(header["arrays"][name][2])
+            file.write(array.tobytes())
+        file.truncate(offset)
+    os.replace(temporary_path, path)
+
+
+def load_snapshot(
+    snapshot_path: str | Path,
+    source_path: str | Path,
+    stop_words_path: str | Path | None = None,
+) -> VocabularySnapshot:
+    """
+    Open the snapshot of the source text, rebuilding it if the source changed.
+
+    Args:
+        snapshot_path (str | Path): Path to the snapshot file
+        source_path (str | Path): Path to the text the vocabulary is built from
+        stop_words_path (str | Path | None): Path to the stop words removed from the text
+
+    Returns:
+        VocabularySnapshot: Snapshot matching the current source
+    """
+    source_hash = hash_sources(source_path, stop_words_path)
+    try:
+        snapshot = VocabularySnapshot(snapshot_path)
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    else:
+        if snapshot.source_hash == source_hash:
+            return snapshot
+        snapshot.close()
+    with open(source_path, "r", encoding="utf-8") as file:
+        tokens = clean_and_tokenize(file.read()) or []
+    if stop_words_path is not None:
+        with open(stop_words_path, "r", encoding="utf-8") as file:
+            tokens = remove_stop_words(tokens, file.read().split("\n")) or []
+    write_snapshot(snapshot_path, build_vocabulary(tokens) or {}, source_hash)
+    return VocabularySnapshot(snapshot_path)
+
+
+def _align(offset: int) -> int:
+    """
+    Round an offset up to the array alignment.
+
+    Args:
+        offset (int): Offset in bytes
+
+    Returns:
+        int: Aligned offset
+    """
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _build_arrays(vocabulary: dict[str, float]) -> tuple[dict[str, np.ndarray], str]:
+    """
+    Prepare arrays of the snapshot.
+
+    Args:
+        vocabulary (dict[str, float]): Dictionary with words and their relative frequencies
+
+    Returns:
+        tuple[dict[str, np.ndarray], str]: Arrays by name and letters in the order
+            of signature bits
+    """
+    words = list(vocabulary)
+    encoded = [word.encode("utf-8") for word in words]
+    lengths = np.array([len(word) for word in words], dtype=np.int32)
+    letters = sorted({letter for word in words for letter in word})
+    bits = {letter: index for index, letter in enumerate(letters)}
+    signatures = np.zeros((len(words), max(1, -(-len(letters) // 64))), dtype=np.uint64)
+    for position, word in enumerate(words):
+        for letter in set(word):
+            signatures[position, bits[letter] // 64] |= np.uint64(1 << (bits[letter] % 64))
+    return {
+        "word_data": np.frombuffer(b"".join(encoded), dtype=np.uint8),
+        "word_offsets": np.cumsum([0] + [len(word) for word in encoded], dtype=np.int64),
+        "frequencies": np.array([vocabulary[word] for word in words], dtype=np.float64),
+        "lengths": lengths,
+        "length_order": np.argsort(lengths, kind="stable").astype(np.int32),
+        "bucket_starts": np.searchsorted(
+            np.sort(lengths), np.arange(int(lengths.max()) + 2 if words else 1)
+        ).astype(np.int64),
+        "signatures": signatures,
+    }, "".join(letters)
@@ -0,0 +1,369 @@
+"""
+Character trie of the vocabulary for candidate generation.
+"""
+
+from bisect import insort
+from typing import Iterator
+
+from lab_1_keywords_tfidf.main import check_dict, check_list, check_positive_int
+from lab_2_spellcheck.main import check_non_negative_int
+
+
+class TrieNode:  # pylint: disable=too-few-public-methods
+    """
+    Node of the character trie.
+    """
+
+    __slots__ = ("children", "word")
+
+    def __init__(self) -> None:
+        """
+        Initialize an instance of the TrieNode.
+        """
+        self.children: dict[str, TrieNode] = {}
+        self.word: str | None = None
+
+
+class VocabularyTrie:
+    """
+    Character trie of vocabulary words.
+
+    Edits of a misspelled word are applied while walking the trie, so only
+    strings that are vocabulary words are ever produced: a branch is abandoned
+    as soon as the edited prefix leaves the trie.
+    """
+
+    def __init__(self, vocabulary: dict[str, float]) -> None:
+        """
+        Initialize an instance of the VocabularyTrie.
+
+        Args:
+            vocabulary (dict[str, float]): Dictionary with words and their relative frequencies
+        """
+        self._root = TrieNode()
+        self._vocabulary: dict[str, float] = {}
+        self._statistics = {"searches": 0, "visited": 0}
+        if not check_dict(vocabulary, str, float, False):
+            return
+        self._vocabulary = dict(vocabulary)
+        for word in vocabulary:
+            node = self._root
+            for letter in word:
+                node = node.children.setdefault(letter, TrieNode())
+            node.word = word
+
+    @property
+    def root(self) -> TrieNode:
+        """
+        Get the root node of the trie.
+
+        Returns:
+            TrieNode: Node of the empty prefix
+        """
+        return self._root
+
+    @property
+    def statistics(self) -> dict[str, int]:
+        """
+        Get search counters.
+
+        Returns:
+            dict[str, int]: Numbers of searches and trie nodes visited
+                by the Levenshtein walk
+        """
+        return dict(self._statistics)
+
+    def add_word(self, word: str, frequency: float) -> None:
+        """
+        Insert a word or update its frequency.
+
+        Args:
+            word (str): Word to insert
+            frequency (float): Relative frequency of the word
+        """
+        if not isinstance(word, str) or not isinstance(frequency, float):
+            return
+        node = self._root
+        for letter in word:
+            node = node.children.setdefault(letter, TrieNode())
+        node.word = word
+        self._vocabulary[word] = frequency
+
+    def remove_word(self, word: str) -> None:
+        """
+        Delete a word and the nodes left without words below them.
+
+        Args:
+            word (str): Word to delete
+        """
+        if word not in self._vocabulary:
+            return
+        del self._vocabulary[word]
+        path = [self._root]
+        for letter in word:
+            path.append(path[-1].children[letter])
+        path[-1].word = None
+        for index in range(len(word), 0, -1):
+            node = path[index]
+            if node.word is not None or node.children:
+                break
+            del path[index - 1].children[word[index - 1]]
+
+    def iterate_candidates(self, word: str, alphabet: list[str]) -> Iterator[str]:
+        """
+        Lazily generate vocabulary words reachable with propose_candidates edits.
+
+        Candidates are the words obtained by one or two consecutive edits
+        (deletion, insertion, replacement, swap of adjacent letters) of the word.
+        The edits are applied while walking the trie with a budget of two, so
+        an edited prefix that leaves the trie is abandoned before the rest of
+        the string is built, and first-level edits are never produced as strings.
+
+        Args:
+            word (str): The input incorrect word
+            alphabet (list[str]): Alphabet with single letters for candidates creation
+
+        Yields:
+            str: Unique vocabulary words in no particular order
+        """
+        if not isinstance(word, str) or not check_list(alphabet, str, True):
+            return
+        letters = set(alphabet)
+        seen = set() if letters or len(word) > 1 else {word}
+        for candidate in _walk_edits(self._root, word, 2, letters):
+            if candidate not in seen:
+                seen.add(candidate)
+                yield candidate
+
+    def propose_candidates(self, word: str, alphabet: list[str]) -> tuple[str, ...] | None:
+        """
+        Generate vocabulary words among the candidates of propose_candidates.
+
+        Args:
+            word (str): The input incorrect word
+            alphabet (list[str]): Alphabet with single letters for candidates creation
+
+        Returns:
+            tuple[str, ...] | None: Sorted vocabulary words.
+
+        In case of corrupt input arguments or empty vocabulary, None is returned.
+        """
+        if not isinstance(word, str) or not check_list(alphabet, str, True):
+            return None
+        if not self._vocabulary:
+            return None
+        return tuple(sorted(self.iterate_candidates(word, alphabet)))
+
+    def calculate_frequency_distance(
+        self, word: str, alphabet: list[str]
+    ) -> dict[str, float] | None:
+        """
+        Calculate frequency distance with the result of calculate_frequency_distance.
+
+        Args:
+            word (str): The input incorrect word
+            alphabet (list[str]): Alphabet with single letters for candidates creation
+
+        Returns:
+            dict[str, float] | None: Vocabulary words and their frequency distances.
+
+        In case of corrupt input arguments or empty vocabulary, None is returned.
+        """
+        candidates = self.propose_candidates(word, alphabet)
+        if candidates is None:
+            return None
+        distances = {token: 1.0 for token in self._vocabulary}
+        for candidate in candidates:
+            distances[candidate] = self._vocabulary[candidate]
+        return distances
+
+    def find_nearest_words(
+        self, token: str, k: int, max_distance: int | None = None
+    ) -> list[str] | None:
+        """
+        Find k vocabulary words with the lowest Levenshtein distance to the token.
+
+        The trie is traversed depth-first with one Wagner-Fischer row per trie
+        depth, so rows of a shared prefix are computed once for all words below it.
+        A subtree is skipped when the minimum of its row exceeds the distance of
+        the current k-th best word or max_distance.
+
+        Args:
+            token (str): Word that might be misspelled
+            k (int): Number of words to find
+            max_distance (int | None): Largest allowed distance
+
+        Returns:
+            list[str] | None: Words ordered by distance, then by closeness in length,
+                then lexicographically.
+
+        In case of corrupt input arguments or empty vocabulary, None is returned.
+        """
+        if (
+            not isinstance(token, str)
+            or not check_positive_int(k)
+            or not (max_distance is None or check_non_negative_int(max_distance))
+            or not self._vocabulary
+        ):
+            return None
+        best: list[tuple[int, int, str]] = []
+        query = (token, k, max_distance)
+        if self._root.word is not None:
+            _collect(best, query, len(token), self._root.word)
+        row = list(range(len(token) + 1))
+        visited = 1
+        for letter, child in self._root.children.items():
+            visited += _search(child, letter, row, best, query)
+        self._statistics["searches"] += 1
+        self._statistics["visited"] += visited
+        return [word for _, _, word in best]
+
+    def find_nearest_word(self, token: str, max_distance: int | None = None) -> str | None:
+        """
+        Find the vocabulary word with the lowest Levenshtein distance to the token.
+
+        Args:
+            token (str): Word that might be misspelled
+            max_distance (int | None): Largest allowed distance
+
+        Returns:
+            str | None: Word with the tie-break rules of find_correct_word.
+
+        In case of corrupt input arguments, empty vocabulary or no word within
+        max_distance, None is returned.
+        """
+        nearest = self.find_nearest_words(token, 1, max_distance)
+        if not nearest:
+            return None
+        return nearest[0]
+
+
+def _walk_edits(node: TrieNode, pending: str, budget: int, letters: set[str]) -> Iterator[str]:
+    """
+    Walk the trie along a string spending at most budget edits on it.
+
+    Edits are applied to the head of the pending string, either before its
+    first letter is matched against a child of the node or on the string
+    itself, so a later edit can act on the result of an earlier one. A swap
+    that follows a deletion or a swap of the next two letters is applied at
+    once, as the second edit would otherwise start to the left of the first.
+    Without budget the rest of the string is looked up as it is.
+
+    Args:
+        node (TrieNode): Node of the letters walked so far
+        pending (str): Letters left to walk
+        budget (int): Number of edits left
+        letters (set[str]): Letters allowed for insertion and replacement
+
+    Yields:
+        str: Vocabulary words, possibly repeated, including the unedited string
+    """
+    if not budget:
+        found = _find_suffix(node, pending)
+        if found is not None:
+            yield found
+        return
+    if not pending and node.word is not None:
+        yield node.word
+    for letter, child in node.children.items():
+        if letter in letters:
+            yield from _walk_edits(child, pending, budget - 1, letters)
+            if pending:
+                yield from _walk_edits(child, pending[1:], budget - 1, letters)
+    if not pending:
+        return
+    if budget > 1 or len(pending) == 1 or pending[1] in node.children:
+        yield from _walk_edits(node, pending[1:], budget - 1, letters)
+    if len(pending) > 1 and (budget > 1 or pending[1] in node.children):
+        yield from _walk_edits(node, pending[1] + pending[0] + pending[2:], budget - 1, letters)
+    if len(pending) > 2 and budget > 1 and (budget > 2 or pending[2] in node.children):
+        yield from _walk_edits(node, pending[2] + pending[0] + pending[3:], budget - 2, letters)
+        yield from _walk_edits(
+            node, pending[2] + pending[0] + pending[1] + pending[3:], budget - 2, letters
+        )
+    matched = node.children.get(pending[0])
+    if matched is not None:
+        yield from _walk_edits(matched, pending[1:], budget, letters)
+
+
+def _search(
+    node: TrieNode,
+    letter: str,
+    previous_row: list[int],
+    best: list[tuple[int, int, str]],
+    query: tuple[str, int, int | None],
+) -> int:
+    """
+    Fill the Levenshtein row of the node and descend into its children.
+
+    Args:
+        node (TrieNode): Current trie node
+        letter (str): Letter leading to the node
+        previous_row (list[int]): Row of the parent node
+        best (list[tuple[int, int, str]]): Sorted best words found so far
+        query (tuple[str, int, int | None]): Token, number of words to find and largest distance
+
+    Returns:
+        int: Number of visited nodes of the subtree
+    """
+    token, k, max_distance = query
+    row = [previous_row[0] + 1]
+    for index, token_letter in enumerate(token, start=1):
+        row.append(
+            min(
+                row[index - 1] + 1,
+                previous_row[index] + 1,
+                previous_row[index - 1] + (token_letter != letter),
+            )
+        )
+    if node.word is not None:
+        _collect(best, query, row[-1], node.word)
+    bound = best[-1][0] if len(best) == k else max_distance
+    if bound is not None and min(row) > bound:
+        return 1
+    visited = 1
+    for child_letter, child in node.children.items():
+        visited += _search(child, child_letter, row, best, query)
+    return visited
+
+
+def _collect(
+    best: list[tuple[int, int, str]],
+    query: tuple[str, int, int | None],
+    distance: int,
+    word: str,
+) -> None:
+    """
+    Keep the word if it is among the k best ones.
+
+    Args:
+        best (list[tuple[int, int, str]]): Sorted best words found so far
+        query (tuple[str, int, int | None]): Token, number of words to find and largest distance
+        distance (int): Levenshtein distance to the word
+        word (str): Vocabulary word
+    """
+    token, k, max_distance = query
+    if max_distance is not None and distance > max_distance:
+        return
+    insort(best, (distance, abs(len(word) - len(token)), word))
+    if len(best) > k:
+        best.pop()
+
+
+def _find_suffix(node: TrieNode, suffix: str) -> str | None:
+    """
+    Walk the trie from the node along the suffix.
+
+    Args:
+        node (TrieNode): Node to start from
+        suffix (str): Letters to follow
+
+    Returns:
+        str | None: Vocabulary word at the end of the walk, None if there is no such word
+    """
+    current: TrieNode | None = node
+    for letter in suffix:
+        current = current.children.get(letter)
+        if current is None:
+            return None
+    return current.word
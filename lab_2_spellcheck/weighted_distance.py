@@ -0,0 +1,277 @@
+"""
+Weighted Damerau-Levenshtein distance over precompiled cost tables.
+"""
+
+from typing import Iterable, Mapping
+
+from lab_1_keywords_tfidf.main import check_list
+
+KEYBOARD_ROWS = (
+    ("йцукенгшщзхъ", "фывапролджэ", "ячсмитьбю"),
+    ("qwertyuiop", "asdfghjkl", "zxcvbnm"),
+)
+ADJACENT_KEY_COST = 0.5
+YO_COST = 0.1
+
+
+class CostTable:
+    """
+    Edit costs compiled into 2-D tables over alphabet indices.
+
+    Letters of the alphabet get indices from 0, all other characters share
+    the last index, whose costs are the default ones. Substitution and
+    transposition costs are stored as a row per letter index, so the distance
+    loop reads a cost with two list lookups. Tokens are encoded into index
+    lists once per query. The table keeps no state between calls, so the
+    encodings of vocabulary words are owned by the caller, who builds them
+    with encode_words and passes them to calculate_distances. Equal
+    characters are never charged.
+    """
+
+    def __init__(
+        self,
+        alphabet: list[str],
+        substitutions: dict[tuple[str, str], float] | None = None,
+        transpositions: dict[tuple[str, str], float] | None = None,
+        indel_cost: float = 1.0,
+    ) -> None:
+        """
+        Initialize an instance of the CostTable.
+
+        Args:
+            alphabet (list[str]): Letters with their own costs
+            substitutions (dict[tuple[str, str], float] | None): Costs of replacing
+                one letter with the other in both directions, 1.0 for other pairs
+            transpositions (dict[tuple[str, str], float] | None): Costs of swapping
+                adjacent letters in both orders, 1.0 for other pairs
+            indel_cost (float): Cost of inserting or deleting a character
+        """
+        letters = alphabet if check_list(alphabet, str, True) else []
+        self._codes = {letter: index for index, letter in enumerate(dict.fromkeys(letters))}
+        self._indel_cost = indel_cost if isinstance(indel_cost, float) else 1.0
+        self._substitutions = self._compile(substitutions)
+        self._transpositions = self._compile(transpositions)
+
+    @property
+    def alphabet(self) -> list[str]:
+        """
+        Get the letters with their own costs.
+
+        Returns:
+            list[str]: Letters in the order of their indices
+        """
+        return list(self._codes)
+
+    def get_substitution_cost(self, letter: str, other: str) -> float | None:
+        """
+        Look up the cost of replacing a character.
+
+        Args:
+            letter (str): Replaced character
+            other (str): Replacing character
+
+        Returns:
+            float | None: Cost of the substitution, 0.0 for equal characters.
+
+        In case of corrupt input arguments, e.g. strings that are not single
+        characters, None is returned.
+        """
+        if not isinstance(letter, str) or not isinstance(other, str):
+            return None
+        if len(letter) != 1 or len(other) != 1:
+            return None
+        if letter == other:
+            return 0.0
+        first, second = self.encode(letter + other)
+        return self._substitutions[first][second]
+
+    def encode(self, word: str) -> list[int]:
+        """
+        Encode a string as alphabet indices.
+
+        Args:
+            word (str): String to encode
+
+        Returns:
+            list[int]: Index of every character, the last index for characters
+                outside the alphabet
+        """
+        other = len(self._codes)
+        return [self._codes.get(letter, other) for letter in word]
+
+    def encode_words(self, words: Iterable[str]) -> dict[str, list[int]] | None:
+        """
+        Encode words as alphabet indices for calculate_distances.
+
+        Args:
+            words (Iterable[str]): Words to encode, e.g. keys of a vocabulary
+
+        Returns:
+            dict[str, list[int]] | None: Encoding of every word.
+
+        In case of corrupt input arguments, None is returned.
+        """
+        if not isinstance(words, Iterable) or isinstance(words, str):
+            return None
+        encodings = {}
+        for word in words:
+            if not isinstance(word, str):
+                return None
+            encodings[word] = self.encode(word)
+        return encodings
+
+    def calculate_distance(self, token: str, candidate: str) -> float | None:
+        """
+        Calculate the weighted distance between two strings.
+
+        The distance is the cheapest sequence of insertions, deletions,
+        substitutions and swaps of adjacent letters, each substring being
+        edited at most once, as in the optimal string alignment distance.
+
+        Args:
+            token (str): First string
+            candidate (str): Second string
+
+        Returns:
+            float | None: Weighted edit distance.
+
+        In case of corrupt input arguments, None is returned.
+        """
+        if not isinstance(token, str) or not isinstance(candidate, str):
+            return None
+        return self._fill(token, self.encode(token), candidate, self.encode(candidate))
+
+    def calculate_distances(
+        self,
+        token: str,
+        vocabulary: Mapping[str, float],
+        encodings: dict[str, list[int]] | None = None,
+    ) -> dict[str, float] | None:
+        """
+        Calculate weighted distances from the token to all vocabulary words.
+
+        Args:
+            token (str): Word that might be misspelled
+            vocabulary (Mapping[str, float]): Words mapped to their relative frequencies
+            encodings (dict[str, list[int]] | None): Result of encode_words for the
+                vocabulary, words missing from it are encoded on the fly
+
+        Returns:
+            dict[str, float] | None: Vocabulary words and distances to them.
+
+        In case of corrupt input arguments or empty vocabulary, None is returned.
+        """
+        if not isinstance(token, str) or not isinstance(vocabulary, Mapping) or not vocabulary:
+            return None
+        if encodings is not None and not isinstance(encodings, dict):
+            return None
+        codes = self.encode(token)
+        known = encodings or {}
+        distances = {}
+        for word in vocabulary:
+            if not isinstance(word, str):
+                return None
+            word_codes = known.get(word)
+            if word_codes is None:
+                word_codes = self.encode(word)
+            distances[word] = self._fill(token, codes, word, word_codes)
+        return distances
+
+    def _compile(self, costs: dict[tuple[str, str], float] | None) -> list[list[float]]:
+        """
+        Build a symmetric cost table over alphabet indices.
+
+        Args:
+            costs (dict[tuple[str, str], float] | None): Costs of letter pairs
+
+        Returns:
+            list[list[float]]: Row of costs for every index, 1.0 for unlisted pairs
+        """
+        size = len(self._codes) + 1
+        table = [[1.0] * size for _ in range(size)]
+        for (letter, other), cost in (costs or {}).items():
+            if letter in self._codes and other in self._codes and isinstance(cost, float):
+                table[self._codes[letter]][self._codes[other]] = cost
+                table[self._codes[other]][self._codes[letter]] = cost
+        return table
+
+    def _fill(
+        self, token: str, token_codes: list[int], candidate: str, candidate_codes: list[int]
+    ) -> float:
+        """
+        Fill the weighted distance rows of two encoded strings.
+
+        Args:
+            token (str): First string
+            token_codes (list[int]): Alphabet indices of the first string
+            candidate (str): Second string
+            candidate_codes (list[int]): Alphabet indices of the second string
+
+        Returns:
+            float: Weighted edit distance
+        """
+        indel = self._indel_cost
+        before: list[float] = []
+        previous = [index * indel for index in range(len(candidate) + 1)]
+        for i, letter in enumerate(token, start=1):
+            substitutions = self._substitutions[token_codes[i - 1]]
+            current = [i * indel]
+            for j, other in enumerate(candidate, start=1):
+                if letter == other:
+                    cost = previous[j - 1]
+                else:
+                    cost = previous[j - 1] + substitutions[candidate_codes[j - 1]]
+                    if i > 1 and j > 1 and letter == candidate[j - 2] and token[i - 2] == other:
+                        cost = min(
+                            cost,
+                            before[j - 2]
+                            + self._transpositions[token_codes[i - 2]][token_codes[i - 1]],
+                        )
+                cost = min(cost, previous[j] + indel, current[j - 1] + indel)
+                current.append(cost)
+            before, previous = previous, current
+        return previous[-1]
+
+
+def build_keyboard_costs() -> CostTable:
+    """
+    Build costs of typical typos on Russian and English keyboards.
+
+    Replacing a letter with a neighbouring key in the same row or in the
+    adjacent rows costs ADJACENT_KEY_COST, replacing ``е`` with ``ё`` costs
+    YO_COST, other edits cost 1.0.
+
+    Returns:
+        CostTable: Costs over the letters of both layouts
+    """
+    alphabet = []
+    substitutions = {("е", "ё"): YO_COST}
+    for rows in KEYBOARD_ROWS:
+        alphabet.extend("".join(rows))
+        for row_index, row in enumerate(rows):
+            for column, letter in enumerate(row):
+                neighbours = list(row[column + 1 : column + 2])
+                if row_index + 1 < len(rows):
+                    neighbours.extend(rows[row_index + 1][max(column - 1, 0) : column + 1])
+                for neighbour in neighbours:
+                    substitutions[(letter, neighbour)] = ADJACENT_KEY_COST
+    return CostTable(alphabet + ["ё"], substitutions)
+
+
+KEYBOARD_COSTS = build_keyboard_costs()
+
+
+def calculate_weighted_distance(token: str, candidate: str) -> float | None:
+    """
+    Calculate the weighted distance with the keyboard costs.
+
+    Args:
+        token (str): First string
+        candidate (str): Second string
+
+    Returns:
+        float | None: Weighted edit distance.
+
+    In case of corrupt input arguments, None is returned.
+    """
+    return KEYBOARD_COSTS.calculate_distance(token, candidate)